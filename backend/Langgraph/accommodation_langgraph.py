@@ -1,6 +1,8 @@
 """Accommodation LangGraph Orchestrator - ReAct Agent"""
+from typing import Optional
 from langgraph.prebuilt import create_react_agent
-from langchain_openai import ChatOpenAI
+from agents.utils.place_format import format_place_list
+from agents.utils.llm_registry import get_chat_model
 import os
 from dotenv import load_dotenv
 
@@ -8,7 +10,7 @@ load_dotenv()
 
 # LLM을 함수로 변경 (lazy initialization)
 def get_llm():
-    return ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    return get_chat_model("gpt-4o-mini", temperature=0, purpose="accommodation_graph")
 
 # Accommodation Tools import
 from agents.tool.accommodation_tools import (
@@ -70,6 +72,56 @@ class AccommodationGraphWrapper:
         return {
             "final_response": final_message
         }
+    
+    def run_direct(
+        self,
+        region: str,
+        preference: Optional[str] = None,
+        min_rating: Optional[float] = None,
+        price_level: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        num_results: int = 5
+    ) -> dict:
+        """
+        ReAct Agent 없이 search_accommodations 바로 호출 + 결과 직접 포맷 (LLM 호출 0회)
+        
+        Returns:
+            {"final_response": str}
+        """
+        args = {
+            "region": region,
+            "preference": preference,
+            "min_rating": min_rating,
+            "price_level": price_level,
+            "sort_by": sort_by,
+            "num_results": num_results
+        }
+        result = search_accommodations.invoke({k: v for k, v in args.items() if v is not None})
+        
+        if not result.get("success") or not result.get("data"):
+            return {"final_response": f"❌ {result.get('message') or '숙소를 찾지 못했어요'}"}
+        
+        title = f"🏨 **{region} {preference}** 추천드려요!" if preference else f"🏨 **{region} 숙소** 추천드려요!"
+        return {
+            "final_response": format_place_list(title, result["data"], limit=num_results)
+        }
+    
+    async def ainvoke(self, state: dict) -> dict:
+        """invoke 비동기 버전 (LLM 호출은 await, 동기 툴은 LangGraph 가 스레드에서 실행)"""
+        user_input = state.get("user_input", "")
+        
+        result = await _accommodation_react_agent.ainvoke({
+            "messages": [("user", user_input)]
+        })
+        
+        return {
+            "final_response": result["messages"][-1].content
+        }
+    
+    async def arun_direct(self, **kwargs) -> dict:
+        """run_direct 비동기 버전 (googlemaps 는 동기 클라이언트라 coordinator_pool 의 제한된 스레드에서)"""
+        from core.turn_pool import coordinator_pool
+        return await coordinator_pool.run_blocking(self.run_direct, **kwargs)
 
 # Export
 accommodation_graph = AccommodationGraphWrapper()
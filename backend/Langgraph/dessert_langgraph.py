@@ -1,6 +1,8 @@
 """Dessert/Cafe LangGraph Orchestrator - ReAct Agent"""
+from typing import Optional
 from langgraph.prebuilt import create_react_agent
-from langchain_openai import ChatOpenAI
+from agents.utils.place_format import format_place_list
+from agents.utils.llm_registry import get_chat_model
 import os
 from dotenv import load_dotenv
 
@@ -8,7 +10,7 @@ load_dotenv()
 
 # LLM을 함수로 변경 (lazy initialization)
 def get_llm():
-    return ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    return get_chat_model("gpt-4o-mini", temperature=0, purpose="dessert_graph")
 
 # Dessert Tools import
 from agents.tool.dessert_tool import (
@@ -70,6 +72,44 @@ class DessertGraphWrapper:
         return {
             "final_response": final_message
         }
+    
+    def run_direct(self, region: str, keyword: Optional[str] = None, num_results: int = 5) -> dict:
+        """
+        ReAct Agent 없이 카페 검색 함수 바로 호출 + 결과 직접 포맷 (LLM 호출 0회)
+        
+        Returns:
+            {"final_response": str}
+        """
+        from agents.dessert_agent import search_desserts_integrated
+        
+        keyword = keyword or "카페"
+        result = search_desserts_integrated(region, keyword, num_results=min(num_results, 10))
+        
+        if not result.success or result.count == 0:
+            return {"final_response": f"❌ {result.message or '카페를 찾지 못했어요'}"}
+        
+        return {
+            "final_response": format_place_list(
+                f"☕ **{region} {keyword}** 추천드려요!", result.data, limit=num_results
+            )
+        }
+    
+    async def ainvoke(self, state: dict) -> dict:
+        """invoke 비동기 버전 (LLM 호출은 await, 동기 툴은 LangGraph 가 스레드에서 실행)"""
+        user_input = state.get("user_input", "")
+        
+        result = await _dessert_react_agent.ainvoke({
+            "messages": [("user", user_input)]
+        })
+        
+        return {
+            "final_response": result["messages"][-1].content
+        }
+    
+    async def arun_direct(self, **kwargs) -> dict:
+        """run_direct 비동기 버전 (googlemaps 는 동기 클라이언트라 coordinator_pool 의 제한된 스레드에서)"""
+        from core.turn_pool import coordinator_pool
+        return await coordinator_pool.run_blocking(self.run_direct, **kwargs)
 
 # Export
 dessert_graph = DessertGraphWrapper()
@@ -1,6 +1,8 @@
 """Landmark LangGraph Orchestrator - ReAct Agent"""
+from typing import Optional
 from langgraph.prebuilt import create_react_agent
-from langchain_openai import ChatOpenAI
+from agents.utils.place_format import format_place_list
+from agents.utils.llm_registry import get_chat_model
 import os
 from dotenv import load_dotenv
 
@@ -8,7 +10,7 @@ load_dotenv()
 
 # LLM을 함수로 변경 (lazy initialization)
 def get_llm():
-    return ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    return get_chat_model("gpt-4o-mini", temperature=0, purpose="landmark_graph")
 
 # Landmark Agent 함수들을 Tool로 변환
 from langchain.tools import tool
@@ -133,6 +135,50 @@ class LandmarkGraphWrapper:
         return {
             "final_response": final_message
         }
+    
+    def run_direct(
+        self,
+        region: str,
+        preference: Optional[str] = None,
+        category: Optional[str] = None,
+        num_results: int = 5
+    ) -> dict:
+        """
+        ReAct Agent 없이 search_landmarks 바로 호출 + 결과 직접 포맷 (LLM 호출 0회)
+        
+        Args:
+            category: 테마파크/박물관/미술관/아쿠아리움/문화재/자연/야경/실내
+        Returns:
+            {"final_response": str}
+        """
+        result = search_landmarks(region, preference=preference, category=category)
+        
+        if not result.success or not result.data:
+            return {"final_response": f"❌ {result.message or '관광지를 찾지 못했어요'}"}
+        
+        label = category or preference or "관광지"
+        return {
+            "final_response": format_place_list(
+                f"🏛️ **{region} {label}** 추천드려요!", result.data, limit=num_results
+            )
+        }
+    
+    async def ainvoke(self, state: dict) -> dict:
+        """invoke 비동기 버전 (LLM 호출은 await, 동기 툴은 LangGraph 가 스레드에서 실행)"""
+        user_input = state.get("user_input", "")
+        
+        result = await _landmark_react_agent.ainvoke({
+            "messages": [("user", user_input)]
+        })
+        
+        return {
+            "final_response": result["messages"][-1].content
+        }
+    
+    async def arun_direct(self, **kwargs) -> dict:
+        """run_direct 비동기 버전 (googlemaps 는 동기 클라이언트라 coordinator_pool 의 제한된 스레드에서)"""
+        from core.turn_pool import coordinator_pool
+        return await coordinator_pool.run_blocking(self.run_direct, **kwargs)
 
 # Export
 landmark_graph = LandmarkGraphWrapper()
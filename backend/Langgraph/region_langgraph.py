@@ -1,7 +1,9 @@
 """Region LangGraph Orchestrator"""
 from typing import TypedDict, Literal, Optional
 from langgraph.graph import StateGraph, END
-from langchain_openai import ChatOpenAI
+from agents.utils.llm_registry import get_chat_model
+from agents.utils.llm_cache import cached_structured_call
+from pydantic import BaseModel, Field
 import os
 from dotenv import load_dotenv
 
@@ -9,7 +11,7 @@ load_dotenv()
 
 # LLM을 함수로 변경 (lazy initialization)
 def get_llm():
-    return ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    return get_chat_model("gpt-4o-mini", temperature=0, purpose="region_graph")
 
 
 class RegionState(TypedDict):
@@ -18,13 +20,25 @@ class RegionState(TypedDict):
     intent: str  # "recommend", "attraction", "best_time", "popular"
     destination: Optional[str]
     travel_style: Optional[str]
+    season: Optional[str]
     result: dict
     final_response: str
 
 
+class RegionQuery(BaseModel):
+    """classify 노드 구조화 출력 (의도 + 목적지 + 스타일 + 계절을 한 번에)"""
+    intent: Literal["recommend", "attraction", "best_time", "popular"] = Field(
+        description="recommend: 특정 도시의 세부 지역 추천 / attraction: 특정 지역 명소 / "
+                    "best_time: 특정 지역 최적 방문 시기 / popular: 한국 유명 여행지 추천"
+    )
+    destination: Optional[str] = Field(None, description="목적지 (예: 부산, 제주도, 춘천, 강릉). 없으면 null")
+    travel_style: Optional[str] = Field(None, description="여행 스타일 (힐링, 액티비티, 맛집투어, 문화체험 중 하나). 없으면 null")
+    season: Optional[str] = Field(None, description="계절 (봄, 여름, 가을, 겨울 중 하나). 없으면 null")
+
+
 def classify_intent(state: RegionState) -> RegionState:
     """
-    사용자 의도 파악 + 목적지 추출
+    사용자 의도 파악 + 목적지/여행 스타일/계절 추출 (LLM 1회, 구조화 출력)
     
     - "recommend": 특정 도시의 지역 추천
     - "attraction": 명소 검색
@@ -33,39 +47,32 @@ def classify_intent(state: RegionState) -> RegionState:
     """
     user_input = state["user_input"]
     
-    # 의도 파악
-    prompt = f"""다음 사용자 입력의 의도를 파악하세요:
-
-"{user_input}"
-
-다음 중 하나로 분류:
-- recommend: 특정 도시의 세부 지역을 추천받고 싶음 (예: "부산 어디 가면 좋아?", "춘천갈래")
-- attraction: 특정 지역의 명소를 알고 싶음 (예: "강릉 명소 알려줘")
-- best_time: 특정 지역의 최적 방문 시기를 알고 싶음 (예: "제주 언제 가면 좋아?")
-- popular: 한국의 유명한 여행지를 추천받고 싶음 (예: "어느 여행지가 유명해?", "여행지 추천해줘")
-
-의도만 답하세요 (recommend, attraction, best_time, popular 중 하나):"""
-
-    response = get_llm().invoke(prompt)
-    intent = response.content.strip().lower()
-    
-    # 목적지 추출
-    destination_prompt = f"""다음 텍스트에서 목적지만 추출하세요:
+    prompt = f"""다음 사용자 입력에서 여행 의도와 정보를 추출하세요:
 
 "{user_input}"
 
-목적지만 답하세요 (예: 부산, 제주도, 춘천, 강릉 등).
-목적지가 없으면 "없음"이라고 답하세요:"""
-
-    dest_response = get_llm().invoke(destination_prompt)
-    destination = dest_response.content.strip()
-    
-    if destination == "없음":
-        destination = None
-    
-    state["intent"] = intent
-    if destination:
-        state["destination"] = destination
+의도 분류 예시:
+- recommend: "부산 어디 가면 좋아?", "춘천갈래"
+- attraction: "강릉 명소 알려줘"
+- best_time: "제주 언제 가면 좋아?"
+- popular: "어느 여행지가 유명해?", "여행지 추천해줘"
+
+입력에 없는 정보는 추측하지 말고 null 로 두세요."""
+
+    try:
+        # temperature=0 추출 → 프롬프트 해시 캐시
+        query = cached_structured_call("region.classify_intent", get_llm(), RegionQuery, prompt)
+    except Exception as e:
+        print(f"⚠️ Region 의도 추출 실패: {e}")
+        query = RegionQuery(intent="recommend")
+    
+    state["intent"] = query.intent
+    if query.destination:
+        state["destination"] = query.destination
+    if query.travel_style:
+        state["travel_style"] = query.travel_style
+    if query.season:
+        state["season"] = query.season
     
     return state
 
@@ -76,7 +83,11 @@ def recommend_agent(state: RegionState) -> RegionState:
     
     destination = state.get("destination", "부산")
     
-    result = recommend_regions_tool.invoke({"destination": destination})
+    result = recommend_regions_tool.invoke({
+        "destination": destination,
+        "travel_style": state.get("travel_style"),
+        "season": state.get("season")
+    })
     state["result"] = result
     state["final_response"] = f"{destination} 지역 {result.get('count', 0)}개를 추천했습니다!"
     
@@ -102,7 +113,7 @@ def best_time_agent(state: RegionState) -> RegionState:
     
     destination = state.get("destination", "부산")
     
-    result = get_region_best_time_tool.invoke({"region": destination})
+    result = get_region_best_time_tool.invoke({"region": destination, "season": state.get("season")})
     state["result"] = result
     state["final_response"] = f"{destination} 최적 방문 시기를 분석했습니다!"
     
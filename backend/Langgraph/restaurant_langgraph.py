@@ -1,6 +1,7 @@
 """Restaurant LangGraph Orchestrator - ReAct Agent"""
+from typing import Optional
 from langgraph.prebuilt import create_react_agent
-from langchain_openai import ChatOpenAI
+from agents.utils.llm_registry import get_chat_model
 import os
 from dotenv import load_dotenv
 
@@ -8,7 +9,7 @@ load_dotenv()
 
 # LLM을 함수로 변경 (lazy initialization)
 def get_llm():
-    return ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    return get_chat_model("gpt-4o-mini", temperature=0, purpose="restaurant_graph")
 
 # 핵심 Tool만 (5개)
 from agents.tool.restaurant_tools import (
@@ -108,6 +109,57 @@ class RestaurantGraphWrapper:
         return {
             "final_response": final_message
         }
+    
+    def run_direct(
+        self,
+        region: str,
+        preference: Optional[str] = None,
+        companion: Optional[str] = None,
+        occasion: Optional[str] = None,
+        age_group: Optional[str] = None,
+        gender: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        num_results: int = 5
+    ) -> dict:
+        """
+        ReAct Agent 없이 search_restaurants_tool 바로 호출
+        (Coordinator 가 이미 아는 인자를 그대로 전달 → LLM은 가게 설명 1회만)
+        
+        Returns:
+            {"final_response": str}
+        """
+        args = {
+            "region": region,
+            "preference": preference,
+            "companion": companion,
+            "occasion": occasion,
+            "age_group": age_group,
+            "gender": gender,
+            "sort_by": sort_by,
+            "num_results": num_results
+        }
+        result = search_restaurants_tool.invoke({k: v for k, v in args.items() if v is not None})
+        
+        return {
+            "final_response": result
+        }
+    
+    async def ainvoke(self, state: dict) -> dict:
+        """invoke 비동기 버전 (LLM 호출은 await, 동기 툴은 LangGraph 가 스레드에서 실행)"""
+        user_input = state.get("user_input", "")
+        
+        result = await _restaurant_react_agent.ainvoke({
+            "messages": [("user", user_input)]
+        })
+        
+        return {
+            "final_response": result["messages"][-1].content
+        }
+    
+    async def arun_direct(self, **kwargs) -> dict:
+        """run_direct 비동기 버전 (googlemaps 는 동기 클라이언트라 coordinator_pool 의 제한된 스레드에서)"""
+        from core.turn_pool import coordinator_pool
+        return await coordinator_pool.run_blocking(self.run_direct, **kwargs)
 
 # Export
 restaurant_graph = RestaurantGraphWrapper()
@@ -4,116 +4,185 @@ LangChain Agent 기반 - 10단계 플로우 + 자율 판단
 """
 
 import os
-from typing import Optional, Dict, Any
+import threading
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional, Dict, Any, Tuple
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
-from langchain.agents import create_openai_functions_agent, AgentExecutor
+from langchain.agents import create_openai_tools_agent, AgentExecutor
 from langchain.tools import tool
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain.memory import ConversationBufferMemory
+from core.turn_pool import coordinator_pool
+from agents.flow_state import use_flow_state
 from agents.itinerary_generator import generate_daily_itinerary
+from agents.utils.llm_registry import get_chat_model
+from agents.utils.parallel_executor import ParallelAgentExecutor
+from agents.utils.passthrough import TOOL_PASSTHROUGH, with_selection_prompt
+from agents.utils.place_collector import collect_places_for_turn
 
 load_dotenv()
 
 # LLM 초기화
 def get_llm():
-    return ChatOpenAI(model='gpt-4o-mini', temperature=0.7)
+    # streaming=True: SSE 엔드포인트에서 콜백으로 토큰을 바로 흘려보내기 위함
+    return get_chat_model("gpt-4o-mini", temperature=0.7, purpose="coordinator", streaming=True)
 
 
 # ==================== Agent Tools ====================
 
-@tool
-def call_restaurant_agent(query: str) -> str:
+def _run_domain_graph(graph, query: str, **direct_args) -> dict:
+    """region 등 구조화 인자가 있으면 run_direct (중첩 ReAct 루프 생략), 없거나 실패하면 ReAct Agent"""
+    direct_args = {k: v for k, v in direct_args.items() if v is not None}
+    if direct_args.get("region"):
+        try:
+            print(f"⚡ 직접 호출: {type(graph).__name__}.run_direct({direct_args})")
+            return graph.run_direct(**direct_args)
+        except Exception as e:
+            print(f"⚠️ 직접 호출 실패 → ReAct Agent: {e}")
+    return graph.invoke({"user_input": query})
+
+
+@tool(return_direct=TOOL_PASSTHROUGH)
+def call_restaurant_agent(
+    query: str,
+    region: Optional[str] = None,
+    preference: Optional[str] = None,
+    companion: Optional[str] = None,
+    occasion: Optional[str] = None,
+    sort_by: Optional[str] = None
+) -> str:
     """맛집 추천 Agent 호출
     
     Args:
         query: 맛집 검색 요청 (예: "강남 한식 맛집", "부산 해운대 일식")
+        region: 검색 지역 (예: "부산 해운대") - 알면 꼭 넣기 (빠른 직접 검색)
+        preference: 음식 종류 (예: "일식", "라멘", "삼겹살")
+        companion: 동행자 (예: "데이트", "가족", "친구", "회식")
+        occasion: 상황 (예: "기념일", "생일")
+        sort_by: 정렬 기준 ("review_count", "rating")
     """
     try:
         from Langgraph.restaurant_langgraph import restaurant_graph
-        result = restaurant_graph.invoke({"user_input": query})
-        return result.get("final_response", "맛집 정보를 찾지 못했어냥...")
+        result = _run_domain_graph(restaurant_graph, query, region=region, preference=preference,
+                                   companion=companion, occasion=occasion, sort_by=sort_by)
+        return with_selection_prompt(result.get("final_response", "맛집 정보를 찾지 못했어냥..."))
     except Exception as e:
         return f"맛집 Agent 에러냥... 😿 ({str(e)})"
 
 
-@tool
-def call_dessert_agent(query: str) -> str:
+@tool(return_direct=TOOL_PASSTHROUGH)
+def call_dessert_agent(query: str, region: Optional[str] = None, keyword: Optional[str] = None) -> str:
     """카페/디저트 추천 Agent 호출
     
     Args:
         query: 카페/디저트 검색 요청 (예: "홍대 루프탑 카페", "강남 오션뷰 카페")
+        region: 검색 지역 (예: "홍대") - 알면 꼭 넣기 (빠른 직접 검색)
+        keyword: 카페/디저트 종류 (예: "루프탑 카페", "딸기 케이크")
     """
     try:
         from Langgraph.dessert_langgraph import dessert_graph
-        result = dessert_graph.invoke({"user_input": query})
-        return result.get("final_response", "카페 정보를 찾지 못했어냥...")
+        result = _run_domain_graph(dessert_graph, query, region=region, keyword=keyword)
+        return with_selection_prompt(result.get("final_response", "카페 정보를 찾지 못했어냥..."))
     except Exception as e:
         return f"카페 Agent 에러냥... 😿 ({str(e)})"
 
 
-@tool
-def call_accommodation_agent(query: str) -> str:
+@tool(return_direct=TOOL_PASSTHROUGH)
+def call_accommodation_agent(
+    query: str,
+    region: Optional[str] = None,
+    preference: Optional[str] = None,
+    sort_by: Optional[str] = None
+) -> str:
     """숙소 추천 Agent 호출
     
     Args:
         query: 숙소 검색 요청 (예: "제주도 한옥스테이", "부산 풀빌라")
+        region: 검색 지역 (예: "제주도") - 알면 꼭 넣기 (빠른 직접 검색)
+        preference: 숙소 종류 (예: "호텔", "펜션", "한옥스테이")
+        sort_by: 정렬 ("rating", "reviews", "price")
     """
     try:
         from Langgraph.accommodation_langgraph import accommodation_graph
-        result = accommodation_graph.invoke({"user_input": query})
-        return result.get("final_response", "숙소 정보를 찾지 못했어냥...")
+        result = _run_domain_graph(accommodation_graph, query, region=region, preference=preference, sort_by=sort_by)
+        return with_selection_prompt(result.get("final_response", "숙소 정보를 찾지 못했어냥..."))
     except Exception as e:
         return f"숙소 Agent 에러냥... 😿 ({str(e)})"
 
 
-@tool
-def call_landmark_agent(query: str) -> str:
+@tool(return_direct=TOOL_PASSTHROUGH)
+def call_landmark_agent(
+    query: str,
+    region: Optional[str] = None,
+    preference: Optional[str] = None,
+    category: Optional[str] = None
+) -> str:
     """관광지 추천 Agent 호출
     
     Args:
         query: 관광지 검색 요청 (예: "서울 랜드마크", "경주 자연 명소")
+        region: 검색 지역 (예: "경주") - 알면 꼭 넣기 (빠른 직접 검색)
+        preference: 추가 선호 키워드 (예: "랜드마크", "사진 명소")
+        category: 테마파크/박물관/미술관/아쿠아리움/문화재/자연/야경/실내 중 하나
     """
     try:
         from Langgraph.landmark_langgraph import landmark_graph
-        result = landmark_graph.invoke({"user_input": query})
-        return result.get("final_response", "관광지 정보를 찾지 못했어냥...")
+        result = _run_domain_graph(landmark_graph, query, region=region, preference=preference, category=category)
+        return with_selection_prompt(result.get("final_response", "관광지 정보를 찾지 못했어냥..."))
     except Exception as e:
         return f"관광지 Agent 에러냥... 😿 ({str(e)})"
 
 
 @tool
-def call_itinerary_generator(day_number: int, date: str, departure_time: str, departure_location: str, transport_mode: str) -> str:
-    """일정표 생성 Tool
+def call_itinerary_generator(day_number: Optional[int] = None, departure_time: Optional[str] = None,
+                             departure_location: Optional[str] = None, transport_mode: Optional[str] = None) -> str:
+    """일정표 생성 Tool (목적지, 날짜, 사용자가 고른 장소는 현재 대화의 FlowState 에서 읽음)
     
     Args:
-        day_number: 일차 (1, 2, 3...)
-        date: 날짜 (YYYY-MM-DD)
-        departure_time: 출발 시간 ("오전 9시")
-        departure_location: 출발지 ("서울역")
-        transport_mode: 이동 수단 ("car", "transit", "mixed")
+        day_number: 일차 (1, 2, 3...), 생략하면 현재 일차
+        departure_time: 출발 시간 ("오전 9시"), 생략하면 FlowState 값 또는 오전 9시
+        departure_location: 출발지 ("서울역"), 생략하면 FlowState 값
+        transport_mode: 이동 수단 ("car", "transit", "mixed"), 생략하면 FlowState 값 또는 car
     """
+    from agents.flow_state import current_flow_state
+    
+    flow_state = current_flow_state()
+    if flow_state is None:
+        return "일정표를 만들 대화 정보가 없어냥... 😿"
+    
     try:
-        # FlowState에서 데이터 가져오기 (임시)
-        # 실제로는 FlowState를 전달받아야 함
+        day = day_number or flow_state.current_day
+        selections = flow_state.get_day_selections(day)
+        if not any(selections.values()):
+            return f"{day}일차에 고른 장소가 아직 없어냥! 장소를 먼저 골라줘냥 😺"
+        
+        info = flow_state.collected_info
+        date_text = "날짜 미정"
+        start_date = info.get('start_date')
+        if isinstance(start_date, str):
+            try:
+                start_date = datetime.strptime(start_date, "%Y/%m/%d").date()
+            except ValueError:
+                start_date = None
+        if isinstance(start_date, date):
+            date_text = (start_date + timedelta(days=day - 1)).isoformat()
+        
+        regions = info.get('regions') or []
+        destination = " ".join(filter(None, [info.get('destination'), regions[0] if regions else None])) or "여행지"
+        departure_location = departure_location or flow_state.departure_location or "출발지"
+        
         day_info = {
-            'day_number': day_number,
-            'date': date,
-            'departure': {'time': departure_time, 'location': departure_location},
-            'transport_mode': transport_mode,
-            'destination': '부산 해운대',  # FlowState에서 가져와야 함
-            'selections': {
-                'lunch': [],  # FlowState에서 가져와야 함
-                'dinner': [],
-                'cafe': [],
-                'accommodation': [],
-                'landmark': []
-            },
-            'is_last_day': False
+            'day_number': day,
+            'date': date_text,
+            'departure': {'time': departure_time or flow_state.departure_time or "오전 9시",
+                          'location': departure_location},
+            'transport_mode': transport_mode or flow_state.transport_mode or 'car',
+            'destination': destination,
+            'selections': selections,
+            'is_last_day': 0 < flow_state.total_days <= day,
+            'return_location': departure_location,
         }
         
-        itinerary = generate_daily_itinerary(day_info)
-        return itinerary
+        return generate_daily_itinerary(day_info)
     except Exception as e:
         return f"일정표 생성 에러냥... 😿 ({str(e)})"
 
@@ -156,6 +225,99 @@ def call_chat_agent(query: str) -> str:
         return f"대화 Agent 에러냥... 😿 ({str(e)})"
 
 
+# ==================== Agent Tools (비동기) ====================
+# AgentExecutor.ainvoke 경로에서 사용. 동기 툴은 LangChain 이 스레드에서 실행하지만,
+# 아래 툴들은 LLM 호출을 await 해서 턴 하나가 스레드를 붙잡고 있지 않게 한다.
+
+async def _arun_domain_graph(graph, query: str, **direct_args) -> dict:
+    """_run_domain_graph 비동기 버전"""
+    direct_args = {k: v for k, v in direct_args.items() if v is not None}
+    if direct_args.get("region"):
+        try:
+            print(f"⚡ 직접 호출: {type(graph).__name__}.arun_direct({direct_args})")
+            return await graph.arun_direct(**direct_args)
+        except Exception as e:
+            print(f"⚠️ 직접 호출 실패 → ReAct Agent: {e}")
+    return await graph.ainvoke({"user_input": query})
+
+
+async def _acall_restaurant_agent(query: str, region: Optional[str] = None, preference: Optional[str] = None,
+                                  companion: Optional[str] = None, occasion: Optional[str] = None,
+                                  sort_by: Optional[str] = None) -> str:
+    try:
+        from Langgraph.restaurant_langgraph import restaurant_graph
+        result = await _arun_domain_graph(restaurant_graph, query, region=region, preference=preference,
+                                          companion=companion, occasion=occasion, sort_by=sort_by)
+        return with_selection_prompt(result.get("final_response", "맛집 정보를 찾지 못했어냥..."))
+    except Exception as e:
+        return f"맛집 Agent 에러냥... 😿 ({str(e)})"
+
+
+async def _acall_dessert_agent(query: str, region: Optional[str] = None, keyword: Optional[str] = None) -> str:
+    try:
+        from Langgraph.dessert_langgraph import dessert_graph
+        result = await _arun_domain_graph(dessert_graph, query, region=region, keyword=keyword)
+        return with_selection_prompt(result.get("final_response", "카페 정보를 찾지 못했어냥..."))
+    except Exception as e:
+        return f"카페 Agent 에러냥... 😿 ({str(e)})"
+
+
+async def _acall_accommodation_agent(query: str, region: Optional[str] = None, preference: Optional[str] = None,
+                                     sort_by: Optional[str] = None) -> str:
+    try:
+        from Langgraph.accommodation_langgraph import accommodation_graph
+        result = await _arun_domain_graph(accommodation_graph, query, region=region, preference=preference,
+                                          sort_by=sort_by)
+        return with_selection_prompt(result.get("final_response", "숙소 정보를 찾지 못했어냥..."))
+    except Exception as e:
+        return f"숙소 Agent 에러냥... 😿 ({str(e)})"
+
+
+async def _acall_landmark_agent(query: str, region: Optional[str] = None, preference: Optional[str] = None,
+                                category: Optional[str] = None) -> str:
+    try:
+        from Langgraph.landmark_langgraph import landmark_graph
+        result = await _arun_domain_graph(landmark_graph, query, region=region, preference=preference,
+                                          category=category)
+        return with_selection_prompt(result.get("final_response", "관광지 정보를 찾지 못했어냥..."))
+    except Exception as e:
+        return f"관광지 Agent 에러냥... 😿 ({str(e)})"
+
+
+async def _acall_region_agent(query: str) -> str:
+    try:
+        from Langgraph.region_langgraph import region_graph
+        result = await region_graph.ainvoke({"user_input": query})
+        return result.get("final_response", "지역 정보를 찾지 못했어냥...")
+    except Exception as e:
+        return f"지역 Agent 에러냥... 😿 ({str(e)})"
+
+
+async def _acall_chat_agent(query: str) -> str:
+    try:
+        llm = get_llm()
+        prompt = f"""
+        사용자 질문: {query}
+        
+        귀여운 고양이 말투로 답변하세요.
+        - 문장 끝: "~냥", "~다냥", "~할까냥?"
+        - 이모지 사용: 😸, 🐾, 😻
+        - 짧고 친근하게
+        """
+        response = await llm.ainvoke(prompt)
+        return response.content
+    except Exception as e:
+        return f"대화 Agent 에러냥... 😿 ({str(e)})"
+
+
+call_restaurant_agent.coroutine = _acall_restaurant_agent
+call_dessert_agent.coroutine = _acall_dessert_agent
+call_accommodation_agent.coroutine = _acall_accommodation_agent
+call_landmark_agent.coroutine = _acall_landmark_agent
+call_region_agent.coroutine = _acall_region_agent
+call_chat_agent.coroutine = _acall_chat_agent
+
+
 # ==================== Coordinator Agent ====================
 
 COORDINATOR_PROMPT = """당신은 귀여운 냥이 여행 플래너입니다냥! 🐱
@@ -200,6 +362,11 @@ COORDINATOR_PROMPT = """당신은 귀여운 냥이 여행 플래너입니다냥!
 
 **[지역]**: 수집된 목적지 + 세부 지역 (예: "부산 해운대")
 
+**구조화 인자 (빠른 검색)**: 지역과 종류를 알면 query 와 함께 인자로도 넘기세요
+- 예: call_restaurant_agent(query="부산 해운대 일식", region="부산 해운대", preference="일식", companion="데이트")
+- 예: call_dessert_agent(query="홍대 루프탑 카페", region="홍대", keyword="루프탑 카페")
+- 지역을 모르거나 요청이 복잡하면 query 만 넘기기
+
 ### 규칙 2: 플로우 관리
 - 단계별로 **순차 진행** (1→2→3→...→10)
 - 각 단계 완료 후 다음 단계로 자동 이동
@@ -212,6 +379,7 @@ COORDINATOR_PROMPT = """당신은 귀여운 냥이 여행 플래너입니다냥!
 - ✅ 선택으로 인식
 - ❌ 에이전트 재호출 절대 금지!
 - ✅ 선택 확인 후 다음 단계로 이동
+- 입력에 "사용자가 고른 장소" 목록이 있으면 그 장소(이름/place_id)로 확정
 
 예시:
 사용자: "1,2"
@@ -233,8 +401,8 @@ AI: "디에이블 광안점이랑 피클스를 선택했구나냥! 😸
 "1일차 완료! 일정표를 만들어줄게냥! 📝"
 
 **중요: 반드시 call_itinerary_generator 호출!**
-- 인수: day_number=1, date="2025-12-13", departure_time="오전 9시", departure_location="서울역", transport_mode="car"
-- FlowState에서 수집한 정보 사용
+- 인수: day_number=1 (출발 시간/출발지/이동 수단은 사용자가 말한 경우에만)
+- 목적지, 날짜, 고른 장소는 툴이 FlowState 에서 읽음
 
 **일정표 생성:**
 - 출발지, 도착지, 이동 수단 포함
@@ -538,14 +706,51 @@ User: "숙소부터 찾고 싶어"
 4. **플로우 복귀**: 예외 처리 후 반드시 원래 단계로 돌아가기
 5. **Tool 사용 우선**: 정보 검색이 필요하면 직접 답변하지 말고 Tool 사용
 6. **세부 지역 재추천**: 사용자가 1개 지역만 선택하면 다른 지역도 추천해주기
+7. **여러 도메인 동시 요청**: "맛집이랑 카페랑 숙소 다 알려줘" 처럼 서로 독립적인 요청은 한 번에 여러 Tool 을 같이 호출 (동시에 실행됨)
 """
 
 
 
 # Coordinator Agent 초기화
+# (세션별 대화 메모리 / FlowState / 페르소나는 agents.session_store 에서 관리)
 coordinator_agent = None
-conversation_memories = {}
-user_personas = {}
+coordinator_tools = []
+
+# 툴 그룹 조합별 Coordinator 변형 캐시 (agents/tool_selector.py 참고)
+_agent_variants: Dict[Tuple[str, ...], AgentExecutor] = {}
+_agent_variants_lock = threading.Lock()
+
+
+def _build_coordinator_agent(tools: list) -> AgentExecutor:
+    """주어진 툴 목록으로 Coordinator AgentExecutor 생성"""
+    # tools agent: 한 스텝에 여러 툴 호출 가능 → ParallelAgentExecutor 가 동시에 실행
+    coordinator_executor = create_openai_tools_agent(llm, tools, coordinator_prompt)
+    return ParallelAgentExecutor(
+        agent=coordinator_executor,
+        tools=tools,
+        verbose=True,
+        max_iterations=10,
+        handle_parsing_errors=True
+    )
+
+
+def get_coordinator_agent(groups: Tuple[str, ...]) -> AgentExecutor:
+    """툴 그룹 조합에 맞는 Coordinator 변형 반환 (한 번 만든 변형은 캐시)"""
+    agent = _agent_variants.get(groups)
+    if agent is not None:
+        return agent
+    
+    from agents.tool_selector import tool_names_for_groups
+    
+    with _agent_variants_lock:
+        agent = _agent_variants.get(groups)
+        if agent is None:
+            names = tool_names_for_groups(groups)
+            tools = [t for t in coordinator_tools if t.name in names]
+            agent = _build_coordinator_agent(tools) if tools else coordinator_agent
+            _agent_variants[groups] = agent
+            print(f"🧰 Coordinator 변형 생성: {groups or ('fallback',)} → {len(tools)}개 Tools")
+        return agent
 
 try:
     llm = get_llm()
@@ -558,6 +763,7 @@ try:
         call_landmark_agent,
         call_region_agent,
         call_chat_agent,
+        call_itinerary_generator,
     ]
     
     # 추가 Tools (선택적 - import 실패 시 무시)
@@ -640,14 +846,8 @@ try:
         MessagesPlaceholder(variable_name="agent_scratchpad"),
     ])
     
-    coordinator_executor = create_openai_functions_agent(llm, coordinator_tools, coordinator_prompt)
-    coordinator_agent = AgentExecutor(
-        agent=coordinator_executor,
-        tools=coordinator_tools,
-        verbose=True,
-        max_iterations=10,
-        handle_parsing_errors=True
-    )
+    # 전체 툴 버전 (툴 선택 결과가 비어 있을 때의 안전망)
+    coordinator_agent = _build_coordinator_agent(coordinator_tools)
     print("✅ Coordinator Agent 초기화 성공")
     print(f"   📍 총 {len(coordinator_tools)}개 Tools 로드됨")
 except Exception as e:
@@ -655,118 +855,287 @@ except Exception as e:
     print("   ℹ️ 서버는 정상 시작되지만 Coordinator 기능은 사용 불가")
 
 
-def get_coordinator_response(message: str, session_id: str = "default", user_id: str = "default_user") -> str:
-    """Coordinator Agent 호출"""
+def get_coordinator_response(message: str, session_id: str = "default", user_id: str = "default_user",
+                             callbacks: Optional[list] = None) -> str:
+    """Coordinator Agent 호출
+    
+    Args:
+        callbacks: LangChain 콜백 핸들러 리스트 (SSE 스트리밍용, 도메인 그래프까지 전파됨)
+    """
     if not coordinator_agent:
         return "Coordinator Agent가 초기화되지 않았어냥... 😿"
     
+    from agents.session_store import session_store
+    
+    # 턴이 끝날 때까지 세션 저장소에서 제거되지 않도록 사용 중 표시
+    # 같은 세션에 동시에 들어온 요청은 순서대로 처리 (다른 세션과는 경합 없음)
+    with session_store.turn(session_id, user_id) as session, session.lock:
+        # 다른 워커가 이 세션의 턴을 처리했으면 최신 상태로 갱신
+        session_store.refresh(session)
+        try:
+            with collect_places_for_turn(reuse=True):
+                response = _run_session_turn(session, message, user_id, callbacks)
+            # 외부 백엔드에 저장 (버전 충돌 시 SessionConflictError → 라우터에서 409)
+            session_store.persist(session)
+            return response
+        finally:
+            session_store.update_size(session)
+
+
+async def alock_session_turn(session_id: str, user_id: str = "default_user") -> Callable[[], None]:
+    """이벤트 루프에서 시작해 워커 스레드에서 도는 동기 턴(스트리밍)용 세션 lock
+
+    비동기 턴(aget_coordinator_response)과 같은 session.async_lock 에 줄을 세운다.
+    반환값은 lock 을 푸는 함수 - 턴이 끝난 뒤 이벤트 루프에서 호출해야 한다.
+    앞선 턴을 COORDINATOR_QUEUE_TIMEOUT 넘게 기다리면 PoolBusyError (503).
+    """
+    from agents.session_store import session_store
+    
+    session = session_store.acquire_turn(session_id, user_id)
     try:
-        # FlowState 가져오기
-        from agents.flow_state import get_flow_state, reset_flow_state
-        
-        # 새로운 여행 계획 시작 키워드 감지
-        reset_keywords = ["여행 계획 시작", "새로운 여행", "처음부터", "다시 시작", "초기화"]
-        should_reset = any(keyword in message for keyword in reset_keywords)
-        
-        if should_reset:
-            # FlowState 초기화
-            reset_flow_state(session_id)
-            print(f"🔄 FlowState 초기화됨 (세션: {session_id})")
-            
-            # ConversationMemory도 초기화
-            if session_id in conversation_memories:
-                conversation_memories[session_id].clear()
-                print(f"🔄 대화 기록 초기화됨 (세션: {session_id})")
-        
-        flow_state = get_flow_state(session_id)
+        await coordinator_pool.acquire_lock(session.async_lock)
+    except BaseException:
+        session_store.release_turn(session)
+        raise
+    
+    def release() -> None:
+        session.async_lock.release()
+        session_store.release_turn(session)
+    
+    return release
 
-        
-        # Memory 초기화
-        if session_id not in conversation_memories:
-            conversation_memories[session_id] = ConversationBufferMemory(
-                memory_key="chat_history",
-                return_messages=True
-            )
-        
-        memory = conversation_memories[session_id]
-        
-        # 페르소나 로드
-        if session_id not in user_personas:
-            try:
-                from agents.persona_agent import agent as persona_agent
-                persona_result = persona_agent.get(user_id)
-                
-                if persona_result.get('success') and persona_result.get('data'):
-                    persona = persona_result['data'][0]
-                    user_personas[session_id] = persona
-                    print(f"✅ 페르소나 로드 성공: {user_id}")
-                else:
-                    print(f"⚠️ 페르소나 없음: {user_id}")
-                    user_personas[session_id] = None
-            except Exception as e:
-                print(f"❌ 페르소나 로드 실패: {e}")
-                user_personas[session_id] = None
-        
-        # 페르소나 컨텍스트
-        persona_context = ""
-        if user_personas.get(session_id):
-            persona = user_personas[session_id]
-            persona_context = f"""
+
+async def aget_coordinator_response(message: str, session_id: str = "default", user_id: str = "default_user",
+                                    callbacks: Optional[list] = None) -> str:
+    """get_coordinator_response 비동기 버전 (coordinator_pool.arun 에서 실행, 스레드 점유 없음)"""
+    if not coordinator_agent:
+        return "Coordinator Agent가 초기화되지 않았어냥... 😿"
+    
+    from agents.session_store import session_store
+    
+    # 비동기 턴 / 스트리밍 턴(alock_session_turn)은 모두 async_lock 으로 줄을 선다
+    # (arun 슬롯을 잡은 채 기다리므로 대기 시간 제한, 초과하면 PoolBusyError 503)
+    with session_store.turn(session_id, user_id) as session:
+        await coordinator_pool.acquire_lock(session.async_lock)
+        try:
+            # 백엔드 동기화는 SQLite I/O 라 스레드에서
+            await coordinator_pool.run_blocking(session_store.refresh, session)
+            with collect_places_for_turn(reuse=True):
+                response = await _arun_session_turn(session, message, user_id, callbacks)
+            await coordinator_pool.run_blocking(session_store.persist, session)
+            return response
+        finally:
+            session_store.update_size(session)
+            session.async_lock.release()
+
+
+def _prepare_session_turn(session, message: str, user_id: str) -> Tuple[Optional[str], Optional[tuple]]:
+    """Coordinator 호출 전 단계 (리셋, 빠른 경로, 슬롯 파서, 페르소나, 입력 구성, 툴 선택)
+
+    Returns:
+        (빠른 경로 응답, None) 또는 (None, (agent, agent_input))
+    """
+    session_id = session.session_id
+    
+    # 새로운 여행 계획 시작 키워드 감지
+    reset_keywords = ["여행 계획 시작", "새로운 여행", "처음부터", "다시 시작", "초기화"]
+    should_reset = any(keyword in message for keyword in reset_keywords)
+    
+    if should_reset:
+        # FlowState + ConversationMemory 초기화
+        session.reset()
+        print(f"🔄 FlowState / 대화 기록 초기화됨 (세션: {session_id})")
+    
+    flow_state = session.flow_state
+    memory = session.memory
+    last_ai_message = next(
+        (m.content for m in reversed(memory.chat_memory.messages) if m.type == "ai"), None
+    )
+    
+    # 빠른 경로: 날짜/예산/인원/출발 시간/출발 장소 단계는 템플릿 응답 (Coordinator LLM 호출 없음)
+    from agents.fast_path import try_fast_path, record_turn
+    fast_result = try_fast_path(flow_state, message, last_ai_message)
+    if fast_result:
+        record_turn(fast_result["slot"])
+        memory.save_context({"input": message}, {"output": fast_result["response"]})
+        print(f"⚡ 빠른 경로 처리: {fast_result['slot']} (현재 단계: {flow_state.current_step})")
+        return fast_result["response"], None
+    
+    # 저장된 추천 목록에서 고른 경우 ("2번", "고반식당", "두 번째 식당 리뷰") → 검색 툴 다시 안 부름
+    from agents.utils.selection_resolver import resolve_selection, run_place_action
+    selection = resolve_selection(
+        message, flow_state.get_recommendations(), flow_state.last_recommendation_category, last_ai_message
+    )
+    if selection and selection["action"]:
+        # 리뷰/메뉴/상세: 저장된 place_id 로 툴 바로 호출 (Coordinator LLM 호출 없음)
+        record_turn(f"selection_{selection['action']}")
+        place = selection["places"][0]
+        response = run_place_action(selection["category"], selection["action"], place)
+        memory.save_context({"input": message}, {"output": response})
+        print(f"⚡ 선택 후속 요청: {place.get('name')} ({selection['category']}/{selection['action']})")
+        return response, None
+    record_turn(None)
+    
+    # 날짜/예산/인원/출발 시간은 규칙 기반 파서로 바로 채움 (Coordinator LLM 이 다시 해석할 필요 없음)
+    from agents.slot_parser import parse_slots, apply_slots_to_flow_state
+    filled_slots = apply_slots_to_flow_state(flow_state, parse_slots(message), message)
+    if filled_slots:
+        print(f"⚡ 슬롯 파서: {filled_slots} 채움")
+    
+    # 페르소나 로드 (세션당 1회)
+    if not session.persona_loaded:
+        session.persona_loaded = True
+        try:
+            from agents.persona_agent import agent as persona_agent
+            persona_result = persona_agent.get(user_id)
+            
+            if persona_result.get('success') and persona_result.get('data'):
+                session.persona = persona_result['data'][0]
+                print(f"✅ 페르소나 로드 성공: {user_id}")
+            else:
+                print(f"⚠️ 페르소나 없음: {user_id}")
+        except Exception as e:
+            print(f"❌ 페르소나 로드 실패: {e}")
+    
+    # 페르소나 컨텍스트
+    persona_context = ""
+    if session.persona:
+        persona = session.persona
+        persona_context = f"""
 
 👤 사용자 페르소나 (참고용):
 - 연령대: {persona.get('age_group', '정보없음')}
 - 여행 스타일: {', '.join(persona.get('travel_style', []))}
 - 음식 선호: {', '.join(persona.get('food_preferences', []))}
 """
-        
-        # FlowState 컨텍스트 추가
-        flow_context = flow_state.get_context_for_prompt()
-        
-        # 박수/일수 계산
-        nights = 0
-        days = 0
-        trip_duration_text = ""
-        
-        if flow_state.collected_info.get('start_date') and flow_state.collected_info.get('end_date'):
-            try:
-                from datetime import datetime
-                start = datetime.strptime(flow_state.collected_info['start_date'], "%Y/%m/%d")
-                end = datetime.strptime(flow_state.collected_info['end_date'], "%Y/%m/%d")
-                days = (end - start).days + 1
-                nights = days - 1
-                trip_duration_text = f"\n\n📅 여행 기간: {nights}박 {days}일"
-            except:
-                pass
-        
-        # 전체 입력 구성
-        full_input = message + persona_context + flow_context + trip_duration_text
-        
-        print(f"\n=== FlowState 정보 ===")
-        print(f"현재 단계: {flow_state.current_step} ({flow_state.get_step_name()})")
-        print(f"플로우 내부: {flow_state.is_in_flow}")
-        print(f"수집된 정보: {flow_state.collected_info}")
-        if nights > 0:
-            print(f"여행 기간: {nights}박 {days}일")
-        
-        # Coordinator Agent 호출
-        result = coordinator_agent.invoke({
-            "input": full_input,
-            "chat_history": memory.chat_memory.messages
-        })
-        
-        response = result.get("output", "응답 생성 실패냥...")
-        
-        # Memory 저장
-        memory.save_context(
-            {"input": message},
-            {"output": response}
+    
+    # FlowState 컨텍스트 추가
+    flow_context = flow_state.get_context_for_prompt()
+    
+    # 박수/일수 계산
+    nights = 0
+    days = 0
+    trip_duration_text = ""
+    
+    if flow_state.collected_info.get('start_date') and flow_state.collected_info.get('end_date'):
+        try:
+            from datetime import datetime
+            start = datetime.strptime(flow_state.collected_info['start_date'], "%Y/%m/%d")
+            end = datetime.strptime(flow_state.collected_info['end_date'], "%Y/%m/%d")
+            days = (end - start).days + 1
+            nights = days - 1
+            trip_duration_text = f"\n\n📅 여행 기간: {nights}박 {days}일"
+            flow_state.nights, flow_state.total_days = nights, days
+        except:
+            pass
+    elif flow_state.total_days:
+        # 날짜 없이 "2박 3일" 만 받은 경우
+        nights, days = flow_state.nights, flow_state.total_days
+        trip_duration_text = f"\n\n📅 여행 기간: {nights}박 {days}일 (날짜 미정)"
+    
+    # 선택 확인: 저장된 목록에서 찾은 장소를 넘겨서 Coordinator 가 검색 툴을 다시 부르지 않게
+    selection_context = ""
+    if selection:
+        flow_state.add_selection(selection["category"],
+                                 [p["place_id"] for p in selection["places"] if p.get("place_id")], selection["places"])
+        selected_lines = "\n".join(
+            f"- {p.get('name')} (place_id: {p.get('place_id')}, 주소: {p.get('address', '')})" for p in selection["places"]
         )
+        selection_context = f"\n\n## ✅ 사용자가 고른 장소 (저장된 추천 목록에서 확인됨, 에이전트 재호출 금지)\n{selected_lines}\n"
+        print(f"⚡ 선택 해석: {selection['category']} → {[p.get('name') for p in selection['places']]}")
+    
+    # 전체 입력 구성
+    full_input = message + persona_context + flow_context + trip_duration_text + selection_context
+    
+    print(f"\n=== FlowState 정보 ===")
+    print(f"현재 단계: {flow_state.current_step} ({flow_state.get_step_name()})")
+    print(f"플로우 내부: {flow_state.is_in_flow}")
+    print(f"수집된 정보: {flow_state.collected_info}")
+    if nights > 0:
+        print(f"여행 기간: {nights}박 {days}일")
+    
+    # 이번 턴에 필요한 툴만 노출한 Coordinator 변형 선택
+    from agents.tool_selector import select_tool_groups
+    
+    # 선택 확인 턴은 검색 툴 없이 (대화 + 일정 생성만)
+    tool_groups = ("core", "itinerary") if selection else select_tool_groups(flow_state, message, last_ai_message)
+    agent = get_coordinator_agent(tool_groups)
+    print(f"🧰 툴 그룹: {tool_groups or ('fallback',)} ({len(agent.tools)}개 Tools)")
+    
+    agent_input = {
+        "input": full_input,
+        # 최근 N턴 원문 + 이전 대화 요약 (토큰 예산 이내)
+        "chat_history": memory.load_messages()
+    }
+    return None, (agent, agent_input)
+
+
+def _finish_session_turn(session, message: str, result: Dict[str, Any]) -> str:
+    """Coordinator 결과 → 메모리 저장 + 응답"""
+    memory = session.memory
+    response = result.get("output", "응답 생성 실패냥...")
+    
+    # 이번 턴에 보여준 추천 목록을 place_id 와 함께 저장 (다음 턴의 "2번" / "첫 번째 거 리뷰" 해석용)
+    from agents.utils.place_collector import current_collector
+    from agents.utils.selection_resolver import RECOMMENDATION_LIMIT, group_by_category
+    collector = current_collector()
+    if collector is not None and collector.places:
+        shown = collector.to_place_cards(response, limit=RECOMMENDATION_LIMIT)
+        for category, places in group_by_category(shown).items():
+            session.flow_state.store_recommendations(category, places)
+            print(f"📌 추천 목록 저장: {category} {len(places)}개")
+    
+    # Memory 저장
+    memory.save_context(
+        {"input": message},
+        {"output": response}
+    )
+    
+    memory_stats = memory.get_stats()
+    print(f"🧠 대화 기록 토큰: {memory_stats['prompt_tokens_last']} "
+          f"(전체 기록이었다면 {memory_stats['full_history_tokens_last']}, 요약 {memory_stats['summary_tokens']})")
+    
+    print(f"\n=== 응답 완료 ===")
+    print(f"응답: {response[:200]}...")
+    
+    return response
+
+
+def _run_session_turn(session, message: str, user_id: str, callbacks: Optional[list]) -> str:
+    """세션 lock 을 잡은 상태에서 Coordinator 한 턴 실행"""
+    try:
+        fast_response, prepared = _prepare_session_turn(session, message, user_id)
+        if fast_response is not None:
+            return fast_response
+        agent, agent_input = prepared
         
-        print(f"\n=== 응답 완료 ===")
-        print(f"응답: {response[:200]}...")
+        # Coordinator Agent 호출 (일정표 툴은 use_flow_state 로 지정한 FlowState 를 읽음)
+        with use_flow_state(session.flow_state):
+            result = agent.invoke(agent_input, config={"callbacks": callbacks} if callbacks else None)
+        return _finish_session_turn(session, message, result)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return f"에러 발생냥... 😿 ({str(e)})"
+
+
+async def _arun_session_turn(session, message: str, user_id: str, callbacks: Optional[list]) -> str:
+    """_run_session_turn 비동기 버전 (Coordinator / 도메인 그래프 LLM 호출을 await)
+
+    준비/마무리 단계는 페르소나 DB 조회, 대화 요약 LLM 호출이 동기라 coordinator_pool.run_blocking 으로 실행
+    """
+    try:
+        fast_response, prepared = await coordinator_pool.run_blocking(_prepare_session_turn, session, message, user_id)
+        if fast_response is not None:
+            return fast_response
+        agent, agent_input = prepared
         
-        return response
+        # Coordinator Agent 호출 (독립적인 툴 호출은 COORDINATOR_TOOL_CONCURRENCY 개까지 동시에 실행)
+        with use_flow_state(session.flow_state):
+            result = await agent.ainvoke(agent_input, config={"callbacks": callbacks} if callbacks else None)
+        return await coordinator_pool.run_blocking(_finish_session_turn, session, message, result)
     except Exception as e:
         import traceback
         traceback.print_exc()
         return f"에러 발생냥... 😿 ({str(e)})"
+
@@ -6,8 +6,12 @@ from typing import Optional, List, Dict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 import googlemaps
-from langchain_openai import ChatOpenAI
+from agents.utils.places_cache import CachedPlacesClient
+from agents.utils.gazetteer import geocode_region
+from agents.utils.llm_registry import get_chat_model
 from schemas.data_models import PlaceData, AgentResponse, UserPersona
+from agents.utils.place_collector import record_places
+from agents.utils.search_pipeline import SearchPipeline, start_web_search, collect_web_names, prefer_web_mentioned
 
 # 1. 환경 설정
 load_dotenv()
@@ -20,7 +24,7 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("openai").setLevel(logging.WARNING)
 
 GOOGLE_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
-gmaps = googlemaps.Client(key=GOOGLE_API_KEY) if GOOGLE_API_KEY else None
+gmaps = CachedPlacesClient(googlemaps.Client(key=GOOGLE_API_KEY)) if GOOGLE_API_KEY else None
 
 # --- [Helper] 페르소나 점수 계산 ---
 def calculate_persona_score(place: dict, persona: Optional[UserPersona]) -> float:
@@ -54,54 +58,25 @@ def calculate_review_quality_score(place_dict: dict) -> float:
 
 # --- [Step 1] 통합 검색 (초경량 모드) ---
 def search_desserts_integrated(region: str, keyword: str, num_results: int = 5, persona: Optional[UserPersona] = None) -> AgentResponse:
+    pipeline = SearchPipeline("dessert")
     try:
-        # 0. Serper 웹 검색 (2단계 전략)
-        place_names_from_web = []
-        try:
-            from agents.utils.serper_utils import search_with_serper, extract_place_names
-            
-            # 1차: 메뉴 특화 검색 (사용자 입력 그대로)
-            if keyword:
-                search_query_specific = f"{region} {keyword}"
-                logger.warning(f"🌐 Serper 1차 검색 (메뉴 특화): {search_query_specific}")
-                serper_results = search_with_serper(search_query_specific, num_results=10)
-                
-                if serper_results:
-                    place_names_from_web = extract_place_names(serper_results, keyword)
-                    logger.warning(f"📝 1차 검색 결과: {len(place_names_from_web)}개")
-                
-                # 2차: 일반 검색 (결과가 부족하면)
-                if len(place_names_from_web) < 5:
-                    # 메뉴에서 카테고리 추출 (예: "딸기 케이크" → "케이크")
-                    general_category = keyword.split()[-1] if ' ' in keyword else keyword
-                    
-                    if general_category != keyword:  # 메뉴 특화와 다른 경우만
-                        search_query_general = f"{region} {general_category}"
-                        logger.warning(f"🌐 Serper 2차 검색 (일반): {search_query_general}")
-                        serper_results_2 = search_with_serper(search_query_general, num_results=10)
-                        
-                        if serper_results_2:
-                            additional_names = extract_place_names(serper_results_2, general_category)
-                            # 중복 제거하고 추가
-                            for name in additional_names:
-                                if name not in place_names_from_web:
-                                    place_names_from_web.append(name)
-                            logger.warning(f"📝 2차 검색 추가: {len(additional_names)}개 (총 {len(place_names_from_web)}개)")
-        except Exception as e:
-            logger.warning(f"⚠️ Serper 검색 실패 (Google Places만 사용): {e}")
+        # 0. Serper 웹 검색 (1차 메뉴 특화 + 2차 일반) → Places 쿼리와 무관하므로 백그라운드에서 먼저 시작
+        web_searches = start_web_search(pipeline, region, keyword)
         
-        geocode = gmaps.geocode(f"{region}, 대한민국", language="ko")
+        with pipeline.stage("geocode"):
+            geocode = geocode_region(gmaps, region)
         if not geocode: return AgentResponse(success=False, message="지역 찾기 실패")
         coords = geocode[0]['geometry']['location']
         
         # [최적화] 반경 1.5km로 축소하여 데이터 스캔 속도 향상
-        first_page = gmaps.places_nearby(
-            location=(coords['lat'], coords['lng']), 
-            radius=1500, 
-            type="cafe", 
-            keyword=keyword, 
-            language="ko"
-        )
+        with pipeline.stage("nearby"):
+            first_page = gmaps.places_nearby(
+                location=(coords['lat'], coords['lng']), 
+                radius=1500, 
+                type="cafe", 
+                keyword=keyword, 
+                language="ko"
+            )
         # 페이지네이션 로직 완전 제거 (첫 페이지 20개로 승부)
         raw_results = first_page.get('results', [])
         
@@ -117,9 +92,12 @@ def search_desserts_integrated(region: str, keyword: str, num_results: int = 5,
         import random
         top_candidates = sorted_results[:15]  # 상위 15개
         random.shuffle(top_candidates)  # 랜덤 섞기
-        final_results = top_candidates[:num_results]  # num_results 개 선택
         
-        logger.warning(f"🎯 랜덤 선택: {len(final_results)}개")
+        # 웹 검색에 이름이 나온 카페 우선 (웹 검색은 마감 시간까지만 기다림)
+        place_names_from_web = collect_web_names(pipeline, web_searches)
+        final_results = prefer_web_mentioned(top_candidates, place_names_from_web)[:num_results]  # num_results 개 선택
+        
+        logger.warning(f"🎯 랜덤 선택: {len(final_results)}개 (웹 검색 이름 {len(place_names_from_web)}개)")
         
         final_places = []
         for p in final_results:
@@ -138,15 +116,18 @@ def search_desserts_integrated(region: str, keyword: str, num_results: int = 5,
                 google_maps_url=f"https://www.google.com/maps/place/?q=place_id:{p['place_id']}"
             ))
         
-        return AgentResponse(
+        # 라우터가 장소 카드를 바로 만들 수 있도록 턴 수집기에 기록
+        return record_places(AgentResponse(
             success=True, 
             agent_name="dessert_search", 
             data=[p.model_dump() for p in final_places], 
             count=len(final_places), 
             message=f"TOP {len(final_places)}개 선정 완료"
-        )
+        ))
     except Exception as e:
         return AgentResponse(success=False, message="검색 오류", error=str(e))
+    finally:
+        pipeline.finish()
 
 # --- [Step 2] 리포트 생성 ---
 def generate_korean_ux_report(place_id: str, persona: Optional[UserPersona] = None) -> AgentResponse:
@@ -164,7 +145,7 @@ def generate_korean_ux_report(place_id: str, persona: Optional[UserPersona] = No
         if len(review_text) > 1500:
             review_text = review_text[:1500]
 
-        llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.2)
+        llm = get_chat_model("gpt-4o-mini", temperature=0.2, purpose="dessert_report")
         
         prompt_full = f"""당신은 카페 가이드 AI입니다. 
 아래 정보를 바탕으로 사용자에게 추천하는 짧고 강렬한 리포트를 작성하세요.
@@ -215,7 +196,7 @@ def generate_korean_ux_report(place_id: str, persona: Optional[UserPersona] = No
 # --- [Step 3] 가격 정보 분석 (극한 최적화) ---
 def get_cafe_price_analysis(region: str, menu_type: str = "커피", persona: Optional[UserPersona] = None) -> AgentResponse:
     try:
-        geocode = gmaps.geocode(f"{region}, 대한민국", language="ko")
+        geocode = geocode_region(gmaps, region)
         coords = geocode[0]['geometry']['location']
         
         # [최적화] 5개만 검색
@@ -255,7 +236,7 @@ def get_cafe_price_analysis(region: str, menu_type: str = "커피", persona: Opt
         if len(combined_reviews) > 1500:
             combined_reviews = combined_reviews[:1500]
         
-        llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.2)
+        llm = get_chat_model("gpt-4o-mini", temperature=0.2, purpose="dessert_report")
         
         prompt_full = f"""지역: {region}, 메뉴: {menu_type}
 리뷰 데이터를 보고 가격 정보를 숫자(원)로 정확히 요약하세요.
@@ -8,6 +8,8 @@ from typing import List, Dict, Any, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 import googlemaps
+from agents.utils.places_cache import CachedPlacesClient
+from agents.utils.gazetteer import geocode_region
 from schemas.data_models import PlaceData, AgentResponse
 
 load_dotenv()
@@ -28,7 +30,7 @@ GOOGLE_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
 DATA_GO_API_KEY = os.getenv("DATA_GO_KR_API_KEY")
 OPENWEATHER_API_KEY = os.getenv("OPENWEATHERMAP_API_KEY")
 
-gmaps = googlemaps.Client(key=GOOGLE_API_KEY) if GOOGLE_API_KEY else None
+gmaps = CachedPlacesClient(googlemaps.Client(key=GOOGLE_API_KEY)) if GOOGLE_API_KEY else None
 
 # --- 1. 재난문자 조회 ---
 def fetch_disaster_alerts(region: str) -> List[Dict[str, Any]]:
@@ -88,7 +90,7 @@ def fetch_weather_and_outfit(region: str) -> Dict[str, Any]:
     # logger.info(f"⚡ 날씨 조회 시작: {region}")
     
     try:
-        geocode = gmaps.geocode(f"{region}, 대한민국", language="ko")
+        geocode = geocode_region(gmaps, region)
         if not geocode:
             return {"api_available": False, "condition": "지역불명", "warnings": [], "risk_level": 0}
         
@@ -222,7 +224,7 @@ def find_emergency_services(region: str) -> List[PlaceData]:
     # logger.info(f"⚡ 긴급 시설 검색 시작: {region}")
     
     try:
-        geocode = gmaps.geocode(f"{region}, 대한민국", language="ko")
+        geocode = geocode_region(gmaps, region)
         if not geocode: return []
         
         coords = geocode[0]['geometry']['location']
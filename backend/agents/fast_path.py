@@ -0,0 +1,227 @@
+"""
+고정 플로우 단계 빠른 경로 (fast path)
+
+날짜 / 예산 / 인원 / 출발 시간 / 출발 장소 단계는 툴이 필요 없는 단순 슬롯 채우기인데,
+예전에는 이런 턴도 전체 툴 스키마 + 최대 10회 반복의 AgentExecutor.invoke 를 거쳤다.
+
+지금 물어보고 있는 슬롯(플로우 단계 + 직전 챗봇 질문으로 판단)을
+사용자 메시지에서 확실하게 채울 수 있으면:
+  1) FlowState 갱신 + 다음 단계로 이동
+  2) 템플릿 응답(고양이 말투)으로 바로 답변 → Coordinator LLM 호출 0회
+
+조금이라도 애매하면(신뢰도 낮음, 다른 요청이 섞임, 질문) None 을 반환하고 기존 Coordinator 경로로 간다.
+빠른 경로로 처리한 턴 비율은 get_fast_path_stats() 로 확인 (/langgraph/metrics).
+
+FAST_PATH_ENABLED=false 로 끌 수 있음.
+"""
+import os
+import re
+import threading
+from typing import Any, Dict, Optional
+
+from agents.flow_state import TravelFlowState
+from agents.utils.cat_speech import SLOT_QUESTIONS
+from agents.slot_parser import (
+    DATE_FORMAT, SLOT_CONFIDENCE_THRESHOLD, format_won, needs_llm_fallback, parse_slots
+)
+
+
+FAST_PATH_ENABLED = os.getenv("FAST_PATH_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# 슬롯 이름 (TravelFlowState 단계 상수에 없는 출발 시간/장소 포함)
+SLOT_DATES = "dates"
+SLOT_BUDGET = "budget"
+SLOT_PEOPLE = "people"
+SLOT_DEPARTURE_TIME = "departure_time"
+SLOT_DEPARTURE_LOCATION = "departure_location"
+
+# 직전 챗봇 질문 → 지금 묻고 있는 슬롯 (위에서부터 먼저 매칭)
+_QUESTION_PATTERNS = [
+    (SLOT_DEPARTURE_LOCATION, re.compile(r"어디서\s*출발|출발\s*(?:장소|지|위치)")),
+    (SLOT_DEPARTURE_TIME, re.compile(r"몇\s*시에?\s*출발|출발\s*시간")),
+    (SLOT_PEOPLE, re.compile(r"몇\s*명|인원")),
+    (SLOT_BUDGET, re.compile(r"예산")),
+    (SLOT_DATES, re.compile(r"언제\s*여행|시작일|여행\s*날짜|날짜")),
+]
+
+# 다음 질문 템플릿 (coordinator_prompt 의 3~7단계 문구와 동일)
+NEXT_QUESTIONS = {
+    slot: SLOT_QUESTIONS[slot]
+    for slot in (SLOT_BUDGET, SLOT_PEOPLE, SLOT_DEPARTURE_TIME, SLOT_DEPARTURE_LOCATION, "restaurant")
+}
+
+_NEXT_SLOT = {
+    SLOT_DATES: SLOT_BUDGET,
+    SLOT_BUDGET: SLOT_PEOPLE,
+    SLOT_PEOPLE: SLOT_DEPARTURE_TIME,
+    SLOT_DEPARTURE_TIME: SLOT_DEPARTURE_LOCATION,
+    SLOT_DEPARTURE_LOCATION: "restaurant",
+}
+
+# 이런 말이 섞여 있으면 단순 답변이 아님 → Coordinator 로
+_ESCAPE_RE = re.compile(r"[?？]|뭐|어때|추천|알려|몰라|모르|아직|미정|글쎄|상관\s*없|아무|바꿔|변경|취소|말고")
+_LOCATION_SUFFIX_RE = re.compile(
+    r"\s*(?:에서|서)?\s*(?:출발)?\s*(?:할게|할거야|할\s*거야|할래|예정|이요|요|이야|야|입니다|이에요|예요)?\s*[.!~ㅎㅋ]*$"
+)
+
+# 장소처럼 보이는 끝말 ("서울역", "김포공항", "연남동", "우리집")
+_PLACE_SUFFIX_RE = re.compile(r"(?:역|공항|터미널|동|구|시|집)$")
+_EXPLICIT_DEPARTURE_RE = re.compile(r"에서\s*출발")
+
+# 출발 장소 질문에 대한 대답이 아닌 말
+_NON_ANSWERS = {"응", "네", "예", "어", "엉", "웅", "좋아", "그래", "오케이", "ok", "OK", "ㅇㅇ", "알겠어", "고마워"}
+
+# 메트릭
+_lock = threading.Lock()
+_stats: Dict[str, Any] = {"turns": 0, "fast_path_turns": 0, "by_slot": {}}
+
+
+def record_turn(fast_path_slot: Optional[str]) -> None:
+    """턴 하나 기록 (fast_path_slot 이 None 이면 Coordinator 경로)"""
+    with _lock:
+        _stats["turns"] += 1
+        if fast_path_slot:
+            _stats["fast_path_turns"] += 1
+            _stats["by_slot"][fast_path_slot] = _stats["by_slot"].get(fast_path_slot, 0) + 1
+
+
+def get_fast_path_stats() -> Dict[str, Any]:
+    with _lock:
+        turns = _stats["turns"]
+        return {
+            "enabled": FAST_PATH_ENABLED,
+            "turns": turns,
+            "fast_path_turns": _stats["fast_path_turns"],
+            "fast_path_ratio": round(_stats["fast_path_turns"] / turns, 3) if turns else 0.0,
+            "by_slot": dict(_stats["by_slot"]),
+        }
+
+
+def detect_pending_slot(flow_state: TravelFlowState, last_ai_message: Optional[str]) -> Optional[str]:
+    """지금 사용자에게 묻고 있는 슬롯
+
+    current_step 은 Coordinator 가 갱신하지 않을 때가 많아서 직전 챗봇 질문을 먼저 본다.
+    """
+    if last_ai_message:
+        # 질문은 보통 응답 마지막 부분에 있음
+        tail = last_ai_message[-200:]
+        for slot, pattern in _QUESTION_PATTERNS:
+            if pattern.search(tail):
+                return slot
+
+    info = flow_state.collected_info
+    if flow_state.current_step == TravelFlowState.STEP_DATES and not info.get("start_date"):
+        return SLOT_DATES
+    if flow_state.current_step == TravelFlowState.STEP_BUDGET and not info.get("budget"):
+        return SLOT_BUDGET
+    if flow_state.current_step == TravelFlowState.STEP_PEOPLE:
+        if not info.get("people_count"):
+            return SLOT_PEOPLE
+        if not flow_state.departure_time:
+            return SLOT_DEPARTURE_TIME
+        if not flow_state.departure_location:
+            return SLOT_DEPARTURE_LOCATION
+    return None
+
+
+def _looks_like_place(location: str, message: str) -> bool:
+    """지명 사전에 있거나, 장소 끝말(역/공항/동…)이거나, "~에서 출발" 이라고 명시한 경우만 장소로 본다
+
+    "배고파", "잠깐 기다려" 같은 짧은 말이 출발 장소로 저장되지 않도록.
+    """
+    if _EXPLICIT_DEPARTURE_RE.search(message):
+        return True
+    if _PLACE_SUFFIX_RE.search(location.replace(" ", "")):
+        return True
+    from agents.utils.gazetteer import get_gazetteer
+    return get_gazetteer().lookup(location) is not None
+
+
+def _parse_departure_location(message: str) -> Optional[str]:
+    """"서울역", "서울역에서 출발할게" → "서울역" (장소로 보이는 짧은 이름만 허용)"""
+    location = _LOCATION_SUFFIX_RE.sub("", message.strip()).strip()
+    if not location or location in _NON_ANSWERS or len(location) > 15 or len(location.split()) > 3:
+        return None
+    if not re.fullmatch(r"[가-힣A-Za-z0-9\s]+", location) or location.isdigit():
+        return None
+    if not _looks_like_place(location, message):
+        return None
+    return location
+
+
+def _fill(flow_state: TravelFlowState, slot: str, message: str) -> Optional[str]:
+    """슬롯 채우기 → 확인 문구 (못 채우면 None)"""
+    info = flow_state.collected_info
+
+    if slot == SLOT_DEPARTURE_LOCATION:
+        location = _parse_departure_location(message)
+        if not location:
+            return None
+        flow_state.departure_location = location
+        flow_state.current_step = TravelFlowState.STEP_RESTAURANT
+        return f"{location}에서 출발이다냥! 📍"
+
+    slots = parse_slots(message)
+    if needs_llm_fallback(message, slots):
+        return None
+    confident = {key: value for key, value in slots.items() if value.confidence >= SLOT_CONFIDENCE_THRESHOLD}
+
+    if slot == SLOT_DATES:
+        if "start_date" not in confident or "end_date" not in confident:
+            return None  # "2박 3일" 만 있으면 날짜를 다시 물어봐야 함 → Coordinator
+        start, end = confident["start_date"].value, confident["end_date"].value
+        info["start_date"] = start.strftime(DATE_FORMAT)
+        info["end_date"] = end.strftime(DATE_FORMAT)
+        flow_state.total_days = (end - start).days + 1
+        flow_state.nights = flow_state.total_days - 1
+        flow_state.current_step = TravelFlowState.STEP_BUDGET
+        period = "당일치기" if flow_state.nights == 0 else f"{flow_state.nights}박 {flow_state.total_days}일"
+        return f"{info['start_date']} ~ {end.strftime('%m/%d')}, {period} 일정이다냥! 📅"
+
+    if slot == SLOT_BUDGET:
+        if "budget" not in confident:
+            return None
+        budget = confident["budget"]
+        info["budget"] = f"1인당 {format_won(budget.value)}" if budget.text.startswith("1인당") else format_won(budget.value)
+        flow_state.current_step = TravelFlowState.STEP_PEOPLE
+        return f"예산 {info['budget']} 알겠다냥! 💰"
+
+    if slot == SLOT_PEOPLE:
+        if "people_count" not in confident:
+            return None
+        info["people_count"] = confident["people_count"].value
+        flow_state.current_step = TravelFlowState.STEP_PEOPLE
+        return "혼자 떠나는 여행이다냥! 🐾" if info["people_count"] == 1 else f"{info['people_count']}명이서 가는 거다냥! 🐾"
+
+    if slot == SLOT_DEPARTURE_TIME:
+        if "departure_time" not in confident:
+            return None
+        flow_state.departure_time = confident["departure_time"].value
+        return f"{flow_state.departure_time} 출발이다냥! ⏰"
+
+    return None
+
+
+def try_fast_path(flow_state: TravelFlowState, message: str,
+                  last_ai_message: Optional[str] = None) -> Optional[Dict[str, str]]:
+    """빠른 경로로 처리할 수 있으면 {"slot", "response"} 반환, 아니면 None
+
+    FlowState 는 처리에 성공한 경우에만 바뀐다.
+    """
+    if not FAST_PATH_ENABLED or not message or _ESCAPE_RE.search(message):
+        return None
+
+    from agents.tool_selector import detect_intent_groups
+    if detect_intent_groups(message):
+        return None  # 맛집/숙소 같은 도메인 요청이 섞여 있음
+
+    slot = detect_pending_slot(flow_state, last_ai_message)
+    if slot is None:
+        return None
+
+    acknowledgement = _fill(flow_state, slot, message)
+    if acknowledgement is None:
+        return None
+
+    next_question = NEXT_QUESTIONS[_NEXT_SLOT[slot]]
+    return {"slot": slot, "response": f"좋다냥! 😸 {acknowledgement}\n\n{next_question}"}
@@ -3,7 +3,9 @@ Travel Flow State Management
 여행 계획 플로우의 상태를 추적하고 관리하는 클래스
 """
 
-from typing import Optional, Dict, Any, List
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Dict, Any, Iterator, List
 from datetime import datetime
 
 
@@ -61,6 +63,65 @@ class TravelFlowState:
             'accommodation_recommendations': None,
             'landmark_recommendations': None
         }
+        # 마지막으로 보여준 추천 목록 카테고리 ("2번" 처럼 카테고리 없이 고를 때 기준)
+        self.last_recommendation_category: Optional[str] = None
+        
+        # 일차별 선택 항목 {"1": {category: [place_ids]}} (JSON 직렬화 후에도 같은 키가 되도록 문자열)
+        self.daily_selections: Dict[str, Dict[str, List[str]]] = {}
+        # 고른 장소 place_id → {name, address} (추천 목록이 다음 검색으로 바뀌어도 일정표에 쓸 수 있게)
+        self.selected_places: Dict[str, Dict[str, Any]] = {}
+    
+    def store_recommendations(self, category: str, places: List[Dict[str, Any]]) -> None:
+        """에이전트가 보여준 추천 목록 저장 (place_id 포함 카드, 표시 순서 그대로)"""
+        self.agent_results[f'{category}_recommendations'] = places
+        self.last_recommendation_category = category
+    
+    def get_recommendations(self) -> Dict[str, List[Dict[str, Any]]]:
+        """카테고리 → 저장된 추천 목록 (비어 있는 카테고리 제외)"""
+        return {
+            key[:-len('_recommendations')]: places
+            for key, places in self.agent_results.items()
+            if key.endswith('_recommendations') and isinstance(places, list) and places
+        }
+    
+    def add_selection(self, category: str, place_ids: List[str],
+                      places: Optional[List[Dict[str, Any]]] = None) -> None:
+        """현재 일차에 선택 항목 추가
+
+        맛집은 점심 → 저녁 순으로 두 번 고르므로 누적, 나머지 카테고리는 다시 고르면 교체.
+        places 를 주면 일정표용으로 이름/주소를 같이 저장한다.
+        """
+        day_selections = self.daily_selections.setdefault(str(self.current_day), {})
+        if category == 'restaurant':
+            previous = day_selections.get(category, [])
+            place_ids = previous + [place_id for place_id in place_ids if place_id not in previous]
+        day_selections[category] = place_ids
+        for place in places or []:
+            if place.get('place_id'):
+                self.selected_places[place['place_id']] = {
+                    'name': place.get('name'), 'address': place.get('address')
+                }
+    
+    def get_day_selections(self, day: int) -> Dict[str, List[Dict[str, Any]]]:
+        """일차별 선택 장소 → generate_daily_itinerary 의 selections 형식
+
+        맛집은 고른 순서대로 첫 번째가 점심, 나머지가 저녁.
+        """
+        selections: Dict[str, List[Dict[str, Any]]] = {}
+        for category, place_ids in self.daily_selections.get(str(day), {}).items():
+            places = [self.selected_places.get(place_id) or {'name': place_id} for place_id in place_ids]
+            if category == 'restaurant':
+                selections['lunch'], selections['dinner'] = places[:1], places[1:]
+            else:
+                selections[category] = places
+        return selections
+    
+    def get_excluded_place_ids(self, category: str) -> List[str]:
+        """이전 일차에서 선택한 장소 ID 목록 반환 (중복 방지)"""
+        excluded = []
+        for day in range(1, self.current_day):
+            excluded.extend(self.daily_selections.get(str(day), {}).get(category, []))
+        return excluded
     
     def pause_flow(self) -> None:
         """플로우 일시 정지 (예외 처리 시작)"""
@@ -182,18 +243,35 @@ class TravelFlowState:
         return None
 
 
-# 세션별 FlowState 저장소
-flow_states: Dict[str, TravelFlowState] = {}
+# Coordinator 턴 동안의 FlowState (세션 인자가 없는 툴에서 읽음, 예: call_itinerary_generator)
+_current_flow_state: ContextVar[Optional[TravelFlowState]] = ContextVar("flow_state", default=None)
+
+
+@contextmanager
+def use_flow_state(flow_state: TravelFlowState) -> Iterator[TravelFlowState]:
+    """현재 턴 범위에서 FlowState 지정 (툴이 다른 스레드에서 실행돼도 컨텍스트가 복사되어 같은 값)"""
+    token = _current_flow_state.set(flow_state)
+    try:
+        yield flow_state
+    finally:
+        _current_flow_state.reset(token)
+
+
+def current_flow_state() -> Optional[TravelFlowState]:
+    """현재 턴의 FlowState (턴 밖이면 None)"""
+    return _current_flow_state.get()
 
 
+# 세션별 FlowState 는 agents.session_store 가 관리 (LRU + 유휴 TTL)
 def get_flow_state(session_id: str) -> TravelFlowState:
     """세션 ID로 FlowState 가져오기 (없으면 생성)"""
-    if session_id not in flow_states:
-        flow_states[session_id] = TravelFlowState()
-    return flow_states[session_id]
+    from agents.session_store import session_store
+    return session_store.get_or_create(session_id).flow_state
 
 
 def reset_flow_state(session_id: str) -> None:
     """FlowState 초기화"""
-    if session_id in flow_states:
-        del flow_states[session_id]
+    from agents.session_store import session_store
+    session = session_store.get(session_id)
+    if session is not None:
+        session.flow_state = TravelFlowState()
@@ -6,6 +6,9 @@ Travel Flow State Management - V2 (일차별 플로우)
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
+from agents.session_store import SESSION_MAX_COUNT, SESSION_IDLE_TTL
+from agents.utils.ttl_cache import TTLCache
+
 
 class TravelFlowState:
     """여행 계획 플로우 상태 관리"""
@@ -205,18 +208,20 @@ class TravelFlowState:
         return None
 
 
-# 세션별 FlowState 저장소
-flow_states: Dict[str, TravelFlowState] = {}
+# 세션별 FlowState 저장소 (LRU + 유휴 TTL, agents.session_store 와 같은 설정값 사용)
+flow_states = TTLCache(maxsize=SESSION_MAX_COUNT, ttl=SESSION_IDLE_TTL, name="flow_state_v2")
 
 
 def get_flow_state(session_id: str) -> TravelFlowState:
     """세션 ID로 FlowState 가져오기 (없으면 생성)"""
-    if session_id not in flow_states:
-        flow_states[session_id] = TravelFlowState()
-    return flow_states[session_id]
+    flow_state = flow_states.get(session_id)
+    if flow_state is None:
+        flow_state = TravelFlowState()
+    # 조회할 때마다 다시 넣어서 유휴 TTL 갱신
+    flow_states.set(session_id, flow_state)
+    return flow_state
 
 
 def reset_flow_state(session_id: str) -> None:
     """FlowState 초기화"""
-    if session_id in flow_states:
-        del flow_states[session_id]
+    flow_states.pop(session_id)
@@ -1,7 +1,10 @@
 """LangGraph 통합 워크플로우 - Supervisor Pattern"""
 from typing import Literal, Optional, Dict, List
 from langgraph.graph import StateGraph, END
-from langchain_openai import ChatOpenAI
+from agents.utils.llm_registry import get_chat_model
+from agents.utils.llm_cache import cached_llm_call
+from agents.utils.cat_speech import to_cat_speech, missing_slot_question, welcome_message
+from agents.utils.selection_resolver import resolve_selection, run_place_action
 from langchain_core.messages import HumanMessage, AIMessage
 from dotenv import load_dotenv
 import os
@@ -15,8 +18,8 @@ load_dotenv(env_path)
 
 # LLM을 함수 내부에서 초기화하도록 변경 (lazy initialization)
 def get_llm():
-    """LLM 인스턴스를 반환합니다 (lazy initialization)"""
-    return ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    """LLM 인스턴스를 반환합니다 (프로세스 전역 레지스트리에서 공유)"""
+    return get_chat_model("gpt-4o-mini", temperature=0, purpose="graph")
 
 
 # ============================================================================
@@ -39,8 +42,39 @@ def check_missing_required_info(required_info: Dict) -> Optional[str]:
     return None
 
 
+def _extract_required_info_locally(user_input: str, current_info: Dict) -> bool:
+    """규칙 기반 슬롯 파서로 날짜/출발 시간/예산 추출
+
+    Returns:
+        True 면 LLM 추출이 필요 없음 (파서가 입력을 전부 확실하게 읽음)
+    """
+    from agents.slot_parser import parse_slots, needs_llm_fallback, format_won, DATE_FORMAT, SLOT_CONFIDENCE_THRESHOLD
+    
+    slots = parse_slots(user_input)
+    confident = {key: slot for key, slot in slots.items() if slot.confidence >= SLOT_CONFIDENCE_THRESHOLD}
+    
+    if "start_date" in confident:
+        start = confident["start_date"].value.strftime(DATE_FORMAT)
+        end = confident["end_date"].value.strftime(DATE_FORMAT) if "end_date" in confident else None
+        current_info["dates"] = f"{start}~{end}" if end and end != start else start
+    elif "days" in confident:
+        current_info["dates"] = confident["days"].text
+    if "departure_time" in confident:
+        current_info["departure_time"] = confident["departure_time"].value
+    if "budget" in confident:
+        current_info["budget"] = format_won(confident["budget"].value)
+    
+    return not needs_llm_fallback(user_input, slots)
+
+
 def extract_required_info(user_input: str, current_info: Dict) -> Dict:
-    """사용자 입력에서 필수 정보 추출"""
+    """사용자 입력에서 필수 정보 추출 (규칙 기반 파서 우선, 애매할 때만 LLM)"""
+    before = dict(current_info)
+    if _extract_required_info_locally(user_input, current_info):
+        print(f"⚡ 슬롯 파서로 추출 완료 (LLM 생략): {current_info}")
+        return current_info
+    
+    local_keys = {key for key in current_info if current_info.get(key) != before.get(key)}
     llm = get_llm()
     
     prompt = f"""
@@ -58,13 +92,14 @@ def extract_required_info(user_input: str, current_info: Dict) -> Dict:
     JSON만 반환하세요:
     """
     
-    response = llm.invoke(prompt)
+    # temperature=0 → 같은 입력이면 같은 결과 (프롬프트 해시 캐시)
+    content = cached_llm_call("graph.extract_required_info", llm, prompt)
     try:
         import json
-        extracted = json.loads(response.content)
-        # 기존 정보와 병합
+        extracted = json.loads(content)
+        # 기존 정보와 병합 (슬롯 파서가 이미 확실하게 읽은 값은 유지)
         for key, value in extracted.items():
-            if value and value != "null":
+            if value and value != "null" and not (key in local_keys and current_info.get(key)):
                 current_info[key] = value
     except:
         pass
@@ -96,8 +131,30 @@ def classify_intent_with_llm(user_input: str) -> str:
     의도만 답하세요 (한 단어):
     """
     
-    response = llm.invoke(prompt)
-    return response.content.strip().lower()
+    content = cached_llm_call("graph.classify_intent", llm, prompt)
+    return content.strip().lower()
+
+
+# ============================================================================
+# 후속 요청 (state 의 agent_results 에 남은 추천 결과 재사용)
+# ============================================================================
+
+# travel_planner 도메인 노드 이름 ↔ selection_resolver 카테고리
+_DOMAIN_CATEGORIES = {"restaurant": "restaurant", "dessert": "cafe", "accommodation": "accommodation", "landmark": "landmark"}
+
+
+def detect_followup(user_input: str, agent_results: Dict) -> Optional[Dict]:
+    """후속 요청 감지: "아까 그 두 번째 식당 리뷰 보여줘" → {"category", "action", "place"} (아니면 None)"""
+    recommendations = {
+        category: (agent_results.get(domain) or {}).get("places") or []
+        for domain, category in _DOMAIN_CATEGORIES.items()
+    }
+    selection = resolve_selection(
+        user_input, recommendations, _DOMAIN_CATEGORIES.get(agent_results.get("last_domain"))
+    )
+    if not selection or not selection["action"]:
+        return None
+    return {"category": selection["category"], "action": selection["action"], "place": selection["places"][0]}
 
 
 # ============================================================================
@@ -113,7 +170,6 @@ def supervisor_node(state: TravelPlannerState) -> TravelPlannerState:
     3. 사용자 의도 파악
     4. 적절한 에이전트로 라우팅 또는 직접 응답
     """
-    llm = get_llm()
     user_input = state["user_input"]
     
     # Phase 1: 필수 정보 수집
@@ -127,34 +183,16 @@ def supervisor_node(state: TravelPlannerState) -> TravelPlannerState:
         # 누락된 정보 확인
         missing = check_missing_required_info(state["required_info"])
         
+        # 질문/환영 문구는 템플릿 사용 (예전에는 한 줄 질문마다 LLM 호출)
         if missing:
             # 목적지 질문 시 Region Agent 호출
-            if "destination" in missing or "목적지" in missing:
-                prompt = f"""
-                사용자에게 어디로 여행 가고 싶은지 물어보세요.
-                
-                규칙:
-                - 짧고 간결하게
-                - 예시 포함: "예: 부산, 제주도, 강릉 등"
-                - 고양이 말투: 문장 끝에만 "냥" 붙이기
-                - 예시: "어디로 가고 싶다냥? (예: 부산, 제주도, 강릉 등)"
-                """
-                response = llm.invoke(prompt)
-                state["final_response"] = response.content
+            if missing == "목적지":
+                state["final_response"] = missing_slot_question(missing)
                 state["next_agent"] = "region"  # Region Agent 호출
                 return state
             
             # 부족한 정보 질문
-            prompt = f"""
-            사용자에게 {missing} 정보를 물어보세요.
-            
-            규칙:
-            - 매우 짧고 간결하게 (한 문장)
-            - 고양이 말투: 문장 끝에만 "냥" 붙이기
-            - 예시: "언제 출발한다냥?", "예산은 얼마냥?"
-            """
-            response = llm.invoke(prompt)
-            state["final_response"] = response.content
+            state["final_response"] = missing_slot_question(missing)
             state["next_agent"] = "chat"  # 직접 응답
             return state
         else:
@@ -164,16 +202,17 @@ def supervisor_node(state: TravelPlannerState) -> TravelPlannerState:
             
             # 환영 메시지
             dest = state["required_info"]["destination"]
-            prompt = f"""
-            사용자가 {dest} 여행을 계획하고 있습니다.
-            필수 정보를 모두 받았으니, 이제 맛집, 카페, 숙소, 관광지 등을 추천해줄 수 있다고 알려주세요.
-            귀여운 고양이 말투로 (~냥) 친근하게 말하세요.
-            """
-            response = llm.invoke(prompt)
-            state["final_response"] = response.content
+            state["final_response"] = welcome_message(dest)
             state["next_agent"] = "chat"
             return state
     
+    # Phase 2: 이전 추천 결과를 가리키는 후속 요청이면 에이전트 재실행 없이 처리
+    followup = detect_followup(user_input, state.get("agent_results") or {})
+    if followup:
+        state["followup_request"] = followup
+        state["next_agent"] = "followup"
+        return state
+    
     # Phase 2: 선호도 수집 - 의도 파악
     intent = classify_intent_with_llm(user_input)
     state["next_agent"] = intent
@@ -185,37 +224,36 @@ def supervisor_node(state: TravelPlannerState) -> TravelPlannerState:
 # 에이전트 노드들
 # ============================================================================
 
-def restaurant_agent_node(state: TravelPlannerState) -> TravelPlannerState:
-    """Restaurant ReAct Agent 호출"""
+def _run_domain_agent(state: TravelPlannerState, domain: str, graph, error_text: str) -> TravelPlannerState:
+    """도메인 그래프 호출 + 추천 장소 목록을 agent_results 에 저장 (후속 요청에 사용)"""
+    from agents.utils.place_collector import collect_places_for_turn
+    
     try:
-        from Langgraph.restaurant_langgraph import restaurant_graph
-        
-        result = restaurant_graph.invoke({
-            "messages": [("user", state["user_input"])]
-        })
+        with collect_places_for_turn() as collector:
+            result = graph.invoke({"user_input": state["user_input"]})
         
-        state["agent_results"]["restaurant"] = result
-        state["final_response"] = result["messages"][-1].content
+        state["agent_results"][domain] = {
+            "query": state["user_input"],
+            "places": collector.places,
+        }
+        state["agent_results"]["last_domain"] = domain
+        state["final_response"] = result["final_response"]
     except Exception as e:
-        state["final_response"] = f"맛집 정보를 찾는 중 문제가 생겼어냥... 😿 ({str(e)})"
+        state["final_response"] = f"{error_text} 😿 ({str(e)})"
     
     return state
 
 
+def restaurant_agent_node(state: TravelPlannerState) -> TravelPlannerState:
+    """Restaurant ReAct Agent 호출"""
+    from Langgraph.restaurant_langgraph import restaurant_graph
+    return _run_domain_agent(state, "restaurant", restaurant_graph, "맛집 정보를 찾는 중 문제가 생겼어냥...")
+
+
 def landmark_agent_node(state: TravelPlannerState) -> TravelPlannerState:
-    """Landmark Agent 호출"""
-    try:
-        from Langgraph.landmark_langgraph import LandmarkWorkflow
-        
-        workflow = LandmarkWorkflow()
-        response = workflow.run(state["user_input"])
-        
-        state["agent_results"]["landmark"] = {"response": response}
-        state["final_response"] = response
-    except Exception as e:
-        state["final_response"] = f"관광지 정보를 찾는 중 문제가 생겼어냥... 😿 ({str(e)})"
-    
-    return state
+    """Landmark ReAct Agent 호출"""
+    from Langgraph.landmark_langgraph import landmark_graph
+    return _run_domain_agent(state, "landmark", landmark_graph, "관광지 정보를 찾는 중 문제가 생겼어냥...")
 
 
 def region_agent_node(state: TravelPlannerState) -> TravelPlannerState:
@@ -240,35 +278,21 @@ def region_agent_node(state: TravelPlannerState) -> TravelPlannerState:
 
 def dessert_agent_node(state: TravelPlannerState) -> TravelPlannerState:
     """Dessert/Cafe ReAct Agent 호출"""
-    try:
-        from Langgraph.dessert_langgraph import dessert_graph
-        
-        result = dessert_graph.invoke({
-            "messages": [("user", state["user_input"])]
-        })
-        
-        state["agent_results"]["dessert"] = result
-        state["final_response"] = result["messages"][-1].content
-    except Exception as e:
-        state["final_response"] = f"디저트/카페 정보를 찾는 중 문제가 생겴어냭... 😿 ({str(e)})"
-    
-    return state
+    from Langgraph.dessert_langgraph import dessert_graph
+    return _run_domain_agent(state, "dessert", dessert_graph, "디저트/카페 정보를 찾는 중 문제가 생겼어냥...")
 
 
 def accommodation_agent_node(state: TravelPlannerState) -> TravelPlannerState:
     """Accommodation ReAct Agent 호출"""
-    try:
-        from Langgraph.accommodation_langgraph import accommodation_graph
-        
-        result = accommodation_graph.invoke({
-            "messages": [("user", state["user_input"])]
-        })
-        
-        state["agent_results"]["accommodation"] = result
-        state["final_response"] = result["messages"][-1].content
-    except Exception as e:
-        state["final_response"] = f"숙소 정보를 찾는 중 문제가 생겴어냭... 😿 ({str(e)})"
-    
+    from Langgraph.accommodation_langgraph import accommodation_graph
+    return _run_domain_agent(state, "accommodation", accommodation_graph, "숙소 정보를 찾는 중 문제가 생겼어냥...")
+
+
+def followup_node(state: TravelPlannerState) -> TravelPlannerState:
+    """저장된 추천 결과의 place_id 로 리뷰/메뉴/상세 툴 바로 호출 (검색 에이전트 재실행 없음)"""
+    followup = state.get("followup_request") or {}
+    state["final_response"] = run_place_action(followup.get("category"), followup.get("action"), followup.get("place") or {})
+    state["followup_request"] = None
     return state
 
 
@@ -289,30 +313,14 @@ def chat_agent_node(state: TravelPlannerState) -> TravelPlannerState:
 # ============================================================================
 
 def cat_speech_node(state: TravelPlannerState) -> TravelPlannerState:
-    """모든 응답을 고양이 말투로 변환"""
-    llm = get_llm()
+    """모든 응답을 고양이 말투로 변환 (규칙 기반, LLM 호출 없음)"""
     original = state["final_response"]
     
     # 이미 고양이 말투면 그대로 반환
     if "냥" in original:
         return state
     
-    prompt = f"""
-    다음 텍스트를 귀여운 고양이 말투로 변환하세요.
-    
-    규칙:
-    - 문장 끝: "~냥", "~이냥?", "~하냥", "~다냥" 등
-    - 자연스럽고 귀여운 느낌
-    - 내용은 그대로 유지
-    - 너무 과하지 않게 (모든 문장에 냥을 붙이지 말고 적절히)
-    
-    원본: {original}
-    
-    고양이 말투:
-    """
-    
-    response = llm.invoke(prompt)
-    state["final_response"] = response.content
+    state["final_response"] = to_cat_speech(original)
     
     return state
 
@@ -326,7 +334,7 @@ def route_to_agent(state: TravelPlannerState) -> str:
     next_agent = state.get("next_agent", "chat")
     
     # 지원하는 에이전트 목록
-    supported_agents = ["restaurant", "landmark", "region", "dessert", "accommodation", "chat"]
+    supported_agents = ["restaurant", "landmark", "region", "dessert", "accommodation", "followup", "chat"]
     
     if next_agent in supported_agents:
         return next_agent
@@ -344,6 +352,7 @@ workflow.add_node("landmark", landmark_agent_node)
 workflow.add_node("region", region_agent_node)
 workflow.add_node("dessert", dessert_agent_node)
 workflow.add_node("accommodation", accommodation_agent_node)
+workflow.add_node("followup", followup_node)
 workflow.add_node("chat", chat_agent_node)
 workflow.add_node("cat_speech", cat_speech_node)
 
@@ -360,6 +369,7 @@ workflow.add_conditional_edges(
         "region": "region",
         "dessert": "dessert",
         "accommodation": "accommodation",
+        "followup": "followup",
         "chat": "chat"
     }
 )
@@ -370,6 +380,7 @@ workflow.add_edge("landmark", "cat_speech")
 workflow.add_edge("region", "cat_speech")
 workflow.add_edge("dessert", "cat_speech")
 workflow.add_edge("accommodation", "cat_speech")
+workflow.add_edge("followup", "cat_speech")
 workflow.add_edge("chat", "cat_speech")
 
 # 고양이 말투 → END
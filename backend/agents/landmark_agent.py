@@ -14,7 +14,11 @@ import logging
 from typing import Dict, Any, Optional, List
 from dotenv import load_dotenv
 import googlemaps
+from agents.utils.places_cache import CachedPlacesClient
+from agents.utils.gazetteer import geocode_region
 from schemas.data_models import TravelState, AgentResponse, PlaceData
+from agents.utils.place_collector import record_places
+from agents.utils.search_pipeline import SearchPipeline, start_web_search, collect_web_names, prefer_web_mentioned
 
 load_dotenv()
 logging.basicConfig(level=logging.INFO)
@@ -49,7 +53,10 @@ TOURIST_CATEGORIES = {
 }
 
 GOOGLE_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
-gmaps = googlemaps.Client(key=GOOGLE_API_KEY) if GOOGLE_API_KEY else None
+gmaps = CachedPlacesClient(googlemaps.Client(key=GOOGLE_API_KEY)) if GOOGLE_API_KEY else None
+
+# 검색 1회당 상세 정보 동시 조회 마감 시간(초)
+DETAIL_DEADLINE = float(os.getenv("LANDMARK_DETAIL_DEADLINE", "2.5"))
 
 # --- 랜드마크 에이전트 기능 (통합됨) ---
 
@@ -59,25 +66,16 @@ def search_landmarks(
     category: Optional[str] = None
 ) -> AgentResponse:
     """관광지 검색 전용 함수"""
+    pipeline = SearchPipeline("landmark")
     try:
         logger.info(f"🔍 관광지 검색: {region} (카테고리: {category}, 추가 선호: {preference})")
         
-        # 0. Serper 웹 검색 (선택적)
-        place_names_from_web = []
-        if preference:
-            try:
-                from agents.utils.serper_utils import search_with_serper, extract_place_names
-                search_query = f"{region} {preference} 관광지"
-                logger.info(f"🌐 Serper 검색: {search_query}")
-                serper_results = search_with_serper(search_query, num_results=10)
-                if serper_results:
-                    place_names_from_web = extract_place_names(serper_results, preference)
-                    logger.info(f"📝 웹 검색 결과: {len(place_names_from_web)}개")
-            except Exception as e:
-                logger.warning(f"⚠️ Serper 검색 실패: {e}")
+        # 0. Serper 웹 검색 (선택적) → Places 쿼리와 무관하므로 백그라운드에서 먼저 시작
+        web_searches = start_web_search(pipeline, region, preference, "관광지", with_general=False)
         
         # 1. 좌표 변환
-        result = gmaps.geocode(f"{region}, 대한민국", language="ko", region="KR")
+        with pipeline.stage("geocode"):
+            result = geocode_region(gmaps, region, region="KR")
         if not result:
             return AgentResponse(
                 success=False,
@@ -112,24 +110,22 @@ def search_landmarks(
             
         all_results = {}
 
-        for place_type in search_types:
-            try:
-                results = gmaps.places_nearby(
-                    location=(coords['lat'], coords['lng']),
-                    radius=5000,
-                    type=place_type,
-                    keyword=search_keyword,
-                    language="ko"
-                )
-                
-                # 결과 중복 제거 및 수집
-                for place in results.get('results', []):
-                    place_id = place['place_id']
-                    if place_id not in all_results:
-                        all_results[place_id] = place
-            except Exception as type_error:
-                logger.warning(f"타입 검색 실패 ({place_type}): {type_error}")
-                continue
+        # 타입별 nearby 검색은 서로 독립 → 동시에 (실패한 타입은 None)
+        def search_type(place_type: str) -> dict:
+            return gmaps.places_nearby(
+                location=(coords['lat'], coords['lng']),
+                radius=5000,
+                type=place_type,
+                keyword=search_keyword,
+                language="ko"
+            )
+        
+        for results in pipeline.fan_out("nearby", search_type, search_types):
+            # 결과 중복 제거 및 수집 (타입 순서 유지)
+            for place in (results or {}).get('results', []):
+                place_id = place['place_id']
+                if place_id not in all_results:
+                    all_results[place_id] = place
 
         unique_results = list(all_results.values())
         
@@ -148,22 +144,29 @@ def search_landmarks(
         import random
         top_candidates = sorted_results[:15]
         random.shuffle(top_candidates)
-        final_candidates = top_candidates[:10]
         
-        # 5. 상세 정보 로드 및 변환
+        # 웹 검색에 이름이 나온 곳 우선 (웹 검색은 마감 시간까지만 기다림)
+        place_names_from_web = collect_web_names(pipeline, web_searches)
+        if place_names_from_web:
+            logger.info(f"📝 웹 검색 결과: {len(place_names_from_web)}개")
+        final_candidates = prefer_web_mentioned(top_candidates, place_names_from_web)[:10]
+        
+        # 5. 상세 정보 로드 (동시에, 마감 초과/실패한 곳은 nearby 검색 요약 필드 사용)
+        def fetch_details(place_id: str) -> dict:
+            return gmaps.place(place_id, fields=[
+                'formatted_phone_number', 'website', 
+                'opening_hours', 'formatted_address', 'photo'
+            ], language="ko").get('result', {})
+        
+        all_details = pipeline.fan_out(
+            "details", fetch_details, [place['place_id'] for place in final_candidates], timeout=DETAIL_DEADLINE
+        )
+        
+        # 변환
         places = []
-        for place in final_candidates:
+        for place, details in zip(final_candidates, all_details):
             place_id = place['place_id']
-            # 상세 정보 요청 (필요한 필드만)
-            try:
-                details_result = gmaps.place(place_id, fields=[
-                    'formatted_phone_number', 'website', 
-                    'opening_hours', 'formatted_address', 'photo'
-                ], language="ko")
-                details = details_result.get('result', {})
-            except Exception as detail_error:
-                logger.warning(f"상세 정보 로드 실패 ({place.get('name')}): {detail_error}")
-                details = {}
+            details = details or {}
             
             # 카테고리 상세 분류
             place_types = place.get('types', [])
@@ -194,13 +197,14 @@ def search_landmarks(
                 google_maps_url=f"https://www.google.com/maps/place/?q=place_id:{place_id}"
             ))
         
-        return AgentResponse(
+        # 라우터가 장소 카드를 바로 만들 수 있도록 턴 수집기에 기록
+        return record_places(AgentResponse(
             success=True,
             agent_name="landmark",
             data=[p.model_dump() for p in places],
             count=len(places),
             message=f"{region} 관광지 {len(places)}곳을 찾았습니다!"
-        )
+        ))
         
     except Exception as e:
         logger.error(f"❌ 검색 실패: {e}")
@@ -210,6 +214,8 @@ def search_landmarks(
             message="검색 중 오류가 발생했습니다.",
             error=str(e)
         )
+    finally:
+        pipeline.finish()
 
 def get_landmark_detail(place_id: str) -> AgentResponse:
     """특정 장소의 상세 정보를 조회합니다."""
@@ -537,13 +543,13 @@ def find_nearby_landmarks(
                 description=f"{base_name}에서 {distance_text} 거리"
             ))
         
-        return AgentResponse(
+        return record_places(AgentResponse(
             success=True,
             agent_name="nearby",
             data=[p.model_dump() for p in places],
             count=len(places),
             message=f"{base_name} 주변 {len(places)}곳을 찾았습니다."
-        )
+        ))
         
     except Exception as e:
         logger.error(f"❌ 주변 관광지 검색 실패: {e}")
@@ -4,8 +4,10 @@ import json
 import os
 from typing import List, Optional
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
+from agents.utils.llm_registry import get_chat_model
 import googlemaps
+from agents.utils.places_cache import CachedPlacesClient
+from agents.utils.gazetteer import geocode_region
 from schemas.data_models import RegionInfo, AgentResponse
 
 load_dotenv()
@@ -16,13 +18,9 @@ logger = logging.getLogger(__name__)
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 GOOGLE_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
 
-llm = ChatOpenAI(
-    model="gpt-4o-mini",
-    temperature=0.7,
-    api_key=OPENAI_API_KEY
-) if OPENAI_API_KEY else None
+llm = get_chat_model("gpt-4o-mini", temperature=0.7, purpose="region_agent") if OPENAI_API_KEY else None
 
-gmaps = googlemaps.Client(key=GOOGLE_API_KEY) if GOOGLE_API_KEY else None
+gmaps = CachedPlacesClient(googlemaps.Client(key=GOOGLE_API_KEY)) if GOOGLE_API_KEY else None
 
 
 # 인기 도시 하드코딩 데이터 (즉시 응답)
@@ -373,7 +371,7 @@ def get_region_attractions(
         logger.info(f"🎯 명소 검색: {region}")
         
         # 1. 좌표 변환
-        geocode_result = gmaps.geocode(f"{region}, 대한민국", language="ko")
+        geocode_result = geocode_region(gmaps, region)
         if not geocode_result:
             return AgentResponse(
                 success=False,
@@ -2,11 +2,18 @@
 import os
 import logging
 import json
-from typing import List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
 import googlemaps
-from langchain_openai import ChatOpenAI
+from agents.utils.llm_registry import get_chat_model
 from schemas.data_models import PlaceData, AgentResponse
+from agents.utils.place_collector import record_places
+from agents.utils.places_cache import CachedPlacesClient
+from agents.utils.gazetteer import geocode_region
+from agents.utils.ttl_cache import TTLCache
+from agents.utils.search_pipeline import SearchPipeline, start_web_search, collect_web_names, prefer_web_mentioned
 
 load_dotenv()
 logging.basicConfig(level=logging.INFO)
@@ -16,23 +23,36 @@ logger = logging.getLogger(__name__)
 GOOGLE_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
-gmaps = googlemaps.Client(key=GOOGLE_API_KEY) if GOOGLE_API_KEY else None
-llm = ChatOpenAI(
-    model="gpt-4o-mini",
-    temperature=0.7,
-    api_key=OPENAI_API_KEY
-) if OPENAI_API_KEY else None
+gmaps = CachedPlacesClient(googlemaps.Client(key=GOOGLE_API_KEY)) if GOOGLE_API_KEY else None
+llm = get_chat_model("gpt-4o-mini", temperature=0.7, purpose="restaurant_agent") if OPENAI_API_KEY else None
 
-# API 호출 캐시 (성능 최적화)
-_place_cache = {}
+# Places API 응답은 gmaps(CachedPlacesClient) 가 공용 캐시에 저장 (agents/utils/places_cache.py)
 
-# LLM 결과 캐시 (성능 최적화 - 3-5초 → 0.1초)
-_llm_cache = {}
+# LLM 결과 캐시 (성능 최적화 - 3-5초 → 0.1초), 크기 제한 + 만료
+_llm_cache = TTLCache(
+    maxsize=int(os.getenv("RESTAURANT_LLM_CACHE_SIZE", "500")),
+    ttl=int(os.getenv("RESTAURANT_LLM_CACHE_TTL", str(24 * 3600))),
+    name="restaurant_llm"
+)
+
+# 검색 결과 상세 정보 동시 조회 (5개 순차 호출 → 왕복 1회 수준)
+DETAIL_CONCURRENCY = int(os.getenv("RESTAURANT_DETAIL_CONCURRENCY", "8"))
+DETAIL_DEADLINE = float(os.getenv("RESTAURANT_DETAIL_DEADLINE", "2.5"))  # 검색 1회당 상세 조회 마감 시간(초)
+DETAIL_FIELDS = [
+    'formatted_phone_number',
+    'website',
+    'opening_hours',
+    'formatted_address',
+    'photo',
+    'price_level'
+]
+
+_detail_executor = ThreadPoolExecutor(max_workers=DETAIL_CONCURRENCY, thread_name_prefix="restaurant-detail")
 
 
 def get_place_details(place_id: str, fields: list) -> dict:
     """
-    Google Places API 호출 with 캐싱
+    Google Places API 호출 (gmaps 공용 캐시 사용)
     
     Args:
         place_id: Place ID
@@ -41,23 +61,51 @@ def get_place_details(place_id: str, fields: list) -> dict:
     Returns:
         dict: Place details
     """
-    # 캐시 키 생성
-    cache_key = f"{place_id}:{','.join(sorted(fields))}"
-    
-    # 캐시에 있으면 반환
-    if cache_key in _place_cache:
-        return _place_cache[cache_key]
-    
-    # API 호출
     try:
-        result = gmaps.place(place_id, fields=fields, language='ko')['result']
-        _place_cache[cache_key] = result
-        return result
+        return gmaps.place(place_id, fields=fields, language='ko')['result']
     except Exception as e:
         logger.warning(f"API 호출 실패: {e}")
         return {}
 
 
+def fetch_details_concurrently(place_ids: List[str], fields: list,
+                               deadline: float = DETAIL_DEADLINE) -> Dict[str, dict]:
+    """
+    여러 장소의 상세 정보를 get_place_details(캐시) 로 동시에 조회
+    
+    Args:
+        place_ids: Place ID 리스트
+        fields: 필요한 필드 리스트
+        deadline: 캐시 미스 조회를 기다리는 최대 시간(초). 넘긴 장소는 결과에서 빠지고
+                  (호출부가 nearby 검색 요약 필드로 대체), 늦게 끝난 조회는 캐시에 남아 다음 검색에서 사용된다.
+    
+    Returns:
+        dict: {place_id: details} (마감 초과 / 실패한 장소는 없음)
+    """
+    started_at = time.monotonic()
+    details: Dict[str, dict] = {}
+    pending = {}
+    
+    for place_id in place_ids:
+        cached = gmaps.peek("place", place_id, fields=fields, language='ko')
+        if cached is not None:
+            details[place_id] = cached['result']
+        elif place_id not in pending.values():
+            pending[_detail_executor.submit(get_place_details, place_id, fields)] = place_id
+    
+    if pending:
+        done, not_done = wait(pending.keys(), timeout=deadline)
+        for future in done:
+            if future.result():
+                details[pending[future]] = future.result()
+        if not_done:
+            logger.warning(f"⏱️ 상세 정보 마감 초과: {len(not_done)}개는 검색 요약 정보로 대체")
+    
+    logger.info(f"📋 상세 정보 {len(details)}/{len(place_ids)}개 "
+                f"(API {len(pending)}회 동시, {(time.monotonic() - started_at) * 1000:.0f}ms)")
+    return details
+
+
 def detect_region_type(region: str) -> tuple[str, int]:
     """
     지역 타입을 감지하고 적절한 검색 반경 반환
@@ -109,6 +157,7 @@ def search_restaurants(
     Returns:
         AgentResponse: 맛집 리스트
     """
+    pipeline = SearchPipeline("restaurant")
     try:
         if not gmaps:
             return AgentResponse(
@@ -122,43 +171,12 @@ def search_restaurants(
         
         logger.info(f"🔍 맛집 검색: {region}")
         
-        # 0. Serper로 먼저 웹 검색 (유명한 가게 이름 추출)
-        place_names_from_web = []
-        try:
-            from agents.utils.serper_utils import search_with_serper, extract_place_names
-            
-            # 1차: 메뉴 특화 검색 (사용자 입력 그대로)
-            if preference:
-                search_query_specific = f"{region} {preference} 맛집"
-                logger.info(f"🌐 Serper 1차 검색 (메뉴 특화): {search_query_specific}")
-                serper_results = search_with_serper(search_query_specific, num_results=10)
-                
-                if serper_results:
-                    place_names_from_web = extract_place_names(serper_results, preference)
-                    logger.info(f"📝 1차 검색 결과: {len(place_names_from_web)}개")
-                
-                # 2차: 일반 검색 (결과가 부족하면)
-                if len(place_names_from_web) < 5:
-                    # 메뉴에서 카테고리 추출 (예: "토마토 파스타" → "파스타")
-                    general_category = preference.split()[-1] if ' ' in preference else preference
-                    
-                    if general_category != preference:  # 메뉴 특화와 다른 경우만
-                        search_query_general = f"{region} {general_category} 맛집"
-                        logger.info(f"🌐 Serper 2차 검색 (일반): {search_query_general}")
-                        serper_results_2 = search_with_serper(search_query_general, num_results=10)
-                        
-                        if serper_results_2:
-                            additional_names = extract_place_names(serper_results_2, general_category)
-                            # 중복 제거하고 추가
-                            for name in additional_names:
-                                if name not in place_names_from_web:
-                                    place_names_from_web.append(name)
-                            logger.info(f"📝 2차 검색 추가: {len(additional_names)}개 (총 {len(place_names_from_web)}개)")
-        except Exception as e:
-            logger.warning(f"⚠️ Serper 검색 실패 (Google Places만 사용): {e}")
+        # 0. Serper 웹 검색은 Places 쿼리와 무관 → 백그라운드에서 먼저 시작 (유명한 가게 이름 추출)
+        web_searches = start_web_search(pipeline, region, preference, "맛집")
         
         # 1. 좌표 변환
-        geocode_result = gmaps.geocode(f"{region}, 대한민국", language="ko")
+        with pipeline.stage("geocode"):
+            geocode_result = geocode_region(gmaps, region)
         if not geocode_result:
             return AgentResponse(
                 success=False,
@@ -194,7 +212,8 @@ def search_restaurants(
             search_params['keyword'] = preference
         
         all_results = []
-        results = gmaps.places_nearby(**search_params)
+        with pipeline.stage("nearby"):
+            results = gmaps.places_nearby(**search_params)
         all_results.extend(results.get('results', []))
         
         logger.info(f"📊 총 검색 결과: {len(all_results)}개")
@@ -256,32 +275,30 @@ def search_restaurants(
         import random
         top_candidates = sorted_results[:15]  # 상위 15개
         random.shuffle(top_candidates)  # 랜덤 섞기
-        final_results = top_candidates[:num_results]  # num_results 개 선택
+        
+        # 웹 검색에 이름이 나온 가게 우선 (웹 검색은 마감 시간까지만 기다림)
+        place_names_from_web = collect_web_names(pipeline, web_searches)
+        if place_names_from_web:
+            logger.info(f"📝 웹 검색 가게 이름: {len(place_names_from_web)}개")
+        final_results = prefer_web_mentioned(top_candidates, place_names_from_web)[:num_results]  # num_results 개 선택
         
         logger.info(f"🎯 랜덤 선택: {len(final_results)}개")
         
-        # 6. 상세 정보 로드
+        # 6. 상세 정보 로드 (동시 조회 + 마감 시간, 못 받은 곳은 nearby 검색 요약 필드 사용)
+        with pipeline.stage("details"):
+            all_details = fetch_details_concurrently([place['place_id'] for place in final_results], DETAIL_FIELDS)
+        
         places = []
         for place in final_results:
             place_id = place['place_id']
-            
-            # 상세 정보 가져오기
-            try:
-                details = gmaps.place(
-                    place_id,
-                    fields=[
-                        'formatted_phone_number',
-                        'website',
-                        'opening_hours',
-                        'formatted_address',
-                        'photo',
-                        'price_level'
-                    ],
-                    language='ko'
-                )['result']
-            except Exception as e:
-                logger.warning(f"⚠️ 상세 정보 로드 실패 ({place['name']}): {e}")
-                details = {}
+            details = all_details.get(place_id, {})
+            if not details:
+                # nearby 검색 결과에 있는 요약 필드 (주소 = vicinity, 영업 여부, 가격대, 사진)
+                details = {
+                    'price_level': place.get('price_level', 0),
+                    'opening_hours': place.get('opening_hours', {}),
+                    'photos': place.get('photos', []),
+                }
             
             # 사진 URL 생성
             photo_urls = []
@@ -316,13 +333,14 @@ def search_restaurants(
         
         logger.info(f"✅ 맛집 {len(places)}개 찾음!")
         
-        return AgentResponse(
+        # 라우터가 장소 카드를 바로 만들 수 있도록 턴 수집기에 기록
+        return record_places(AgentResponse(
             success=True,
             agent_name="restaurant",
             data=[p.dict() for p in places],
             count=len(places),
             message=f"{region} 맛집 {len(places)}개 찾음! 🎯"
-        )
+        ))
         
     except Exception as e:
         logger.error(f"❌ 맛집 검색 실패: {e}")
@@ -334,6 +352,8 @@ def search_restaurants(
             message="맛집 검색 중 오류 발생",
             error=str(e)
         )
+    finally:
+        pipeline.finish()
 
 
 def get_restaurant_reviews(place_id: str, num_reviews: int = 10) -> AgentResponse:
@@ -349,9 +369,10 @@ def get_restaurant_reviews(place_id: str, num_reviews: int = 10) -> AgentRespons
     """
     # LLM 캐시 확인
     cache_key = f"reviews:{place_id}:{num_reviews}"
-    if cache_key in _llm_cache:
+    cached = _llm_cache.get(cache_key)
+    if cached is not None:
         logger.info(f"⚡ 캐시 hit! 리뷰 요약 즉시 반환")
-        return _llm_cache[cache_key]
+        return cached
     
     try:
         if not gmaps:
@@ -438,7 +459,7 @@ JSON만 출력하고 다른 설명은 추가하지 마세요."""
             )
             
             # 캐시에 저장
-            _llm_cache[cache_key] = result
+            _llm_cache.set(cache_key, result)
             
             return result
             
@@ -478,9 +499,10 @@ def extract_menu(place_id: str, num_reviews: int = 20) -> AgentResponse:
     """
     # LLM 캐시 확인
     cache_key = f"menu:{place_id}:{num_reviews}"
-    if cache_key in _llm_cache:
+    cached = _llm_cache.get(cache_key)
+    if cached is not None:
         logger.info(f"⚡ 캐시 hit! 메뉴 추출 즉시 반환")
-        return _llm_cache[cache_key]
+        return cached
     
     try:
         if not gmaps:
@@ -565,7 +587,7 @@ JSON만 출력하고 다른 설명은 추가하지 마세요."""
             )
             
             # 캐시에 저장
-            _llm_cache[cache_key] = result
+            _llm_cache.set(cache_key, result)
             
             return result
             
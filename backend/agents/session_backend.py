@@ -0,0 +1,409 @@
+"""
+세션 상태 외부 저장소 (여러 uvicorn 워커 / 여러 서버 간 공유)
+
+SessionStore(agents/session_store.py)는 워커 프로세스 안의 캐시이고,
+실제 세션 상태(TravelFlowState + 대화 기록 + 페르소나)는 여기 백엔드에 저장된다.
+
+- SESSION_BACKEND=none (기본값, 단일 워커 - SessionStore 만 사용) | memory | sqlite | redis
+- 직렬화: JSON(공백 없는 구분자) + zlib 압축, 메시지는 [type, content] 쌍으로만 저장
+  date / datetime / set 은 태그를 붙여 그대로 복원, 그 밖에 JSON 으로 못 바꾸는 값은 TypeError
+- 낙관적 버전 관리: 저장할 때 읽어온 버전과 현재 버전이 다르면 SessionConflictError
+  (다른 워커가 같은 세션의 턴을 먼저 저장한 경우)
+
+Redis 백엔드는 redis 패키지 없이 RESP 프로토콜을 직접 구현했기 때문에
+Redis 호환 서버(로컬 대역 서버 포함)라면 어디든 붙일 수 있다.
+"""
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import date, datetime
+from typing import Any, Optional, Tuple
+from urllib.parse import urlparse
+
+from agents.utils.data_dir import data_path
+
+
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "none")
+SESSION_SQLITE_PATH = os.getenv("SESSION_SQLITE_PATH") or data_path("sessions.db")
+SESSION_REDIS_URL = os.getenv("SESSION_REDIS_URL", "redis://localhost:6379/0")
+SESSION_TTL = int(os.getenv("SESSION_BACKEND_TTL", str(7 * 24 * 3600)))
+
+SERIALIZATION_VERSION = 1
+
+
+class SessionConflictError(Exception):
+    """다른 워커가 같은 세션을 먼저 저장해서 버전이 맞지 않을 때 발생"""
+
+    def __init__(self, session_id: str, expected: int, actual: int):
+        super().__init__(f"세션 버전 충돌: {session_id} (expected={expected}, actual={actual})")
+        self.session_id = session_id
+        self.expected = expected
+        self.actual = actual
+
+
+# ==================== 직렬화 ====================
+
+def _encode_value(value: Any) -> Any:
+    """JSON 이 모르는 값 중 flow_state 에 들어갈 만한 것만 태그를 붙여 저장 (나머지는 TypeError)"""
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, (set, frozenset)):
+        return {"__set__": sorted(value, key=repr)}
+    raise TypeError(f"세션에 저장할 수 없는 값: {type(value).__name__} ({value!r})")
+
+
+def _decode_value(obj: dict) -> Any:
+    if len(obj) == 1:
+        if "__datetime__" in obj:
+            return datetime.fromisoformat(obj["__datetime__"])
+        if "__date__" in obj:
+            return date.fromisoformat(obj["__date__"])
+        if "__set__" in obj:
+            return set(obj["__set__"])
+    return obj
+
+
+def serialize_session(session) -> bytes:
+    """Session → 압축된 바이트"""
+    messages = [
+        [msg.type, msg.content if isinstance(msg.content, str) else str(msg.content)]
+        for msg in session.memory.chat_memory.messages
+    ]
+    payload = {
+        "v": SERIALIZATION_VERSION,
+        "user_id": session.user_id,
+        "flow": vars(session.flow_state),
+        "messages": messages,
+        "summary": session.memory.summary,
+        "memory_stats": session.memory.stats,
+        "persona": session.persona,
+        "persona_loaded": session.persona_loaded,
+    }
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=_encode_value)
+    return zlib.compress(raw.encode("utf-8"), 6)
+
+
+def restore_session(session, blob: bytes) -> None:
+    """압축된 바이트 → Session (기존 객체에 덮어쓰기)"""
+    from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+    from agents.flow_state import TravelFlowState
+
+    payload = json.loads(zlib.decompress(blob).decode("utf-8"), object_hook=_decode_value)
+
+    flow_state = TravelFlowState()
+    flow_state.__dict__.update(payload.get("flow") or {})
+    session.flow_state = flow_state
+
+    message_types = {"human": HumanMessage, "ai": AIMessage, "system": SystemMessage}
+    session.memory.clear()
+    session.memory.chat_memory.messages = [
+        message_types.get(msg_type, HumanMessage)(content=content)
+        for msg_type, content in payload.get("messages", [])
+    ]
+    session.memory.summary = payload.get("summary", "")
+    session.memory.stats.update(payload.get("memory_stats") or {})
+
+    session.user_id = payload.get("user_id", session.user_id)
+    session.persona = payload.get("persona")
+    session.persona_loaded = payload.get("persona_loaded", False)
+
+
+# ==================== 백엔드 ====================
+
+class SessionBackend:
+    """세션 백엔드 인터페이스
+
+    버전은 0부터 시작하고 저장할 때마다 1씩 증가한다. (0 = 저장된 적 없음)
+    """
+
+    name = "base"
+
+    def get_version(self, session_id: str) -> int:
+        raise NotImplementedError
+
+    def load(self, session_id: str) -> Optional[Tuple[int, bytes]]:
+        raise NotImplementedError
+
+    def save(self, session_id: str, expected_version: int, blob: bytes) -> int:
+        """expected_version 이 현재 버전과 같을 때만 저장하고 새 버전 반환 (다르면 SessionConflictError)"""
+        raise NotImplementedError
+
+    def delete(self, session_id: str) -> None:
+        raise NotImplementedError
+
+
+class InMemorySessionBackend(SessionBackend):
+    """프로세스 내부 백엔드 (같은 프로세스의 여러 스레드 / 테스트용, TTL + 개수 제한)"""
+
+    name = "memory"
+
+    def __init__(self, ttl: int = SESSION_TTL, maxsize: int = 10000):
+        from agents.utils.ttl_cache import TTLCache
+        self._data = TTLCache(maxsize=maxsize, ttl=ttl, name="session_backend")
+        self._lock = threading.Lock()
+
+    def get_version(self, session_id: str) -> int:
+        entry = self._data.get(session_id)
+        return entry[0] if entry else 0
+
+    def load(self, session_id: str) -> Optional[Tuple[int, bytes]]:
+        return self._data.get(session_id)
+
+    def save(self, session_id: str, expected_version: int, blob: bytes) -> int:
+        with self._lock:
+            current = self.get_version(session_id)
+            if current != expected_version:
+                raise SessionConflictError(session_id, expected_version, current)
+            self._data.set(session_id, (current + 1, blob))
+            return current + 1
+
+    def delete(self, session_id: str) -> None:
+        self._data.pop(session_id)
+
+
+class SQLiteSessionBackend(SessionBackend):
+    """SQLite 백엔드 (같은 서버의 여러 워커가 파일 하나를 공유)"""
+
+    name = "sqlite"
+
+    def __init__(self, path: str = SESSION_SQLITE_PATH, ttl: int = SESSION_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._local = threading.local()
+        self._saves = 0
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                " session_id TEXT PRIMARY KEY,"
+                " version INTEGER NOT NULL,"
+                " data BLOB NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_updated ON sessions(updated_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 커넥션은 스레드 간 공유 불가 → 스레드별 커넥션
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get_version(self, session_id: str) -> int:
+        row = self._connect().execute(
+            "SELECT version FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def load(self, session_id: str) -> Optional[Tuple[int, bytes]]:
+        row = self._connect().execute(
+            "SELECT version, data FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        return (row[0], bytes(row[1])) if row else None
+
+    def save(self, session_id: str, expected_version: int, blob: bytes) -> int:
+        conn = self._connect()
+        now = time.time()
+        with conn:
+            if expected_version == 0:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO sessions (session_id, version, data, updated_at) VALUES (?, 1, ?, ?)",
+                    (session_id, blob, now)
+                )
+            else:
+                cursor = conn.execute(
+                    "UPDATE sessions SET version = version + 1, data = ?, updated_at = ?"
+                    " WHERE session_id = ? AND version = ?",
+                    (blob, now, session_id, expected_version)
+                )
+        if cursor.rowcount != 1:
+            raise SessionConflictError(session_id, expected_version, self.get_version(session_id))
+
+        # 가끔씩 오래된 세션 정리
+        self._saves += 1
+        if self._saves % 100 == 0:
+            with conn:
+                conn.execute("DELETE FROM sessions WHERE updated_at < ?", (now - self.ttl,))
+        return expected_version + 1
+
+    def delete(self, session_id: str) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+
+class RespClient:
+    """최소 RESP(Redis 직렬화 프로토콜) 클라이언트
+
+    GET/SET/DEL/WATCH/MULTI/EXEC 정도만 쓰므로 redis 패키지 대신 직접 구현.
+    """
+
+    def __init__(self, url: str = SESSION_REDIS_URL, timeout: float = 5.0):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int((parsed.path or "/0").lstrip("/") or 0)
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._buffer = b""
+
+    def _connect(self) -> None:
+        self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._buffer = b""
+        if self.password:
+            self._command("AUTH", self.password)
+        if self.db:
+            self._command("SELECT", str(self.db))
+
+    def close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+
+    def _readline(self) -> bytes:
+        while b"\r\n" not in self._buffer:
+            chunk = self._sock.recv(65536)
+            if not chunk:
+                raise ConnectionError("Redis 연결이 끊어졌습니다")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\r\n", 1)
+        return line
+
+    def _read_exact(self, length: int) -> bytes:
+        while len(self._buffer) < length + 2:
+            chunk = self._sock.recv(65536)
+            if not chunk:
+                raise ConnectionError("Redis 연결이 끊어졌습니다")
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:length], self._buffer[length + 2:]
+        return data
+
+    def _read_reply(self) -> Any:
+        line = self._readline()
+        prefix, rest = line[:1], line[1:]
+        if prefix == b"+":
+            return rest.decode()
+        if prefix == b"-":
+            raise RuntimeError(f"Redis 에러: {rest.decode()}")
+        if prefix == b":":
+            return int(rest)
+        if prefix == b"$":
+            length = int(rest)
+            return None if length < 0 else self._read_exact(length)
+        if prefix == b"*":
+            count = int(rest)
+            return None if count < 0 else [self._read_reply() for _ in range(count)]
+        raise RuntimeError(f"알 수 없는 RESP 응답: {line!r}")
+
+    def _command(self, *args: Any) -> Any:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self._sock.sendall(b"".join(parts))
+        return self._read_reply()
+
+    def execute(self, *args: Any, retry: bool = True) -> Any:
+        """명령 실행 (연결이 끊겼으면 한 번 재연결)
+
+        WATCH/MULTI 트랜잭션 도중에는 retry=False 로 호출해야 한다.
+        (재연결하면 WATCH 가 풀린 새 커넥션에서 명령이 실행되므로)
+        """
+        if self._sock is None:
+            self._connect()
+        try:
+            return self._command(*args)
+        except (ConnectionError, OSError):
+            self.close()
+            if not retry:
+                raise
+            self._connect()
+            return self._command(*args)
+
+
+class RedisSessionBackend(SessionBackend):
+    """Redis 프로토콜 백엔드 (여러 서버 간 공유)
+
+    키 구조: {prefix}{session_id}:v (버전), {prefix}{session_id}:d (데이터)
+    버전 키만 먼저 읽어서 로컬 캐시가 최신이면 데이터는 받지 않는다.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str = SESSION_REDIS_URL, ttl: int = SESSION_TTL, prefix: str = "localy:session:"):
+        self.ttl = ttl
+        self.prefix = prefix
+        self._client = RespClient(url)
+        # WATCH 는 커넥션 단위라서 트랜잭션 전체를 lock 으로 보호
+        self._lock = threading.Lock()
+
+    def _keys(self, session_id: str) -> Tuple[str, str]:
+        return f"{self.prefix}{session_id}:v", f"{self.prefix}{session_id}:d"
+
+    def get_version(self, session_id: str) -> int:
+        version_key, _ = self._keys(session_id)
+        with self._lock:
+            value = self._client.execute("GET", version_key)
+        return int(value) if value else 0
+
+    def load(self, session_id: str) -> Optional[Tuple[int, bytes]]:
+        version_key, data_key = self._keys(session_id)
+        with self._lock:
+            version, data = self._client.execute("MGET", version_key, data_key)
+        if not version or data is None:
+            return None
+        return int(version), data
+
+    def save(self, session_id: str, expected_version: int, blob: bytes) -> int:
+        version_key, data_key = self._keys(session_id)
+        with self._lock:
+            client = self._client
+            client.execute("WATCH", version_key)
+            try:
+                current = client.execute("GET", version_key, retry=False)
+                current = int(current) if current else 0
+                if current != expected_version:
+                    raise SessionConflictError(session_id, expected_version, current)
+
+                new_version = expected_version + 1
+                client.execute("MULTI", retry=False)
+                client.execute("SET", version_key, str(new_version), "EX", str(self.ttl), retry=False)
+                client.execute("SET", data_key, blob, "EX", str(self.ttl), retry=False)
+                result = client.execute("EXEC", retry=False)
+            except SessionConflictError:
+                client.execute("UNWATCH", retry=False)
+                raise
+            except Exception:
+                client.close()
+                raise
+
+        if result is None:
+            # WATCH 이후 다른 워커가 버전을 바꿈
+            raise SessionConflictError(session_id, expected_version, self.get_version(session_id))
+        return new_version
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._client.execute("DEL", *self._keys(session_id))
+
+
+def create_session_backend(kind: str = SESSION_BACKEND) -> Optional[SessionBackend]:
+    """환경 변수 SESSION_BACKEND 에 맞는 백엔드 생성 (none 이면 None → 외부 저장 안 함)"""
+    kind = (kind or "none").lower()
+    if kind == "memory":
+        return InMemorySessionBackend()
+    if kind == "sqlite":
+        return SQLiteSessionBackend()
+    if kind == "redis":
+        return RedisSessionBackend()
+    return None
@@ -0,0 +1,281 @@
+"""
+Coordinator 세션 저장소
+
+세션 하나 = TravelFlowState + 대화 메모리 + 페르소나.
+예전에는 coordinator.py / flow_state.py 의 모듈 전역 dict 에 따로따로 쌓여서 끝없이 커졌는데,
+이제는 세션 저장소 하나가 LRU + 유휴 TTL 로 관리한다.
+
+- SESSION_MAX_COUNT: 최대 세션 수 (넘으면 가장 오래 안 쓴 세션부터 제거)
+- SESSION_IDLE_TTL: 유휴 만료 시간(초)
+- SESSION_MAX_MEMORY_MB: 전체 세션 메모리 상한 (대화 기록/상태 크기 추정치 기준)
+- 세션별 lock: 같은 세션에 동시에 들어온 요청은 순서대로 처리 (다른 세션끼리는 경합 없음)
+- 턴 진행 중인 세션(turn() / acquire_turn())은 제거하지 않음 → 제거됐다가 새 Session 이 생겨서
+  lock 이 둘로 갈라지거나, 진행 중인 턴의 결과가 버려진 객체에 쓰이는 일이 없도록
+- 외부 백엔드(agents/session_backend.py)가 설정되어 있으면 워커 간 공유용 원본은 백엔드,
+  여기는 캐시 역할 (턴 시작 시 refresh, 턴 종료 시 persist)
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from agents.flow_state import TravelFlowState
+from agents.summary_memory import RollingSummaryMemory
+from agents.session_backend import (
+    SessionBackend, SessionConflictError, create_session_backend, serialize_session, restore_session
+)
+
+
+SESSION_MAX_COUNT = int(os.getenv("SESSION_MAX_COUNT", "1000"))
+SESSION_IDLE_TTL = int(os.getenv("SESSION_IDLE_TTL", str(2 * 3600)))
+SESSION_MAX_MEMORY_MB = float(os.getenv("SESSION_MAX_MEMORY_MB", "256"))
+
+
+def _new_memory() -> RollingSummaryMemory:
+    # 최근 N턴 원문 + 누적 요약, 토큰 예산 적용
+    return RollingSummaryMemory()
+
+
+class Session:
+    """Coordinator 세션 (FlowState + 대화 메모리 + 페르소나)"""
+
+    def __init__(self, session_id: str, user_id: str = "default_user"):
+        self.session_id = session_id
+        self.user_id = user_id
+        self.flow_state = TravelFlowState()
+        self.memory = _new_memory()
+        self.persona: Optional[Dict[str, Any]] = None
+        self.persona_loaded = False
+        self.lock = threading.RLock()
+        self.async_lock = asyncio.Lock()  # 이벤트 루프에서 시작한 턴끼리 순서 보장 (비동기 턴 + 스트리밍 턴)
+        self.created_at = time.time()
+        self.last_access = time.monotonic()
+        self.approx_bytes = 0
+        self.version = 0  # 외부 백엔드에 저장된 버전 (낙관적 버전 관리)
+        self.in_use = 0   # 진행 중 / 대기 중인 턴 수 (0 보다 크면 제거 대상에서 제외, store lock 으로 보호)
+
+    def reset(self) -> None:
+        """여행 계획 초기화 (페르소나는 유지)"""
+        self.flow_state = TravelFlowState()
+        self.memory.clear()
+
+    def estimate_size(self) -> int:
+        """세션 메모리 사용량 추정치 (바이트)
+
+        대부분 대화 기록 텍스트이므로 메시지 길이 + FlowState 문자열 길이로 근사한다.
+        """
+        size = 1024  # 객체 기본 오버헤드
+        for msg in self.memory.chat_memory.messages:
+            content = msg.content if isinstance(msg.content, str) else str(msg.content)
+            size += len(content.encode("utf-8")) + 200
+        size += len(self.memory.summary.encode("utf-8"))
+        size += len(str(self.flow_state.collected_info).encode("utf-8"))
+        size += len(str(self.flow_state.agent_results).encode("utf-8"))
+        return size
+
+
+class SessionStore:
+    """LRU + 유휴 TTL + 메모리 상한이 있는 세션 저장소"""
+
+    def __init__(self, max_sessions: int = SESSION_MAX_COUNT, idle_ttl: float = SESSION_IDLE_TTL,
+                 max_memory_mb: float = SESSION_MAX_MEMORY_MB, backend: Optional[SessionBackend] = None):
+        self.backend = backend
+        self.max_sessions = max(1, max_sessions)
+        self.idle_ttl = idle_ttl
+        self.max_bytes = int(max_memory_mb * 1024 * 1024)
+        self._sessions: "OrderedDict[str, Session]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+
+        # 메트릭
+        self.hits = 0
+        self.misses = 0
+        self.evicted_lru = 0
+        self.evicted_idle = 0
+        self.evicted_memory = 0
+        self.backend_loads = 0
+        self.backend_saves = 0
+        self.backend_conflicts = 0
+
+    def get_or_create(self, session_id: str, user_id: str = "default_user") -> Session:
+        """세션 조회 (없거나 만료되었으면 새로 생성)"""
+        with self._lock:
+            return self._get_or_create(session_id, user_id)
+
+    def _get_or_create(self, session_id: str, user_id: str) -> Session:
+        now = time.monotonic()
+        self._evict_idle(now)
+
+        session = self._sessions.get(session_id)
+        if session is not None:
+            self.hits += 1
+            self._sessions.move_to_end(session_id)
+        else:
+            self.misses += 1
+            session = Session(session_id, user_id)
+            self._sessions[session_id] = session
+            self._evict_over_capacity(keep=session_id)
+
+        session.last_access = now
+        return session
+
+    def acquire_turn(self, session_id: str, user_id: str = "default_user") -> Session:
+        """턴 시작: 세션 조회/생성 + 사용 중 표시 (release_turn 까지 제거되지 않음)"""
+        with self._lock:
+            session = self._get_or_create(session_id, user_id)
+            session.in_use += 1
+            return session
+
+    def release_turn(self, session: Session) -> None:
+        """턴 종료: 사용 중 표시 해제 + 마지막 사용 시각 갱신 (긴 턴이 LRU 맨 앞에 남지 않도록)"""
+        with self._lock:
+            session.in_use -= 1
+            session.last_access = time.monotonic()
+            if self._sessions.get(session.session_id) is session:
+                self._sessions.move_to_end(session.session_id)
+
+    @contextmanager
+    def turn(self, session_id: str, user_id: str = "default_user") -> Iterator[Session]:
+        session = self.acquire_turn(session_id, user_id)
+        try:
+            yield session
+        finally:
+            self.release_turn(session)
+
+    def get(self, session_id: str) -> Optional[Session]:
+        """세션 조회 (없으면 None, 생성하지 않음)"""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+                session.last_access = time.monotonic()
+            return session
+
+    def peek(self, session_id: str) -> Optional[Session]:
+        """조회 전용 세션 (없으면 None, 저장소에 추가하지 않음)
+
+        외부 백엔드가 있으면 다른 워커가 처리한 세션도 보이도록, 로컬에 없거나 로컬 버전이 뒤처졌을 때
+        백엔드에서 읽은 임시 Session 을 반환한다 (로컬 캐시는 건드리지 않음, 백엔드 I/O 라 스레드에서 호출).
+        """
+        session = self.get(session_id)
+        if self.backend is None:
+            return session
+        if session is not None and self.backend.get_version(session_id) == session.version:
+            return session
+        loaded = self.backend.load(session_id)
+        if loaded is None:
+            return session
+        transient = Session(session_id)
+        transient.version, blob = loaded
+        restore_session(transient, blob)
+        with self._lock:
+            self.backend_loads += 1
+        return transient
+
+    def update_size(self, session: Session) -> None:
+        """턴 종료 후 세션 크기 재계산 → 메모리 상한 초과 시 오래된 세션 제거"""
+        new_size = session.estimate_size()
+        with self._lock:
+            if self._sessions.get(session.session_id) is not session:
+                return
+            self._total_bytes += new_size - session.approx_bytes
+            session.approx_bytes = new_size
+            self._evict_over_capacity(keep=session.session_id)
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            if session is not None:
+                self._total_bytes -= session.approx_bytes
+
+    # ==================== 외부 백엔드 동기화 ====================
+    # 두 메서드 모두 session.lock 을 잡은 상태에서 호출해야 한다.
+
+    def refresh(self, session: Session) -> None:
+        """백엔드 버전이 로컬과 다르면 (다른 워커가 저장함) 최신 상태로 덮어쓰기"""
+        if self.backend is None:
+            return
+        if self.backend.get_version(session.session_id) == session.version:
+            return
+        loaded = self.backend.load(session.session_id)
+        if loaded is None:
+            return
+        session.version, blob = loaded
+        restore_session(session, blob)
+        with self._lock:
+            self.backend_loads += 1
+
+    def persist(self, session: Session) -> None:
+        """턴 결과를 백엔드에 저장 (충돌 시 최신 상태로 되돌리고 SessionConflictError)"""
+        if self.backend is None:
+            return
+        try:
+            session.version = self.backend.save(session.session_id, session.version, serialize_session(session))
+            with self._lock:
+                self.backend_saves += 1
+        except SessionConflictError:
+            with self._lock:
+                self.backend_conflicts += 1
+            self.refresh(session)
+            raise
+
+    # ==================== 제거 정책 ====================
+
+    def _remove(self, session_id: str) -> None:
+        session = self._sessions.pop(session_id)
+        self._total_bytes -= session.approx_bytes
+
+    def _evict_idle(self, now: float) -> None:
+        # OrderedDict 앞쪽이 가장 오래 안 쓴 세션 (턴 진행 중인 세션은 건너뜀)
+        for session_id, session in list(self._sessions.items()):
+            if now - session.last_access < self.idle_ttl:
+                break
+            if session.in_use:
+                continue
+            self._remove(session_id)
+            self.evicted_idle += 1
+
+    def _evict_over_capacity(self, keep: str) -> None:
+        # 방금 사용한 세션(keep)은 맨 뒤로 보내서 제거 대상에서 제외
+        # 턴 진행 중인 세션만 남으면 잠시 상한을 넘는 것을 허용
+        self._sessions.move_to_end(keep)
+        for session_id, session in list(self._sessions.items()):
+            over_count = len(self._sessions) > self.max_sessions
+            over_memory = self._total_bytes > self.max_bytes and len(self._sessions) > 1
+            if not (over_count or over_memory):
+                break
+            if session_id == keep or session.in_use:
+                continue
+            self._remove(session_id)
+            if over_count:
+                self.evicted_lru += 1
+            else:
+                self.evicted_memory += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "sessions": len(self._sessions),
+                "max_sessions": self.max_sessions,
+                "idle_ttl": self.idle_ttl,
+                "approx_memory_mb": round(self._total_bytes / (1024 * 1024), 2),
+                "max_memory_mb": round(self.max_bytes / (1024 * 1024), 2),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evicted_lru": self.evicted_lru,
+                "evicted_idle": self.evicted_idle,
+                "evicted_memory": self.evicted_memory,
+                "backend": self.backend.name if self.backend else "none",
+                "backend_loads": self.backend_loads,
+                "backend_saves": self.backend_saves,
+                "backend_conflicts": self.backend_conflicts,
+            }
+
+
+# 전역 세션 저장소
+session_store = SessionStore(backend=create_session_backend())
@@ -0,0 +1,468 @@
+"""
+한국어 슬롯 파서 (날짜 / 출발 시간 / 예산 / 인원) - 규칙 기반, LLM 호출 없음
+
+"이번 주말", "12월 15일-17일", "2박 3일", "오후 2시", "50만원", "4명" 같은 표현은
+정해진 패턴이라서 GPT 에 JSON 추출을 맡길 필요가 없다.
+
+- parse_slots(text): 슬롯별 값 + 원문 + 신뢰도(confidence)
+- needs_llm_fallback(text, slots): 신뢰도가 낮은 슬롯이 있거나, 파서가 못 읽은 내용(목적지 등)이 남아 있으면 True
+- apply_slots_to_flow_state(flow_state, slots): TravelFlowState.collected_info 에 바로 채움
+  (start_date / end_date 는 Coordinator 와 같은 "%Y/%m/%d" 형식)
+"""
+import os
+import re
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+SLOT_CONFIDENCE_THRESHOLD = float(os.getenv("SLOT_CONFIDENCE_THRESHOLD", "0.8"))
+
+DATE_FORMAT = "%Y/%m/%d"
+
+MAX_TRIP_NIGHTS = int(os.getenv("SLOT_MAX_TRIP_NIGHTS", "30"))
+
+
+class SlotValue(BaseModel):
+    """파싱된 슬롯 하나"""
+    value: Any
+    text: str          # 원문에서 매칭된 부분
+    confidence: float  # 0.0 ~ 1.0
+
+
+# ==================== 숫자 ====================
+
+_SINO_DIGITS = {"일": 1, "이": 2, "삼": 3, "사": 4, "오": 5, "육": 6, "칠": 7, "팔": 8, "구": 9}
+_SINO_UNITS = {"십": 10, "백": 100, "천": 1000}
+_NATIVE_NUMBERS = {
+    "한": 1, "하나": 1, "두": 2, "둘": 2, "세": 3, "셋": 3, "네": 4, "넷": 4, "다섯": 5, "여섯": 6,
+    "일곱": 7, "여덟": 8, "아홉": 9, "열": 10, "열한": 11, "열두": 12,
+}
+_NATIVE_PATTERN = "|".join(sorted(_NATIVE_NUMBERS, key=len, reverse=True))
+
+
+def _sino_number(text: str) -> Optional[int]:
+    """한자어 수 읽기 ("오십" → 50, "백" → 100, "삼십오" → 35)"""
+    total, current = 0, 0
+    for ch in text:
+        if ch in _SINO_DIGITS:
+            current = _SINO_DIGITS[ch]
+        elif ch in _SINO_UNITS:
+            total += (current or 1) * _SINO_UNITS[ch]
+            current = 0
+        else:
+            return None
+    return total + current or None
+
+
+def format_won(amount: int) -> str:
+    """500000 → "50만원", 1250000 → "125만원", 35000 → "3만 5,000원\""""
+    if amount >= 10000:
+        man, rest = divmod(amount, 10000)
+        return f"{man}만원" if rest == 0 else f"{man}만 {rest:,}원"
+    return f"{amount:,}원"
+
+
+# ==================== 날짜 ====================
+
+_WEEKDAYS = {"월": 0, "화": 1, "수": 2, "목": 3, "금": 4, "토": 5, "일": 6}
+
+_DATE_RANGE_RE = re.compile(
+    r"(\d{1,2})\s*월\s*(\d{1,2})\s*일?\s*(?:부터|에서|[-~–])\s*(?:(\d{1,2})\s*월\s*)?(\d{1,2})\s*일"
+)
+_DAY_RANGE_RE = re.compile(r"(?<![\d월])(\d{1,2})\s*일?\s*[-~–]\s*(\d{1,2})\s*일(?!\s*(?:동안|간))")
+_MONTH_DAY_RE = re.compile(r"(\d{1,2})\s*월\s*(\d{1,2})\s*일")
+_FULL_DATE_RE = re.compile(r"(\d{4})\s*[./-]\s*(\d{1,2})\s*[./-]\s*(\d{1,2})")
+_SLASH_DATE_RE = re.compile(r"(?<![\d./])(\d{1,2})/(\d{1,2})(?![\d/])")
+_RELATIVE_DAY_RE = re.compile(r"오늘|내일|모레|글피")
+_WEEKEND_RE = re.compile(r"(이번|다음|담)\s*주\s*말|주말")
+_WEEKDAY_RE = re.compile(r"(?:(이번|다음|담)\s*주\s*)?([월화수목금토일])요일")
+
+_NIGHTS_DAYS_RE = re.compile(r"(\d+)\s*박\s*(\d+)\s*일")
+_SINO_NIGHTS_DAYS_RE = re.compile(r"([일이삼사오육칠])\s*박\s*([일이삼사오육칠팔])\s*일")
+_NIGHTS_RE = re.compile(r"(\d+)\s*박(?!\s*\d)")
+_DAYS_RE = re.compile(r"(\d+)\s*일\s*(?:동안|간)")
+_DAY_TRIP_RE = re.compile(r"당일\s*(?:치기|여행)")
+
+_RELATIVE_OFFSETS = {"오늘": 0, "내일": 1, "모레": 2, "글피": 3}
+
+
+def _future_date(year: int, month: int, day: int, today: date) -> Optional[date]:
+    """연도 없는 월/일 → 오늘 이후 가장 가까운 날짜 (지난 날짜면 내년)"""
+    try:
+        value = date(year, month, day)
+        if value < today:
+            value = date(year + 1, month, day)
+        return value
+    except ValueError:
+        return None
+
+
+def _date_mentions(text: str, today: date) -> List[Tuple[int, int, date, float, str]]:
+    """텍스트 안의 날짜 언급 (start, end, 날짜, 신뢰도, 종류) - 위치 순서, 겹치는 매칭 제거"""
+    found: List[Tuple[int, int, date, float, str]] = []
+
+    for m in _DATE_RANGE_RE.finditer(text):
+        start = _future_date(today.year, int(m.group(1)), int(m.group(2)), today)
+        end_month = int(m.group(3) or m.group(1))
+        if start:
+            end = _future_date(start.year, end_month, int(m.group(4)), start)
+            found.append((m.start(), m.start(3) if m.group(3) else m.start(4), start, 0.95, "absolute"))
+            if end:
+                found.append((m.start(4), m.end(), end, 0.95, "absolute"))
+
+    for m in _DAY_RANGE_RE.finditer(text):
+        # 월 없이 "15~17일" → 이번 달(지났으면 다음 달)
+        first, last = int(m.group(1)), int(m.group(2))
+        month = today.month if first >= today.day else today.month % 12 + 1
+        year = today.year + (1 if month < today.month else 0)
+        start = _future_date(year, month, first, today)
+        end = _future_date(year, month, last, start) if start else None
+        if start and end:
+            found.append((m.start(), m.start(2), start, 0.8, "absolute"))
+            found.append((m.start(2), m.end(), end, 0.8, "absolute"))
+
+    for m in _FULL_DATE_RE.finditer(text):
+        try:
+            value = date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+        except ValueError:
+            continue
+        # 연도를 직접 적은 날짜 - 이미 지난 날짜면 오타일 가능성이 높음
+        found.append((m.start(), m.end(), value, 0.95 if value >= today else 0.5, "dated"))
+
+    for m in _MONTH_DAY_RE.finditer(text):
+        value = _future_date(today.year, int(m.group(1)), int(m.group(2)), today)
+        if value:
+            found.append((m.start(), m.end(), value, 0.95, "absolute"))
+
+    for m in _SLASH_DATE_RE.finditer(text):
+        value = _future_date(today.year, int(m.group(1)), int(m.group(2)), today)
+        if value:
+            found.append((m.start(), m.end(), value, 0.85, "absolute"))
+
+    for m in _RELATIVE_DAY_RE.finditer(text):
+        found.append((m.start(), m.end(), today + timedelta(days=_RELATIVE_OFFSETS[m.group(0)]), 0.95, "relative"))
+
+    for m in _WEEKEND_RE.finditer(text):
+        saturday = today + timedelta(days=(5 - today.weekday()) % 7)
+        if today.weekday() == 6:
+            saturday = today - timedelta(days=1)  # 일요일에 "이번 주말" = 오늘
+        confidence = 0.9
+        if m.group(1) in ("다음", "담"):
+            saturday += timedelta(days=7)
+            confidence = 0.8  # 월요일의 "다음 주말" 은 이번 주말일 수도 있음
+        start = max(saturday, today)
+        found.append((m.start(), m.end(), start, confidence, "weekend"))
+
+    for m in _WEEKDAY_RE.finditer(text):
+        target = _WEEKDAYS[m.group(2)]
+        if m.group(1) in ("다음", "담"):
+            monday = today - timedelta(days=today.weekday()) + timedelta(days=7)
+            value, confidence = monday + timedelta(days=target), 0.85
+        elif m.group(1) == "이번":
+            monday = today - timedelta(days=today.weekday())
+            value, confidence = monday + timedelta(days=target), 0.85
+            if value < today:
+                value, confidence = value + timedelta(days=7), 0.7
+        else:
+            value, confidence = today + timedelta(days=(target - today.weekday()) % 7), 0.8
+        found.append((m.start(), m.end(), value, confidence, "weekday"))
+
+    # 위치 순서 + 먼저 나온(더 긴) 매칭 우선으로 겹침 제거
+    found.sort(key=lambda item: (item[0], -(item[1] - item[0])))
+    mentions, last_end = [], -1
+    for item in found:
+        if item[0] >= last_end:
+            mentions.append(item)
+            last_end = item[1]
+    return mentions
+
+
+def _parse_duration(text: str) -> Optional[Tuple[int, int, str, float]]:
+    """(박, 일, 원문, 신뢰도)"""
+    m = _NIGHTS_DAYS_RE.search(text)
+    if m:
+        nights, days = int(m.group(1)), int(m.group(2))
+        return nights, days, m.group(0), 0.95 if days == nights + 1 else 0.6
+    m = _SINO_NIGHTS_DAYS_RE.search(text)
+    if m:
+        nights, days = _SINO_DIGITS[m.group(1)], _SINO_DIGITS[m.group(2)]
+        return nights, days, m.group(0), 0.9 if days == nights + 1 else 0.6
+    m = _DAY_TRIP_RE.search(text)
+    if m:
+        return 0, 1, m.group(0), 0.95
+    m = _NIGHTS_RE.search(text)
+    if m:
+        nights = int(m.group(1))
+        return nights, nights + 1, m.group(0), 0.85
+    m = _DAYS_RE.search(text)
+    if m:
+        days = int(m.group(1))
+        return max(days - 1, 0), days, m.group(0), 0.85
+    return None
+
+
+# ==================== 시간 ====================
+
+_TIME_RE = re.compile(
+    r"(오전|오후|아침|저녁|밤|새벽|낮|점심)?\s*(\d{1,2}|" + _NATIVE_PATTERN + r")\s*시(?!간)"
+    r"\s*(?:(\d{1,2})\s*분|(반))?"
+)
+_CLOCK_RE = re.compile(r"(?<![\d:])([01]?\d|2[0-3]):([0-5]\d)(?![\d:])")
+_PM_MARKERS = ("오후", "저녁", "밤", "낮", "점심")
+
+
+def _parse_time(text: str) -> Optional[SlotValue]:
+    m = _CLOCK_RE.search(text)
+    if m:
+        return SlotValue(value=f"{int(m.group(1)):02d}:{m.group(2)}", text=m.group(0), confidence=0.9)
+    if "정오" in text:
+        return SlotValue(value="12:00", text="정오", confidence=0.95)
+
+    m = _TIME_RE.search(text)
+    if not m:
+        return None
+    marker, raw_hour = m.group(1), m.group(2)
+    hour = int(raw_hour) if raw_hour.isdigit() else _NATIVE_NUMBERS[raw_hour]
+    if hour > 24:
+        return None
+    minute = 30 if m.group(4) else int(m.group(3) or 0)
+
+    if hour == 12 and marker:
+        # "밤 12시"·"새벽 12시" 는 자정, "낮 12시"·"오후 12시" 는 정오
+        hour = 12 if marker in ("낮", "점심", "오후") else 0
+        confidence = 0.9
+    elif marker in _PM_MARKERS and hour < 12:
+        # "점심 11시" 는 그대로, "저녁 7시" → 19시
+        if not (marker in ("낮", "점심") and hour >= 11):
+            hour += 12
+        confidence = 0.95
+    elif marker in ("오전", "아침", "새벽"):
+        confidence = 0.95
+    elif hour >= 13:
+        confidence = 0.95
+    elif 7 <= hour <= 11:
+        confidence = 0.85  # 여행 출발 시각으로는 오전이 자연스러움
+    elif 1 <= hour <= 6:
+        hour += 12
+        confidence = 0.7   # "3시" → 오후일 가능성이 높지만 애매함
+    elif hour == 12:
+        confidence = 0.6   # "12시" 만으로는 낮인지 밤인지 알 수 없음
+    else:
+        confidence = 0.8
+
+    return SlotValue(value=f"{hour % 24:02d}:{minute:02d}", text=m.group(0).strip(), confidence=confidence)
+
+
+# ==================== 예산 ====================
+
+_MONEY_RE = re.compile(
+    r"(\d+(?:[.,]\d+)*|[일이삼사오육칠팔구십백천]+(?=\s*[만억]))\s*(억|천만|백만|만|천)?\s*(원)?"
+)
+_MONEY_UNITS = {"억": 100_000_000, "천만": 10_000_000, "백만": 1_000_000, "만": 10_000, "천": 1_000}
+
+
+def _parse_budget(text: str) -> Optional[SlotValue]:
+    best: Optional[SlotValue] = None
+    for m in _MONEY_RE.finditer(text):
+        raw, unit, won = m.group(1), m.group(2), m.group(3)
+        if not unit and not won:
+            continue
+        if raw.isdigit() or re.fullmatch(r"\d+(?:[.,]\d+)*", raw):
+            number = float(raw.replace(",", "")) if "," in raw else float(raw)
+        else:
+            number = _sino_number(raw)
+            if number is None:
+                continue
+        amount = int(number * _MONEY_UNITS.get(unit, 1))
+        if amount < 1000:
+            continue
+
+        if won:
+            confidence = 0.95
+        elif "예산" in text or "경비" in text:
+            confidence = 0.85
+        else:
+            confidence = 0.7  # "50만" 만 있으면 예산인지 애매함
+
+        # 범위("30~50만원")면 큰 쪽을 예산 상한으로
+        candidate = SlotValue(value=amount, text=m.group(0).strip(), confidence=confidence)
+        if best is None or candidate.value > best.value:
+            best = candidate
+
+    if best is not None and re.search(r"1\s*인\s*당|인당|한\s*명\s*당", text):
+        best.text = f"1인당 {best.text}"
+    return best
+
+
+# ==================== 인원 ====================
+
+_PEOPLE_RE = re.compile(r"(\d+)\s*(?:명|인)(?!\s*(?:당|실|분|용|석|승))")
+_NATIVE_PEOPLE_RE = re.compile(r"(" + _NATIVE_PATTERN + r")\s*(?:명|사람)")
+_PEOPLE_WORDS = [
+    (re.compile(r"혼자|나\s*혼자|혼행|1인\s*여행"), 1, 0.9),
+    (re.compile(r"둘이(?:서)?|커플|연인|부부|남자\s*친구|여자\s*친구|남친|여친"), 2, 0.85),
+    (re.compile(r"셋이(?:서)?"), 3, 0.9),
+    (re.compile(r"넷이(?:서)?"), 4, 0.9),
+]
+
+
+def _parse_people(text: str) -> Optional[SlotValue]:
+    m = _PEOPLE_RE.search(text)
+    if m and 0 < int(m.group(1)) <= 50:
+        return SlotValue(value=int(m.group(1)), text=m.group(0), confidence=0.95)
+    m = _NATIVE_PEOPLE_RE.search(text)
+    if m:
+        return SlotValue(value=_NATIVE_NUMBERS[m.group(1)], text=m.group(0), confidence=0.9)
+    for pattern, count, confidence in _PEOPLE_WORDS:
+        m = pattern.search(text)
+        if m:
+            return SlotValue(value=count, text=m.group(0), confidence=confidence)
+    return None
+
+
+# ==================== 공개 API ====================
+
+def parse_slots(text: str, today: Optional[date] = None) -> Dict[str, SlotValue]:
+    """텍스트에서 슬롯 추출
+
+    Returns:
+        {"start_date", "end_date", "nights", "days", "departure_time", "budget", "people_count"} 중 찾은 것만.
+        start_date / end_date 값은 datetime.date
+    """
+    text = text or ""
+    today = today or date.today()
+    slots: Dict[str, SlotValue] = {}
+
+    mentions = _date_mentions(text, today)
+    duration = _parse_duration(text)
+
+    if mentions:
+        start_pos, start_end, start, start_conf, _ = mentions[0]
+        slots["start_date"] = SlotValue(value=start, text=text[start_pos:start_end], confidence=start_conf)
+
+        if len(mentions) >= 2:
+            end_pos, end_end, end, end_conf, kind = mentions[1]
+            if kind == "absolute":
+                # 연도 없는 끝 날짜는 오늘이 아니라 시작 날짜 기준 ("2025/12/13 ~ 12/15")
+                end = _future_date(start.year, end.month, end.day, start) or end
+            elif end < start and kind == "weekday":
+                end += timedelta(days=7)  # "금요일부터 월요일까지"
+            if end >= start:
+                slots["end_date"] = SlotValue(value=end, text=text[end_pos:end_end], confidence=min(start_conf, end_conf))
+        elif duration:
+            nights, _, duration_text, duration_conf = duration
+            slots["end_date"] = SlotValue(
+                value=start + timedelta(days=nights), text=duration_text, confidence=min(start_conf, duration_conf)
+            )
+        elif mentions[0][4] == "weekend":
+            # "이번 주말" 만 있으면 토~일
+            end = start + timedelta(days=1 if start.weekday() == 5 else 0)
+            slots["end_date"] = SlotValue(value=end, text=text[start_pos:start_end], confidence=start_conf)
+
+    if duration:
+        nights, days, duration_text, duration_conf = duration
+        slots["nights"] = SlotValue(value=nights, text=duration_text, confidence=duration_conf)
+        slots["days"] = SlotValue(value=days, text=duration_text, confidence=duration_conf)
+    elif "start_date" in slots and "end_date" in slots:
+        days = (slots["end_date"].value - slots["start_date"].value).days + 1
+        confidence = slots["end_date"].confidence
+        slots["nights"] = SlotValue(value=days - 1, text=slots["end_date"].text, confidence=confidence)
+        slots["days"] = SlotValue(value=days, text=slots["end_date"].text, confidence=confidence)
+
+    if "nights" in slots and slots["nights"].value > MAX_TRIP_NIGHTS:
+        # 한 달 넘는 일정은 파싱 실수일 가능성이 높음 → LLM 에 다시 확인
+        for key in ("end_date", "nights", "days"):
+            if key in slots:
+                slots[key].confidence = min(slots[key].confidence, 0.5)
+
+    # 시간은 날짜 표현을 지운 뒤에 찾음 ("15일" 의 숫자가 시간으로 잡히지 않도록)
+    time_text = text
+    for pos, end_pos, *_ in mentions:
+        time_text = time_text[:pos] + " " * (end_pos - pos) + time_text[end_pos:]
+    departure_time = _parse_time(time_text)
+    if departure_time:
+        slots["departure_time"] = departure_time
+
+    budget = _parse_budget(text)
+    if budget:
+        slots["budget"] = budget
+
+    people = _parse_people(text)
+    if people:
+        slots["people_count"] = people
+
+    return slots
+
+
+# 슬롯 외에 남아도 되는 말 (조사/어미/군더더기)
+_FILLER_RE = re.compile(
+    r"^(?:출발|도착|예산|인원|여행|일정|날짜|시간|정도|쯤|부터|까지|이요|이에요|예요|입니다|이야|야|요|"
+    r"갈래|갈게|갈거야|가요|가려고|가고|갈|할게|할래|할거야|하고|예정|생각|이고|이랑|랑|하고|그리고|"
+    r"에|에서|으로|로|은|는|이|가|을|를|도|만|총|대략|약|최대|이하|이내|이상|한|명이서|이서|같이|"
+    r"있어|있어요|돼|되|됩니다|해|해요|해줘|좋아|좋겠어|ㅎ+|ㅋ+)+$"
+)
+
+
+def needs_llm_fallback(text: str, slots: Dict[str, SlotValue],
+                       threshold: float = SLOT_CONFIDENCE_THRESHOLD) -> bool:
+    """LLM 추출로 넘겨야 하는지
+
+    - 파싱한 슬롯 중 신뢰도가 낮은 게 있으면 True
+    - 슬롯 표현을 지우고 남은 말에 의미 있는 단어(목적지/출발지 등 파서가 모르는 정보)가 있으면 True
+    """
+    if any(slot.confidence < threshold for slot in slots.values()):
+        return True
+
+    residual = text or ""
+    for slot in slots.values():
+        if slot.text:
+            residual = residual.replace(slot.text.replace("1인당 ", ""), " ")
+    residual = re.sub(r"1\s*인\s*당|인당", " ", residual)
+    for token in re.findall(r"[가-힣A-Za-z]+", residual):
+        if len(token) >= 2 and not _FILLER_RE.match(token):
+            return True
+    return not slots
+
+
+def apply_slots_to_flow_state(flow_state, slots: Dict[str, SlotValue], message: str = "",
+                              threshold: float = SLOT_CONFIDENCE_THRESHOLD) -> List[str]:
+    """신뢰도 높은 슬롯을 TravelFlowState 에 반영
+
+    이미 채워진 값은 사용자가 바꾸겠다고 할 때("바꿔", "변경", "말고")만 덮어쓴다.
+    (맛집 단계의 "내일 점심" 같은 말이 여행 날짜를 바꾸지 않도록)
+
+    Returns:
+        채운 필드 이름 리스트
+    """
+    info = flow_state.collected_info
+    overwrite = any(keyword in message for keyword in ("바꿔", "변경", "수정", "말고", "바꿀"))
+    confident = {key: slot for key, slot in slots.items() if slot.confidence >= threshold}
+    filled: List[str] = []
+
+    def _set(key: str, value: Any) -> None:
+        if info.get(key) in (None, "", []) or overwrite:
+            if info.get(key) != value:
+                info[key] = value
+                filled.append(key)
+
+    if "start_date" in confident:
+        _set("start_date", confident["start_date"].value.strftime(DATE_FORMAT))
+    if "end_date" in confident:
+        _set("end_date", confident["end_date"].value.strftime(DATE_FORMAT))
+    if "budget" in confident:
+        budget = confident["budget"]
+        _set("budget", f"1인당 {format_won(budget.value)}" if budget.text.startswith("1인당") else format_won(budget.value))
+    if "people_count" in confident:
+        _set("people_count", confident["people_count"].value)
+
+    if "days" in confident and (not flow_state.total_days or overwrite):
+        flow_state.nights = confident["nights"].value
+        flow_state.total_days = confident["days"].value
+        filled.append("total_days")
+    if "departure_time" in confident and (not flow_state.departure_time or overwrite):
+        flow_state.departure_time = confident["departure_time"].value
+        filled.append("departure_time")
+
+    return filled
@@ -20,7 +20,8 @@ class TravelPlannerState(TypedDict):
     selected_items: Dict[str, List[Dict]]  # 사용자가 선택한 항목들 {restaurants: [...], cafes: [...], ...}
     
     # 에이전트 결과 (추천 목록)
-    agent_results: Dict[str, Any]  # {restaurant: [...], landmark: [...], ...}
+    agent_results: Dict[str, Any]  # {restaurant: {"query", "places": [PlaceData...]}, ..., "last_domain": str}
+    followup_request: Optional[Dict[str, Any]]  # 이전 결과를 가리키는 후속 요청 {"category", "action", "place"}
     
     # Phase 3: 최종 일정
     itinerary: Optional[Dict]
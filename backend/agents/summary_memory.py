@@ -0,0 +1,198 @@
+"""
+토큰 예산 기반 대화 메모리 (최근 N턴 원문 + 이전 대화 누적 요약)
+
+ConversationBufferMemory 는 대화 전체를 매 턴 프롬프트에 넣기 때문에
+10단계 여행 플로우 + 긴 마크다운 툴 결과가 쌓이면 턴마다 프롬프트가 커진다.
+
+- 최근 MEMORY_RECENT_TURNS 턴은 원문 그대로 유지
+- 그보다 오래된 턴은 누적 요약(summary)에 합침
+  → 새로 밀려난 턴만 기존 요약에 덧붙여 갱신 (전체 재요약 X)
+  → MEMORY_FOLD_BATCH 턴씩 모아서 접기 때문에 요약 LLM 호출은 몇 턴에 한 번
+- load_messages() 는 MEMORY_TOKEN_BUDGET 을 넘지 않도록 오래된 메시지부터 잘라서 반환
+- 세션별 토큰 사용량(프롬프트에 실제로 넣은 토큰 vs 전체 기록을 넣었다면 들었을 토큰) 기록
+"""
+import os
+from typing import Any, Dict, List, Optional
+
+from langchain_core.chat_history import InMemoryChatMessageHistory
+from langchain_core.messages import BaseMessage, SystemMessage
+
+
+MEMORY_RECENT_TURNS = int(os.getenv("MEMORY_RECENT_TURNS", "4"))
+MEMORY_FOLD_BATCH = int(os.getenv("MEMORY_FOLD_BATCH", "2"))
+MEMORY_TOKEN_BUDGET = int(os.getenv("MEMORY_TOKEN_BUDGET", "3000"))
+MEMORY_SUMMARY_MAX_TOKENS = int(os.getenv("MEMORY_SUMMARY_MAX_TOKENS", "400"))
+
+SUMMARY_PROMPT = """너는 여행 계획 챗봇의 대화 기록을 요약하는 역할이야.
+기존 요약에 새 대화 내용을 합쳐서 갱신된 요약을 만들어줘.
+
+규칙:
+- 사용자가 정한 정보(목적지, 세부 지역, 날짜, 예산, 인원, 출발 시간/장소)는 반드시 유지
+- 사용자가 고른 장소(식당/카페/숙소/관광지)와 일차 정보는 이름 그대로 유지
+- 추천만 되고 선택되지 않은 장소 목록, 인사말, 말투 표현은 생략
+- {max_tokens} 토큰 이내, 한국어 불릿 목록
+
+[기존 요약]
+{summary}
+
+[새 대화]
+{new_lines}
+
+[갱신된 요약]"""
+
+
+_encoding = None
+
+
+def count_tokens(text: str) -> int:
+    """토큰 수 계산 (tiktoken 없으면 한국어 기준 근사치)"""
+    global _encoding
+    if _encoding is None:
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding("o200k_base")  # gpt-4o 계열 인코딩
+        except Exception:
+            _encoding = False
+    if _encoding:
+        return len(_encoding.encode(text or ""))
+    return int(len(text or "") / 1.5) + 1
+
+
+def count_message_tokens(messages: List[BaseMessage]) -> int:
+    # 메시지당 역할/구분자 오버헤드 약 4토큰
+    return sum(count_tokens(m.content if isinstance(m.content, str) else str(m.content)) + 4 for m in messages)
+
+
+def _get_summary_llm():
+    from agents.utils.llm_registry import get_chat_model
+    return get_chat_model("gpt-4o-mini", temperature=0, purpose="memory_summary")
+
+
+class RollingSummaryMemory:
+    """최근 N턴 원문 + 누적 요약 메모리
+
+    ConversationBufferMemory 와 같은 save_context / clear / chat_memory.messages 인터페이스를 제공한다.
+    """
+
+    def __init__(self, recent_turns: int = MEMORY_RECENT_TURNS, token_budget: int = MEMORY_TOKEN_BUDGET,
+                 fold_batch: int = MEMORY_FOLD_BATCH, summary_max_tokens: int = MEMORY_SUMMARY_MAX_TOKENS):
+        self.recent_turns = max(1, recent_turns)
+        self.token_budget = token_budget
+        self.fold_batch = max(1, fold_batch)
+        self.summary_max_tokens = summary_max_tokens
+        self.chat_memory = InMemoryChatMessageHistory()
+        self.summary = ""
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {
+            "turns": 0,
+            "prompt_tokens_last": 0,      # 마지막 턴에 프롬프트로 넣은 기록 토큰
+            "prompt_tokens_total": 0,     # 누적
+            "full_history_tokens_last": 0,   # 전체 기록을 그대로 넣었다면 들었을 토큰
+            "full_history_tokens_total": 0,
+            "folded_tokens": 0,           # 요약으로 접힌 원문 토큰
+            "summary_tokens": 0,
+            "summary_calls": 0,
+        }
+
+    # ==================== 저장 ====================
+
+    def save_context(self, inputs: Dict[str, Any], outputs: Dict[str, Any]) -> None:
+        """한 턴 저장 후 필요하면 오래된 턴을 요약에 접기"""
+        self.chat_memory.add_user_message(str(inputs.get("input", "")))
+        self.chat_memory.add_ai_message(str(outputs.get("output", "")))
+        self.stats["turns"] += 1
+
+        # 턴 = human + ai 2개 메시지
+        if len(self.chat_memory.messages) > 2 * (self.recent_turns + self.fold_batch - 1):
+            self._fold()
+
+    def _fold(self) -> None:
+        """최근 N턴을 제외한 나머지를 기존 요약에 합친다 (새로 밀려난 부분만 요약)"""
+        messages = self.chat_memory.messages
+        cut = len(messages) - 2 * self.recent_turns
+        if cut <= 0:
+            return
+        old, recent = messages[:cut], messages[cut:]
+        self.stats["folded_tokens"] += count_message_tokens(old)
+
+        new_lines = "\n".join(
+            f"{'사용자' if m.type == 'human' else '챗봇'}: {m.content}" for m in old
+        )
+        try:
+            response = _get_summary_llm().invoke(SUMMARY_PROMPT.format(
+                max_tokens=self.summary_max_tokens,
+                summary=self.summary or "(없음)",
+                new_lines=new_lines
+            ))
+            self.summary = response.content.strip()
+            self.stats["summary_calls"] += 1
+        except Exception as e:
+            # 요약 실패 시에도 예산은 지켜야 하므로 원문 일부만 덧붙임
+            print(f"⚠️ 대화 요약 실패 (원문 일부로 대체): {e}")
+            self.summary = f"{self.summary}\n{new_lines}".strip()
+
+        self.summary = self._truncate(self.summary, self.summary_max_tokens)
+        self.stats["summary_tokens"] = count_tokens(self.summary)
+        self.chat_memory.messages = list(recent)
+
+    @staticmethod
+    def _truncate(text: str, max_tokens: int) -> str:
+        """토큰 상한을 넘으면 앞부분(오래된 내용)부터 잘라냄"""
+        while text and count_tokens(text) > max_tokens:
+            text = text[len(text) // 5:]
+        return text
+
+    # ==================== 로드 ====================
+
+    def load_messages(self, token_budget: Optional[int] = None) -> List[BaseMessage]:
+        """프롬프트에 넣을 대화 기록 (요약 + 최근 원문, 토큰 예산 이내)"""
+        budget = token_budget or self.token_budget
+        recent = list(self.chat_memory.messages)
+
+        summary_messages: List[BaseMessage] = []
+        if self.summary:
+            summary_messages = [SystemMessage(content=f"[이전 대화 요약]\n{self.summary}")]
+
+        used = count_message_tokens(summary_messages)
+        selected: List[BaseMessage] = []
+        # 최신 메시지부터 예산이 허락하는 만큼 채움
+        for message in reversed(recent):
+            tokens = count_message_tokens([message])
+            if used + tokens > budget:
+                if not selected and budget - used > 50:
+                    # 직전 응답 하나가 예산보다 길면 앞부분만 잘라서라도 넣음
+                    content = message.content if isinstance(message.content, str) else str(message.content)
+                    while content and count_tokens(content) + 4 > budget - used:
+                        content = content[:len(content) * 4 // 5]
+                    message = message.__class__(content=content + " …(생략)")
+                    selected.insert(0, message)
+                    used += count_message_tokens([message])
+                break
+            selected.insert(0, message)
+            used += tokens
+
+        # 비교용: 요약으로 접힌 원문까지 전부 넣었다면 들었을 토큰
+        full_tokens = self.stats["folded_tokens"] + count_message_tokens(recent)
+
+        self.stats["prompt_tokens_last"] = used
+        self.stats["prompt_tokens_total"] += used
+        self.stats["full_history_tokens_last"] = full_tokens
+        self.stats["full_history_tokens_total"] += full_tokens
+        return summary_messages + selected
+
+    def clear(self) -> None:
+        self.chat_memory.clear()
+        self.summary = ""
+        self.stats = self._empty_stats()
+
+    def get_stats(self) -> Dict[str, Any]:
+        saved = self.stats["full_history_tokens_total"] - self.stats["prompt_tokens_total"]
+        return {
+            **self.stats,
+            "recent_messages": len(self.chat_memory.messages),
+            "token_budget": self.token_budget,
+            "saved_tokens_total": max(0, saved),
+        }
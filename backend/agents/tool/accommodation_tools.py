@@ -19,9 +19,12 @@ from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from dotenv import load_dotenv
 import googlemaps
-from openai import OpenAI
+from agents.utils.places_cache import CachedPlacesClient
+from agents.utils.gazetteer import geocode_region
 from langchain.tools import tool
 from schemas.data_models import PlaceData, AgentResponse
+from agents.utils.place_collector import record_places
+from agents.utils.llm_registry import get_openai_client
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -33,8 +36,8 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 GOOGLE_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY")
-gmaps = googlemaps.Client(key=GOOGLE_API_KEY) if GOOGLE_API_KEY else None
-openai_client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+gmaps = CachedPlacesClient(googlemaps.Client(key=GOOGLE_API_KEY)) if GOOGLE_API_KEY else None
+openai_client = get_openai_client(OPENAI_API_KEY)  # 공유 커넥션 풀
 
 # 캐시 & 타임아웃 설정
 _price_cache = {}
@@ -446,7 +449,7 @@ def search_accommodations(
             logger.warning(f"  ⚠️ 웹 검색 실패, Google Places로 폴백: {e}")
         
         # 1. 좌표 변환
-        geocode_result = gmaps.geocode(f"{region}, 대한민국", language="ko")
+        geocode_result = geocode_region(gmaps, region)
         if not geocode_result:
             return AgentResponse(
                 success=False,
@@ -576,13 +579,14 @@ def search_accommodations(
             places.append(place_data)
             logger.info(f"✅ {place_data.name} - ⭐{place_data.rating}")
         
-        return AgentResponse(
+        # 라우터가 장소 카드를 바로 만들 수 있도록 턴 수집기에 기록
+        return record_places(AgentResponse(
             success=True,
             agent_name="accommodation",
             data=[p.model_dump() for p in places],
             count=len(places),
             message=f"{region} 숙소 {len(places)}곳 찾음! 🏨"
-        ).model_dump()
+        ).model_dump())
         
     except Exception as e:
         logger.error(f"❌ 숙소 검색 실패: {e}")
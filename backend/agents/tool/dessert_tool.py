@@ -4,6 +4,8 @@ from typing import Optional
 import sys
 import logging
 
+from agents.utils.passthrough import TOOL_PASSTHROUGH
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -15,7 +17,7 @@ logger = logging.getLogger(__name__)
 # ========================================
 # 툴 1: TOP 5 카페 통합 리포트
 # ========================================
-@tool
+@tool(return_direct=TOOL_PASSTHROUGH)  # 완성된 리포트 → LLM 재작성 없이 그대로 전달
 def recommend_top_5_desserts_tool(region: str, keyword: str, persona_data: Optional[dict] = None) -> str:
     """
     주변 카페/디저트 맛집 15곳을 검색하고, 평점과 리뷰를 분석해 
@@ -1,6 +1,8 @@
 """긴급정보 멀티 툴 - Agent 연동형 (병렬 처리 최적화)"""
 from langchain.tools import tool
 import googlemaps
+from agents.utils.places_cache import CachedPlacesClient
+from agents.utils.gazetteer import geocode_region
 import os
 from dotenv import load_dotenv
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -9,7 +11,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from agents.emergency_agent import get_emergency_info
 
 load_dotenv()
-gmaps = googlemaps.Client(key=os.getenv("GOOGLE_PLACES_API_KEY"))
+gmaps = CachedPlacesClient(googlemaps.Client(key=os.getenv("GOOGLE_PLACES_API_KEY")))
 
 # ========================================
 # 툴 1: 통합 긴급정보 (메인)
@@ -95,7 +97,7 @@ def handle_emergency_situation_tool(situation_type: str, current_location: str)
     if not gmaps: return {"error": "API 키 설정 필요"}
     
     try:
-        geocode = gmaps.geocode(f"{current_location}, 대한민국", language="ko")
+        geocode = geocode_region(gmaps, current_location)
         if not geocode: return {"error": "위치 찾기 실패", "guide": "정확한 지역명을 입력하세요."}
         
         coords = geocode[0]['geometry']['location']
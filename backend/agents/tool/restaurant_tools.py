@@ -2,8 +2,10 @@
 from langchain.tools import tool
 from typing import Optional, List
 
+from agents.utils.passthrough import TOOL_PASSTHROUGH
 
-@tool
+
+@tool(return_direct=TOOL_PASSTHROUGH)  # 완성된 마크다운 → LLM 재작성 없이 그대로 전달
 def search_restaurants_tool(
     region: str,
     preference: Optional[str] = None,
@@ -33,8 +35,7 @@ def search_restaurants_tool(
         str: 포맷된 맛집 리스트 (시그니처 메뉴 설명 포함)
     """
     from agents.restaurant_agent import search_restaurants
-    from langchain_openai import ChatOpenAI
-    import os
+    from agents.utils.llm_registry import get_chat_model
     
     # 최대 5개 제한
     num_results = min(num_results, 5)
@@ -56,7 +57,7 @@ def search_restaurants_tool(
     output = [f"🍽️ {greeting}**{region} 맛집** 추천드려요!\n"]
     
     # LLM으로 모든 맛집 설명 한 번에 생성 (최적화!)
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7, api_key=os.getenv("OPENAI_API_KEY"))
+    llm = get_chat_model("gpt-4o-mini", temperature=0.7, purpose="restaurant_description")
     
     # 모든 맛집 정보를 한 번에 전달
     restaurants_info = "\n".join([
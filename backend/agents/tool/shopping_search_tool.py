@@ -5,13 +5,15 @@ from typing import List, Dict, Any
 
 from dotenv import load_dotenv
 import googlemaps
+from agents.utils.places_cache import CachedPlacesClient
+from agents.utils.gazetteer import geocode_region
 from langchain_core.tools import tool
 
 load_dotenv()
 
 # Google Maps API 키
 GOOGLE_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
-gmaps = googlemaps.Client(key=GOOGLE_API_KEY) if GOOGLE_API_KEY else None
+gmaps = CachedPlacesClient(googlemaps.Client(key=GOOGLE_API_KEY)) if GOOGLE_API_KEY else None
 
 # 대형마트 제외 키워드 (편의점 필터링용)
 LARGE_MART_KEYWORDS = [
@@ -225,7 +227,7 @@ def search_shopping_places(
 
     try:
         # 1. 좌표 변환
-        geocode_result = gmaps.geocode(f"{region}, 대한민국", language="ko")
+        geocode_result = geocode_region(gmaps, region)
         if not geocode_result:
             print(f"❌ 지역을 찾을 수 없습니다: {region}")
             return []
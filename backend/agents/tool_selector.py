@@ -0,0 +1,132 @@
+"""
+Coordinator 툴 선택 단계
+
+Coordinator 에 툴이 25개 가까이 등록되어 있어서 LLM 호출마다 모든 함수 스키마가 프롬프트에 들어간다.
+현재 플로우 단계(TravelFlowState.current_step)와 가벼운 키워드 의도 신호로
+이번 턴에 필요한 툴 그룹만 골라서 노출한다.
+
+- 프롬프트 토큰 감소 → 첫 토큰 지연 감소
+- 엉뚱한 툴 호출(맛집 얘기 중에 숙소 검색 등) 감소
+"""
+from typing import Iterable, List, Optional, Tuple
+
+from agents.flow_state import TravelFlowState
+
+
+# 그룹 → 툴 이름 (등록되지 않은 툴 이름은 무시됨)
+TOOL_GROUPS = {
+    "core": ["call_chat_agent", "call_region_agent"],
+    "restaurant": [
+        "call_restaurant_agent",
+        "search_restaurants_tool",
+        "get_restaurant_reviews_tool",
+        "extract_menu_tool",
+        "verify_restaurant_tool",
+        "get_restaurant_details_tool",
+    ],
+    "cafe": [
+        "call_dessert_agent",
+        "recommend_top_5_desserts_tool",
+        "search_cafe_list_tool",
+        "analyze_cafe_detail_tool",
+        "analyze_cafe_price_tool",
+    ],
+    "accommodation": [
+        "call_accommodation_agent",
+        "search_accommodations",
+        "summarize_reviews",
+        "compare_booking_prices",
+        "get_recommended_accommodations",
+    ],
+    "landmark": [
+        "call_landmark_agent",
+        "search_places_tool",
+        "get_landmark_detail_tool",
+        "find_nearby_landmarks_tool",
+        "recommend_by_season_tool",
+        "recommend_by_time_tool",
+    ],
+    "itinerary": ["call_itinerary_generator"],
+}
+
+# 의도 신호가 전혀 없을 때: 세부 툴 대신 도메인 에이전트 래퍼만 노출 (7개)
+FALLBACK_TOOLS = [
+    "call_chat_agent",
+    "call_region_agent",
+    "call_restaurant_agent",
+    "call_dessert_agent",
+    "call_accommodation_agent",
+    "call_landmark_agent",
+    "call_itinerary_generator",
+]
+
+# 그룹별 의도 키워드
+INTENT_KEYWORDS = {
+    "restaurant": [
+        "맛집", "식당", "음식", "먹", "점심", "저녁", "아침", "식사", "메뉴", "레스토랑",
+        "한식", "일식", "중식", "양식", "고기", "해산물", "횟집", "국밥", "술집", "이자카야", "밥",
+    ],
+    "cafe": ["카페", "디저트", "커피", "빵", "베이커리", "케이크", "브런치", "빙수", "루프탑"],
+    "accommodation": [
+        "숙소", "호텔", "펜션", "리조트", "게스트하우스", "한옥스테이", "풀빌라", "글램핑",
+        "모텔", "숙박", "에어비앤비", "료칸", "오션뷰",
+    ],
+    "landmark": [
+        "관광", "명소", "가볼", "구경", "랜드마크", "볼거리", "여행지", "자연", "야경",
+        "박물관", "산책", "전시", "해수욕장", "공원", "사진",
+    ],
+    "itinerary": ["일정표", "일정 짜", "일정 만들", "스케줄", "동선", "코스"],
+}
+
+# 플로우 단계 → 기본 그룹
+STEP_GROUPS = {
+    TravelFlowState.STEP_RESTAURANT: ("restaurant",),
+    TravelFlowState.STEP_CAFE: ("cafe",),
+    TravelFlowState.STEP_ACCOMMODATION: ("accommodation",),
+    TravelFlowState.STEP_LANDMARK: ("landmark",),
+    TravelFlowState.STEP_ITINERARY: ("itinerary",),
+}
+
+
+def detect_intent_groups(text: str) -> List[str]:
+    """텍스트에서 키워드로 도메인 그룹 감지"""
+    if not text:
+        return []
+    return [group for group, keywords in INTENT_KEYWORDS.items() if any(k in text for k in keywords)]
+
+
+def select_tool_groups(flow_state: TravelFlowState, message: str,
+                       last_ai_message: Optional[str] = None) -> Tuple[str, ...]:
+    """이번 턴에 노출할 툴 그룹 선택
+
+    신호 우선순위:
+    1. 사용자 메시지의 키워드
+    2. 직전 챗봇 질문의 키워드 ("점심 뭐 먹고 싶냥?" → 사용자가 "일식" 이라고만 답해도 맛집 그룹)
+    3. 현재 플로우 단계
+
+    Returns:
+        정렬된 그룹 이름 튜플 (에이전트 변형 캐시 키로 사용). 신호가 없으면 빈 튜플.
+    """
+    groups = set(detect_intent_groups(message))
+    if not groups:
+        # 짧은 대답("일식", "2번")은 직전 질문의 맥락을 따른다
+        groups.update(detect_intent_groups(last_ai_message or ""))
+    groups.update(STEP_GROUPS.get(flow_state.current_step, ()))
+
+    if not groups:
+        return ()
+    return tuple(sorted(groups | {"core"}))
+
+
+def tool_names_for_groups(groups: Iterable[str]) -> List[str]:
+    """그룹 → 툴 이름 리스트 (그룹이 없으면 도메인 에이전트 래퍼만)"""
+    groups = list(groups)
+    if not groups:
+        return list(FALLBACK_TOOLS)
+
+    names: List[str] = []
+    for group in groups:
+        for name in TOOL_GROUPS.get(group, []):
+            if name not in names:
+                names.append(name)
+    return names
@@ -0,0 +1,221 @@
+"""
+고양이 말투 변환기 (규칙 기반) + 누락 정보 질문 템플릿
+
+예전에는 graph.py 의 cat_speech_node 가 최종 응답을 GPT 에 다시 보내서 "~냥" 어미만 붙였고,
+supervisor_node 도 "예산은 얼마냥?" 같은 한 줄 질문을 만들려고 LLM 을 호출했다.
+(supervisor 한 턴에 LLM 1~3번)
+
+- to_cat_speech(text): 문장 끝 어미(다/요/까/니/습니다/세요 ...)만 고양이 말투로 바꿈. 내용은 그대로.
+  * 질문("?")은 "~냥?", 평서문은 "~다냥", 명령/요청은 "~라냥"/"~달라냥"
+  * 마크다운 제목/표/코드 블록/링크 줄은 건드리지 않음
+  * 이모지는 문장 부호 뒤에 그대로 유지, 응답 전체에 이모지가 없으면 마지막에 하나 추가
+- SLOT_QUESTIONS / missing_slot_question(): 누락 정보 질문 템플릿 (coordinator 프롬프트 3~7단계 문구)
+- llm_cat_speech(text): 예전 LLM 변환 (비교/벤치마크용, test_cat_speech.py)
+"""
+import re
+from typing import Optional
+
+
+# ==================== 질문 템플릿 ====================
+
+SLOT_QUESTIONS = {
+    "destination": "어디로 여행 가고 싶냥? 😸\n(예: 부산, 제주도, 강릉 등)",
+    "dates": "언제 여행 가냥? 😸\n시작일이랑 종료일 알려달라냥!\n(예: 2025/12/13 ~ 12/15)",
+    "budget": "예산은 얼마나 있냥? 💰\n(예: 50만원, 100만원, 200만원)",
+    "people": "몇 명이서 가냥? 🐾",
+    "departure_time": "몇 시에 출발할 거냥? ⏰\n(예: 오전 9시, 아침 8시)",
+    "departure_location": "어디서 출발할 거냥? 📍\n(예: 서울역, 집, 인천공항)",
+    "restaurant": (
+        "이제 일차별 식사 계획 시작이다냥! 🍽️\n\n"
+        "1일차 점심에 뭐 먹고 싶냥? 🍽️\n"
+        "- 한식 (전통, 현대식, 퓨전)\n"
+        "- 일식 (초밥, 라멘, 이자카야)\n"
+        "- 양식 (파스타, 스테이크)\n"
+        "- 중식 (짜장, 마라탕)\n"
+        "- 아시안 (태국, 베트남)\n"
+        "- 특별한 거 (미슐랭, 오마카세)"
+    ),
+}
+
+# graph.check_missing_required_info 가 돌려주는 한글 이름 → 템플릿 키
+_MISSING_NAME_TO_SLOT = {
+    "목적지": "destination",
+    "출발지": "departure_location",
+    "출발 시간": "departure_time",
+    "여행 날짜/기간": "dates",
+    "예산": "budget",
+    "인원": "people",
+}
+
+
+def missing_slot_question(name: str) -> str:
+    """누락된 정보 이름("예산", "budget" 등) → 질문 문구"""
+    slot = _MISSING_NAME_TO_SLOT.get(name, name)
+    return SLOT_QUESTIONS.get(slot) or f"{name} 알려달라냥! 😸"
+
+
+def welcome_message(destination: str) -> str:
+    """필수 정보 수집 완료 후 안내"""
+    return (f"{destination} 여행 준비 끝이다냥! 😸\n"
+            f"이제 맛집, 카페, 숙소, 관광지 뭐든 추천해줄 수 있다냥! 뭐부터 볼까냥? 🐾")
+
+
+# ==================== 어미 변환 ====================
+
+_HANGUL_BASE = 0xAC00
+_JONG_BIEUP = 17   # ㅂ 받침
+_JONG_NIEUN = 4    # ㄴ 받침
+
+_EMOJI_RE = re.compile("[\U0001F300-\U0001FAFF☀-➿⭐❤]")
+# 문장 끝에 붙는 문장 부호 / 이모지 / 닫는 기호
+_TAIL_RE = re.compile(r"([\s.!?…~*)\]\"'」』]|" + _EMOJI_RE.pattern + r"|️)*$")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?…~])\s+")
+_SKIP_LINE_RE = re.compile(r"^\s*(#|\||```|>|https?://)")
+
+# '다' 로 끝나도 동사/형용사가 아닌 명사("바다", "다다")는 건드리지 않기 위한 앞 글자 목록
+_VERBAL_BEFORE_DA = set("었았였했겠있없이좋같많싶하되된한는간온본준갔왔났찾봤줬적렸쳤셨졌웠였")
+
+# 반말 어미 (뒤에 "냥"만 붙임) - "관광지", "동해" 같은 명사와 헷갈리는 글자는 제외
+_BANMAL_ENDINGS = ("어", "래", "게", "걸", "군", "네")
+
+# "-세요" 가 명령/권유("선택하세요", "골라보세요")인 동사 어간 끝 글자 - 나머지는 존댓말 평서문("멋지세요")
+_IMPERATIVE_BEFORE_SEYO = set("하보가오르리")
+# 물음표 없이도 질문인 "-세요" ("어디로 가고 싶으세요")
+_QUESTION_WORD_RE = re.compile(r"어디|언제|뭐|무엇|무슨|몇|누구|어떤|어떻게|얼마|왜")
+# 인사말은 따로 매핑 ("안녕하라냥" 방지)
+_GREETINGS = {"안녕하세요": "안녕하냥", "계세요": "계시라냥"}
+
+
+def _jong(ch: str) -> int:
+    code = ord(ch) - _HANGUL_BASE
+    return code % 28 if 0 <= code < 11172 else -1
+
+
+def _drop_jong(ch: str) -> str:
+    """받침 제거 ("합" → "하")"""
+    code = ord(ch) - _HANGUL_BASE
+    return chr(ord(ch) - code % 28) if 0 <= code < 11172 else ch
+
+
+def _rewrite_core(core: str, is_question: bool, has_terminal: bool = True) -> Optional[str]:
+    """문장 본문(문장 부호 제외)의 어미 변환. 바꿀 게 없으면 None
+
+    has_terminal: 문장 부호(. ! ? ~)로 끝났는지 - 반말 어미는 명사와 헷갈리므로 이때만 변환
+    """
+    if not core or core.endswith(("냥", "냐", "냥이", "냥냥")):
+        return None
+    if not ("가" <= core[-1] <= "힣"):
+        return None
+
+    # 합쇼체
+    if core.endswith("습니까"):
+        return core[:-3] + "냥"
+    if core.endswith("니까") and len(core) >= 3 and _jong(core[-3]) == _JONG_BIEUP:
+        return core[:-3] + _drop_jong(core[-3]) + "냥"          # 갑니까 → 가냥
+    if core.endswith("습니다"):
+        return core[:-3] + "다냥"
+    if core.endswith("니다") and len(core) >= 3 and _jong(core[-3]) == _JONG_BIEUP:
+        return core[:-3] + _drop_jong(core[-3]) + "다냥"        # 합니다 → 하다냥, 입니다 → 이다냥
+
+    # 해요체
+    if core.endswith("이에요"):
+        return core[:-3] + "이다냥" if not is_question else core[:-3] + "이냥"
+    if core.endswith(("예요", "에요")):
+        return core[:-2] + ("다냥" if not is_question else "냥")
+    if core.endswith("주세요"):
+        return core[:-3] + ("달라냥" if not is_question else "주냥")
+    if core.endswith("세요"):
+        for greeting, cat_greeting in _GREETINGS.items():
+            if core.endswith(greeting):
+                return core[:-len(greeting)] + cat_greeting
+        if is_question or _QUESTION_WORD_RE.search(core):
+            return core[:-2] + "냥"                              # 어디 가고 싶으세요 → 싶으냥
+        if len(core) >= 3 and core[-3] in _IMPERATIVE_BEFORE_SEYO:
+            return core[:-2] + "라냥"                            # 선택하세요 → 선택하라냥
+        stem = core[:-3] if core.endswith("으세요") else core[:-2]
+        return stem + "다냥"                                     # 멋지세요 → 멋지다냥
+    if core.endswith("까요"):
+        return core[:-1] + "냥"                                  # 갈까요 → 갈까냥
+    if core.endswith("나요"):
+        return core[:-2] + "냥"                                  # 있나요 → 있냥
+    if core.endswith("죠"):
+        return core[:-1] + "지냥"
+    if core.endswith("요") and len(core) >= 2:
+        return core[:-1] + "냥"                                  # 좋아요 → 좋아냥
+
+    # 해라체 / 반말
+    if core.endswith("줘"):
+        return core[:-1] + "달라냥" if not is_question else core + "냥"
+    if is_question and core.endswith(("니", "야")):
+        return core[:-1] + "냥"                                  # 뭐야? → 뭐냥?
+    if core.endswith("까"):
+        return core + "냥"
+    if core.endswith("이야"):
+        return core[:-2] + "이다냥"
+    if has_terminal and core.endswith("야") and len(core) >= 2:
+        return core[:-1] + "다냥"                                # 최고야! → 최고다냥!
+    if core.endswith("다") and len(core) >= 2:
+        before = core[-2]
+        if before in _VERBAL_BEFORE_DA or _jong(before) == _JONG_NIEUN:
+            return core + "냥"
+        return None
+    if has_terminal and core.endswith(_BANMAL_ENDINGS):
+        return core + "냥"                                      # 맛있겠어! → 맛있겠어냥!
+    return None
+
+
+def _rewrite_sentence(sentence: str) -> str:
+    tail_match = _TAIL_RE.search(sentence)
+    tail = tail_match.group(0) if tail_match else ""
+    core = sentence[:len(sentence) - len(tail)]
+    rewritten = _rewrite_core(core, "?" in tail or "？" in tail, bool(re.search(r"[.!?？~]", tail)))
+    return sentence if rewritten is None else rewritten + tail
+
+
+def to_cat_speech(text: str, add_emoji: bool = True) -> str:
+    """텍스트를 고양이 말투로 변환 (문장 끝 어미만, 내용은 그대로)"""
+    if not text:
+        return text
+
+    lines = []
+    in_code = False
+    for line in text.split("\n"):
+        if line.strip().startswith("```"):
+            in_code = not in_code
+            lines.append(line)
+            continue
+        if in_code or not line.strip() or _SKIP_LINE_RE.match(line):
+            lines.append(line)
+            continue
+        indent = line[:len(line) - len(line.lstrip())]
+        parts = _SENTENCE_SPLIT_RE.split(line.strip())
+        lines.append(indent + " ".join(_rewrite_sentence(part) for part in parts))
+
+    result = "\n".join(lines)
+    if add_emoji and not _EMOJI_RE.search(result):
+        result = result.rstrip() + " 😸"
+    return result
+
+
+# ==================== LLM 버전 (비교용) ====================
+
+LLM_CAT_SPEECH_PROMPT = """
+    다음 텍스트를 귀여운 고양이 말투로 변환하세요.
+
+    규칙:
+    - 문장 끝: "~냥", "~이냥?", "~하냥", "~다냥" 등
+    - 자연스럽고 귀여운 느낌
+    - 내용은 그대로 유지
+    - 너무 과하지 않게 (모든 문장에 냥을 붙이지 말고 적절히)
+
+    원본: {original}
+
+    고양이 말투:
+    """
+
+
+def llm_cat_speech(text: str) -> str:
+    """예전 cat_speech_node 의 LLM 변환 (벤치마크 비교용)"""
+    from agents.utils.llm_registry import get_chat_model
+    llm = get_chat_model("gpt-4o-mini", temperature=0, purpose="cat_speech")
+    return llm.invoke(LLM_CAT_SPEECH_PROMPT.format(original=text)).content
@@ -0,0 +1,21 @@
+"""
+런타임 상태 파일 위치 (LLM 응답 캐시 / Places 캐시 / 지명 사전 오버레이 / 세션)
+
+예전에는 기본 경로가 "llm_cache.db" 같은 상대 경로라 서버를 띄운 디렉터리(CWD)마다 파일이 따로 생겼다.
+
+- DATA_DIR: 상태 파일 기본 디렉터리 (기본값: backend/var, .gitignore 에 포함)
+- 파일별 환경 변수(LLM_CACHE_PATH, PLACES_CACHE_PATH, ...)가 있으면 그 경로가 우선
+"""
+import os
+
+
+DATA_DIR = os.getenv(
+    "DATA_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "var")
+)
+
+
+def data_path(filename: str) -> str:
+    """DATA_DIR 안의 파일 경로 (디렉터리가 없으면 생성)"""
+    os.makedirs(DATA_DIR, exist_ok=True)
+    return os.path.join(DATA_DIR, filename)
@@ -0,0 +1,265 @@
+"""
+한국 지역명 오프라인 지명 사전 (gazetteer)
+
+모든 검색 함수가 gmaps.geocode(f"{region}, 대한민국") 로 시작했다 (맛집 / 관광지 / 카페 / 숙소 / 쇼핑 / 긴급 / 지역 명소).
+지역명 → 좌표는 거의 바뀌지 않으므로, 시/도 · 시/군/구 · 유명 동네(해운대, 성수, 연남동…) · 주요 역 좌표를
+버전이 붙은 JSON(agents/data/kr_gazetteer.json)으로 같이 배포하고 첫 조회 때 메모리 인덱스로 만든다.
+
+- geocode_region(gmaps, area): 사전에 있으면 API 호출 없이 googlemaps geocode 와 같은 형식으로 반환
+- 사전에 없는 지역명만 API 로 조회하고, 국내 좌표면 오버레이 파일(GAZETTEER_OVERLAY_PATH)에 기록
+  → 다음부터(재시작 후에도) 로컬에서 해결. 같은 지역명을 여러 스레드가 동시에 물으면 API 는 1번만
+- 키 정규화: 공백/쉼표 제거, "대한민국" / "근처" / "주변" 제거 → "부산 해운대", "부산해운대", "해운대 근처" 모두 같은 키
+- "강남구" → "강남", "연남동" → "연남" 처럼 접미사 뗀 별칭과 "부산 해운대구" 처럼 상위 지역을 붙인 별칭도 인덱스에 넣는다.
+  "중구" / "고성" 처럼 여러 곳에 있는 이름은 모호하므로 API 로 넘긴다.
+
+GAZETTEER_ENABLED=false 로 비활성화 (예전처럼 매번 API).
+"""
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from agents.utils.data_dir import data_path
+
+
+GAZETTEER_ENABLED = os.getenv("GAZETTEER_ENABLED", "true").lower() in ("1", "true", "yes")
+GAZETTEER_PATH = os.getenv(
+    "GAZETTEER_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "kr_gazetteer.json")
+)
+# API 로 찾은 지역명 기록 파일 ("" 이면 메모리에만, 기본값은 DATA_DIR 안)
+GAZETTEER_OVERLAY_PATH = os.getenv("GAZETTEER_OVERLAY_PATH")
+if GAZETTEER_OVERLAY_PATH is None:
+    GAZETTEER_OVERLAY_PATH = data_path("gazetteer_overlay.json")
+GAZETTEER_OVERLAY_MAX = int(os.getenv("GAZETTEER_OVERLAY_MAX", "5000"))
+
+# 국내 좌표 범위 (이 밖의 API 결과는 기록하지 않음)
+_KOREA_BOUNDS = (33.0, 39.0, 124.0, 132.0)
+
+_STRIP_RE = re.compile(r"대한민국|[\s,.·]")
+_TRAILING_RE = re.compile(r"(근처|주변|일대|부근|쪽)$")
+# 접미사 뗀 별칭을 만드는 종류 → 접미사
+_STRIPPABLE = {"sido": ("시", "도"), "sigungu": ("시", "군", "구"), "area": ("동",)}
+
+# 인덱스 우선순위: 이름/명시 별칭 > 접미사 뗀 별칭 (상위 지역을 붙인 키는 붙인 이름의 우선순위)
+_PRIORITY_NAME = 0
+_PRIORITY_AUTO = 1
+
+Entry = Tuple[str, str, str, float, float]  # (이름, 종류, 상위 지역, 위도, 경도)
+
+
+def normalize_region(text: str) -> str:
+    """지역명 → 인덱스 키"""
+    key = _STRIP_RE.sub("", (text or "").strip()).lower()
+    return _TRAILING_RE.sub("", key)
+
+
+class Gazetteer:
+    """번들 지명 사전 + API 조회 결과 오버레이"""
+
+    def __init__(self, path: str = GAZETTEER_PATH, overlay_path: Optional[str] = GAZETTEER_OVERLAY_PATH):
+        self.path = path
+        self.overlay_path = overlay_path
+        self.version: Optional[str] = None
+        self._entries: List[Entry] = []
+        self._index: Dict[str, Tuple[int, Optional[int]]] = {}  # 키 → (우선순위, 항목 번호 | 모호하면 None)
+        self._overlay: Dict[str, list] = {}  # 키 → [위도, 경도, 주소, 기록 시각]
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._inflight: Dict[str, threading.Lock] = {}
+        self._stats = {"local_hits": 0, "overlay_hits": 0, "api_lookups": 0, "api_misses": 0, "writebacks": 0}
+
+    # ---------- 로딩 ----------
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            started_at = time.perf_counter()
+            try:
+                self._load_base()
+            except Exception as e:
+                print(f"⚠️ 지명 사전 로딩 실패 ({self.path}): {e}")
+            self._load_overlay()
+            self._loaded = True
+            print(f"🗺️ 지명 사전 v{self.version}: {len(self._entries)}곳, 키 {len(self._index)}개, "
+                  f"오버레이 {len(self._overlay)}개 ({(time.perf_counter() - started_at) * 1000:.1f}ms)")
+
+    def _load_base(self) -> None:
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.version = data.get("version")
+        columns = data["columns"]
+        rows = [dict(zip(columns, row)) for row in data["entries"]]
+
+        names_by_entry: List[List[Tuple[str, int]]] = []
+        for row in rows:
+            self._entries.append((row["name"], row["kind"], row.get("parent") or "", row["lat"], row["lng"]))
+            keys = [(normalize_region(name), _PRIORITY_NAME) for name in [row["name"], *row.get("aliases", [])]]
+            for suffix in _STRIPPABLE.get(row["kind"], ()):
+                stem = row["name"][:-len(suffix)]
+                if row["name"].endswith(suffix) and len(stem) >= 2:
+                    keys.append((normalize_region(stem), _PRIORITY_AUTO))
+            names_by_entry.append(keys)
+
+        # 상위 지역(시/도) 이름 + 별칭 → "부산해운대", "서울특별시강남구"
+        parent_keys = {
+            entry[0]: [key for key, _ in keys]
+            for entry, keys in zip(self._entries, names_by_entry) if entry[1] == "sido"
+        }
+        for index, (entry, keys) in enumerate(zip(self._entries, names_by_entry)):
+            for key, priority in keys:
+                self._add_key(key, priority, index)
+                for parent_key in parent_keys.get(entry[2], []):
+                    self._add_key(parent_key + key, priority, index)
+
+    def _add_key(self, key: str, priority: int, index: int) -> None:
+        existing = self._index.get(key)
+        if existing is None or priority < existing[0]:
+            self._index[key] = (priority, index)
+        elif priority == existing[0] and existing[1] is not None and existing[1] != index:
+            self._index[key] = (priority, None)  # 같은 이름이 여러 곳 → 모호
+
+    def _load_overlay(self) -> None:
+        if not self.overlay_path or not os.path.exists(self.overlay_path):
+            return
+        try:
+            with open(self.overlay_path, encoding="utf-8") as f:
+                self._overlay = json.load(f).get("entries", {})
+        except Exception as e:
+            print(f"⚠️ 지명 사전 오버레이 로딩 실패 ({self.overlay_path}): {e}")
+
+    # ---------- 조회 ----------
+
+    def lookup(self, region: str) -> Optional[Dict[str, Any]]:
+        """로컬 사전 / 오버레이에서만 찾기 (API 호출 없음)"""
+        if not GAZETTEER_ENABLED:
+            return None
+        self._ensure_loaded()
+        key = normalize_region(region)
+        if not key:
+            return None
+
+        found = self._index.get(key)
+        if found is not None and found[1] is not None:
+            name, kind, parent, lat, lng = self._entries[found[1]]
+            self._stats["local_hits"] += 1
+            return {"name": f"{parent} {name}".strip(), "kind": kind, "lat": lat, "lng": lng, "source": "gazetteer"}
+
+        cached = self._overlay.get(key)
+        if cached is not None:
+            self._stats["overlay_hits"] += 1
+            return {"name": cached[2], "kind": "geocoded", "lat": cached[0], "lng": cached[1], "source": "overlay"}
+        return None
+
+    def resolve(self, gmaps, area: str, **kwargs) -> List[Dict[str, Any]]:
+        """지역명 → googlemaps geocode 형식 결과 (사전에 없으면 API 후 기록)
+
+        kwargs 는 gmaps.geocode 로 그대로 전달 (예: region="KR")
+        """
+        found = self.lookup(area)
+        if found is not None:
+            return [_as_geocode_result(found)]
+        if not gmaps:
+            return []
+        if not GAZETTEER_ENABLED:
+            return gmaps.geocode(f"{area}, 대한민국", language="ko", **kwargs)
+
+        key = normalize_region(area)
+        with self._write_lock:
+            inflight = self._inflight.setdefault(key, threading.Lock())
+        with inflight:
+            # 같은 지역명을 먼저 조회한 스레드가 기록했으면 그대로 사용
+            found = self.lookup(area)
+            if found is not None:
+                return [_as_geocode_result(found)]
+
+            self._stats["api_lookups"] += 1
+            result = gmaps.geocode(f"{area}, 대한민국", language="ko", **kwargs)
+            if not result:
+                self._stats["api_misses"] += 1
+            else:
+                self._write_back(key, result[0])
+        with self._write_lock:
+            self._inflight.pop(key, None)
+        return result
+
+    def _write_back(self, key: str, result: Dict[str, Any]) -> None:
+        location = (result.get("geometry") or {}).get("location") or {}
+        lat, lng = location.get("lat"), location.get("lng")
+        min_lat, max_lat, min_lng, max_lng = _KOREA_BOUNDS
+        if lat is None or lng is None or not (min_lat <= lat <= max_lat and min_lng <= lng <= max_lng):
+            return
+
+        with self._write_lock:
+            self._overlay[key] = [lat, lng, result.get("formatted_address") or key, time.time()]
+            if len(self._overlay) > GAZETTEER_OVERLAY_MAX:
+                oldest = sorted(self._overlay.items(), key=lambda item: item[1][3])
+                for old_key, _ in oldest[:len(self._overlay) - GAZETTEER_OVERLAY_MAX]:
+                    del self._overlay[old_key]
+            self._stats["writebacks"] += 1
+            snapshot = dict(self._overlay)
+
+        if self.overlay_path:
+            try:
+                self._save_overlay(snapshot)
+            except Exception as e:
+                print(f"⚠️ 지명 사전 오버레이 저장 실패: {e}")
+
+    def _save_overlay(self, entries: Dict[str, list]) -> None:
+        """임시 파일에 쓰고 교체 (쓰다가 죽어도 기존 파일 유지)"""
+        directory = os.path.dirname(os.path.abspath(self.overlay_path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".gazetteer_", suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"base_version": self.version, "entries": entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.overlay_path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self._stats["local_hits"] + self._stats["overlay_hits"] + self._stats["api_lookups"]
+        return {
+            "enabled": GAZETTEER_ENABLED,
+            "loaded": self._loaded,
+            "version": self.version,
+            "entries": len(self._entries),
+            "keys": len(self._index),
+            "overlay_entries": len(self._overlay),
+            **self._stats,
+            "local_rate": round((lookups - self._stats["api_lookups"]) / lookups, 3) if lookups else 0.0,
+        }
+
+
+def _as_geocode_result(found: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "formatted_address": found["name"],
+        "geometry": {"location": {"lat": found["lat"], "lng": found["lng"]}},
+        "source": found["source"],
+    }
+
+
+_gazetteer: Optional[Gazetteer] = None
+_gazetteer_lock = threading.Lock()
+
+
+def get_gazetteer() -> Gazetteer:
+    """프로세스 전역 지명 사전 (지연 생성, 인덱스는 첫 조회 때 로딩)"""
+    global _gazetteer
+    if _gazetteer is None:
+        with _gazetteer_lock:
+            if _gazetteer is None:
+                _gazetteer = Gazetteer()
+    return _gazetteer
+
+
+def geocode_region(gmaps, area: str, **kwargs) -> List[Dict[str, Any]]:
+    """gmaps.geocode(f"{area}, 대한민국", language="ko") 대체 (결과 형식 동일)"""
+    return get_gazetteer().resolve(gmaps, area, **kwargs)
+
+
+def get_gazetteer_stats() -> Dict[str, Any]:
+    return get_gazetteer().get_stats()
@@ -0,0 +1,85 @@
+"""
+좌표 타일 / 거리 유틸 (nearby 검색 캐시용)
+
+- geohash_encode(lat, lng, precision): 표준 geohash 문자열
+- tile_precision(radius, lat): 타일 대각선이 반경의 NEARBY_TILE_SHIFT_RATIO 이하가 되는 가장 큰 타일
+  → 같은 타일 안에서 중심이 옮겨가도 반경 대비 오차가 작다
+- radius_bucket(radius): 반경을 정해진 단계로 올림 (1500 / 3000 / 5000 처럼 코드에서 쓰는 값은 그대로)
+- haversine_m(lat1, lng1, lat2, lng2): 두 좌표 사이 거리(m)
+"""
+import math
+import os
+from typing import Any, Optional, Tuple
+
+
+NEARBY_TILE_SHIFT_RATIO = float(os.getenv("NEARBY_TILE_SHIFT_RATIO", "0.25"))
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_EARTH_RADIUS_M = 6371000
+_METERS_PER_DEGREE = 111320
+
+RADIUS_BUCKETS = [500, 1000, 1500, 2000, 3000, 5000, 10000, 15000, 20000, 30000, 50000]
+
+
+def geohash_encode(lat: float, lng: float, precision: int) -> str:
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, value, even = [], 0, 0, True
+    while len(chars) < precision:
+        target, coord = (lng_range, lng) if even else (lat_range, lat)
+        mid = (target[0] + target[1]) / 2
+        value <<= 1
+        if coord >= mid:
+            value |= 1
+            target[0] = mid
+        else:
+            target[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits, value = 0, 0
+    return "".join(chars)
+
+
+def tile_size_m(precision: int, lat: float) -> Tuple[float, float]:
+    """geohash 타일 (세로, 가로) 크기(m)"""
+    lat_bits = (5 * precision) // 2
+    lng_bits = 5 * precision - lat_bits
+    height = 180 / 2 ** lat_bits * _METERS_PER_DEGREE
+    width = 360 / 2 ** lng_bits * _METERS_PER_DEGREE * math.cos(math.radians(lat))
+    return height, width
+
+
+def tile_precision(radius: float, lat: float) -> int:
+    """타일 대각선 ≤ 반경 × NEARBY_TILE_SHIFT_RATIO 인 가장 거친 precision (4~9)"""
+    for precision in range(4, 10):
+        height, width = tile_size_m(precision, lat)
+        if math.hypot(height, width) <= radius * NEARBY_TILE_SHIFT_RATIO:
+            return precision
+    return 9
+
+
+def radius_bucket(radius: float) -> int:
+    return next((bucket for bucket in RADIUS_BUCKETS if radius <= bucket), int(math.ceil(radius)))
+
+
+def haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    delta_phi = math.radians(lat2 - lat1)
+    delta_lambda = math.radians(lng2 - lng1)
+    a = math.sin(delta_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
+    return 2 * _EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def parse_location(location: Any) -> Optional[Tuple[float, float]]:
+    """googlemaps location 인자 ((lat, lng) / {"lat", "lng"} / "lat,lng") → (lat, lng)"""
+    try:
+        if isinstance(location, dict):
+            return float(location["lat"]), float(location["lng"])
+        if isinstance(location, str):
+            lat, lng = location.split(",")
+            return float(lat), float(lng)
+        lat, lng = location
+        return float(lat), float(lng)
+    except (KeyError, TypeError, ValueError):
+        return None
@@ -0,0 +1,243 @@
+"""
+결정적(temperature=0) LLM 호출 응답 캐시
+
+의도 분류 / 정보 추출 같은 temperature=0 호출은 입력이 같으면 결과도 같다.
+"부산 갈래", "맛집 추천해줘" 같은 문장은 사용자가 달라도 계속 반복되므로
+(모델 + 정규화된 프롬프트) 해시로 응답을 캐시한다.
+
+- 1차: 프로세스 메모리 LRU (TTLCache)
+- 2차: SQLite 파일 (재시작 / 같은 서버의 다른 워커와 공유)
+- TTL + 크기 상한으로 제거
+- 호출 지점별 opt-in: cached_llm_call(site, llm, prompt) 로 감싼 곳만 캐시
+  (구조화 출력은 cached_structured_call(site, llm, schema, prompt) → JSON 으로 저장)
+- 호출 지점별 적중률 메트릭
+
+LLM_CACHE_ENABLED=false 로 전체 비활성화, LLM_CACHE_PATH="" 로 디스크 캐시만 비활성화.
+"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Type
+
+from pydantic import BaseModel
+
+from agents.utils.data_dir import data_path
+from agents.utils.ttl_cache import TTLCache
+
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH") or data_path("llm_cache.db")
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+LLM_CACHE_MEMORY_SIZE = int(os.getenv("LLM_CACHE_MEMORY_SIZE", "2000"))
+LLM_CACHE_DISK_MAX_ROWS = int(os.getenv("LLM_CACHE_DISK_MAX_ROWS", "50000"))
+
+
+def normalize_prompt(prompt: str) -> str:
+    """공백/들여쓰기 차이만 있는 프롬프트는 같은 키가 되도록 정규화"""
+    return re.sub(r"\s+", " ", (prompt or "").strip())
+
+
+def prompt_key(model: str, prompt: str) -> str:
+    raw = f"{model}\x00{normalize_prompt(prompt)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class _SQLiteTier:
+    """디스크 캐시 (스레드별 커넥션, 쓰기 100번마다 만료/초과분 정리)"""
+
+    def __init__(self, path: str, ttl: int, max_rows: int):
+        self.path = path
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self._local = threading.local()
+        self._writes = 0
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " created_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_created ON llm_cache(created_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[str]:
+        row = self._connect().execute(
+            "SELECT value FROM llm_cache WHERE key = ? AND created_at >= ?",
+            (key, time.time() - self.ttl)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        conn = self._connect()
+        now = time.time()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at) VALUES (?, ?, ?)",
+                (key, value, now)
+            )
+        self._writes += 1
+        if self._writes % 100 == 0:
+            self.prune(now)
+
+    def prune(self, now: Optional[float] = None) -> None:
+        """만료된 항목 + 최대 행 수를 넘는 오래된 항목 삭제"""
+        conn = self._connect()
+        now = now or time.time()
+        with conn:
+            conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl,))
+            conn.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                " SELECT key FROM llm_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_rows,)
+            )
+
+    def count(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+
+class LLMResponseCache:
+    """메모리 LRU + SQLite 2단계 LLM 응답 캐시"""
+
+    def __init__(self, path: Optional[str] = LLM_CACHE_PATH, ttl: int = LLM_CACHE_TTL,
+                 memory_size: int = LLM_CACHE_MEMORY_SIZE, disk_max_rows: int = LLM_CACHE_DISK_MAX_ROWS):
+        self.memory = TTLCache(maxsize=memory_size, ttl=ttl, name="llm_response")
+        self.disk: Optional[_SQLiteTier] = None
+        if path:
+            try:
+                self.disk = _SQLiteTier(path, ttl, disk_max_rows)
+            except Exception as e:
+                print(f"⚠️ LLM 디스크 캐시 비활성화 ({path}): {e}")
+        self._lock = threading.Lock()
+        self._sites: Dict[str, Dict[str, int]] = {}
+
+    def _record(self, site: str, field: str) -> None:
+        with self._lock:
+            stats = self._sites.setdefault(site, {"memory_hits": 0, "disk_hits": 0, "misses": 0})
+            stats[field] += 1
+
+    def get(self, key: str, site: str = "default") -> Optional[str]:
+        value = self.memory.get(key)
+        if value is not None:
+            self._record(site, "memory_hits")
+            return value
+        if self.disk is not None:
+            try:
+                value = self.disk.get(key)
+            except Exception as e:
+                print(f"⚠️ LLM 디스크 캐시 조회 실패: {e}")
+                value = None
+            if value is not None:
+                self.memory.set(key, value)  # 다음번엔 메모리에서
+                self._record(site, "disk_hits")
+                return value
+        self._record(site, "misses")
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        self.memory.set(key, value)
+        if self.disk is not None:
+            try:
+                self.disk.set(key, value)
+            except Exception as e:
+                print(f"⚠️ LLM 디스크 캐시 저장 실패: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sites = {site: dict(stats) for site, stats in self._sites.items()}
+        for stats in sites.values():
+            lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+            stats["hit_rate"] = round((lookups - stats["misses"]) / lookups, 3) if lookups else 0.0
+        disk_rows = None
+        if self.disk is not None:
+            try:
+                disk_rows = self.disk.count()
+            except Exception:
+                pass
+        return {
+            "enabled": LLM_CACHE_ENABLED,
+            "memory": self.memory.get_stats(),
+            "disk_rows": disk_rows,
+            "sites": sites,
+        }
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """프로세스 전역 캐시 (지연 생성)"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMResponseCache()
+    return _cache
+
+
+def cached_llm_call(site: str, llm, prompt: str) -> str:
+    """LLM 호출 결과(content) 캐시
+
+    temperature=0 인 모델만 캐시하고, 그 외에는 그냥 호출한다.
+
+    Args:
+        site: 호출 지점 이름 (메트릭 구분용, 예: "graph.classify_intent")
+        llm: ChatOpenAI 인스턴스
+        prompt: 프롬프트 문자열
+    """
+    if not LLM_CACHE_ENABLED or getattr(llm, "temperature", None) not in (0, 0.0):
+        return llm.invoke(prompt).content
+
+    model = getattr(llm, "model_name", None) or getattr(llm, "model", "unknown")
+    key = prompt_key(model, prompt)
+    cache = get_llm_cache()
+    cached = cache.get(key, site)
+    if cached is not None:
+        return cached
+
+    content = llm.invoke(prompt).content
+    if content:
+        cache.set(key, content)
+    return content
+
+
+def cached_structured_call(site: str, llm, schema: Type[BaseModel], prompt: str) -> BaseModel:
+    """with_structured_output(schema) 호출 결과 캐시
+
+    스키마가 바뀌면 예전 캐시를 쓰지 않도록 키에 JSON 스키마를 포함한다.
+    캐시에는 model_dump_json() 으로 저장하고 꺼낼 때 다시 검증한다.
+    """
+    structured_llm = llm.with_structured_output(schema)
+    if not LLM_CACHE_ENABLED or getattr(llm, "temperature", None) not in (0, 0.0):
+        return structured_llm.invoke(prompt)
+
+    model = getattr(llm, "model_name", None) or getattr(llm, "model", "unknown")
+    schema_json = json.dumps(schema.model_json_schema(), sort_keys=True, ensure_ascii=False)
+    key = prompt_key(f"{model}\x00{schema_json}", prompt)
+    cache = get_llm_cache()
+    cached = cache.get(key, site)
+    if cached is not None:
+        try:
+            return schema.model_validate_json(cached)
+        except Exception:
+            pass  # 깨진 항목은 새로 호출해서 덮어씀
+
+    result = structured_llm.invoke(prompt)
+    cache.set(key, result.model_dump_json())
+    return result
+
+
+def get_llm_cache_stats() -> Dict[str, Any]:
+    return get_llm_cache().get_stats()
@@ -0,0 +1,181 @@
+"""
+프로세스 전역 LLM 클라이언트 레지스트리
+
+예전에는 get_llm() / 툴 함수가 호출될 때마다 ChatOpenAI 를 새로 만들었고,
+인스턴스마다 자기 HTTP 클라이언트를 가져서 LLM 호출마다 TCP/TLS 핸드셰이크를 다시 했다.
+(한 턴에 LLM 호출 5~8번 → 핸드셰이크 5~8번)
+
+- (model, temperature, purpose, 기타 옵션) 별로 ChatOpenAI 인스턴스 1개를 캐시해서 재사용
+- 모든 인스턴스(+ raw openai 클라이언트)가 커넥션 풀이 있는 httpx 클라이언트 하나를 공유 → keep-alive 로 연결 재사용
+- 요청 수 / 새 연결 수 / TLS 핸드셰이크 수 / 연결 재사용률 메트릭
+
+사용:
+    from agents.utils.llm_registry import get_chat_model
+    llm = get_chat_model("gpt-4o-mini", temperature=0, purpose="graph")
+"""
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+LLM_POOL_MAX_CONNECTIONS = int(os.getenv("LLM_POOL_MAX_CONNECTIONS", "32"))
+LLM_POOL_MAX_KEEPALIVE = int(os.getenv("LLM_POOL_MAX_KEEPALIVE", "16"))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "90"))  # 유휴 연결 유지 시간(초)
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "60"))
+
+_lock = threading.Lock()
+_models: Dict[Tuple, Any] = {}
+_http_client = None
+_async_http_client = None
+_openai_client = None
+
+# 메트릭 (httpcore trace 이벤트 기반)
+_stats = {
+    "requests": 0,
+    "new_connections": 0,
+    "tls_handshakes": 0,
+    "models_created": 0,
+    "model_lookups": 0,
+}
+
+
+def _count(key: str) -> None:
+    with _lock:
+        _stats[key] += 1
+
+
+def _trace(event_name: str, info: Dict[str, Any]) -> None:
+    # 새 연결이 열릴 때만 발생하는 이벤트 → 재사용된 요청에서는 안 불림
+    if event_name == "connection.connect_tcp.started":
+        _count("new_connections")
+    elif event_name == "connection.start_tls.started":
+        _count("tls_handshakes")
+
+
+async def _atrace(event_name: str, info: Dict[str, Any]) -> None:
+    _trace(event_name, info)
+
+
+def _on_request(request) -> None:
+    _count("requests")
+    request.extensions["trace"] = _trace
+
+
+async def _aon_request(request) -> None:
+    _count("requests")
+    request.extensions["trace"] = _atrace
+
+
+def _limits():
+    import httpx
+    return httpx.Limits(
+        max_connections=LLM_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=LLM_POOL_MAX_KEEPALIVE,
+        keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+    )
+
+
+def get_http_client():
+    """공유 동기 httpx 클라이언트 (커넥션 풀)"""
+    global _http_client
+    if _http_client is None:
+        import httpx
+        with _lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    limits=_limits(),
+                    timeout=LLM_TIMEOUT,
+                    event_hooks={"request": [_on_request]},
+                )
+    return _http_client
+
+
+def get_async_http_client():
+    """공유 비동기 httpx 클라이언트 (ainvoke / astream 용)"""
+    global _async_http_client
+    if _async_http_client is None:
+        import httpx
+        with _lock:
+            if _async_http_client is None:
+                _async_http_client = httpx.AsyncClient(
+                    limits=_limits(),
+                    timeout=LLM_TIMEOUT,
+                    event_hooks={"request": [_aon_request]},
+                )
+    return _async_http_client
+
+
+def get_chat_model(model: str = "gpt-4o-mini", temperature: float = 0, purpose: str = "default", **kwargs: Any):
+    """공유 ChatOpenAI 인스턴스 반환
+
+    Args:
+        model: 모델 이름
+        temperature: 샘플링 온도
+        purpose: 호출 용도 (메트릭 구분용, 예: "coordinator", "graph", "memory_summary")
+        **kwargs: ChatOpenAI 추가 옵션 (streaming=True 등). 옵션이 다르면 별도 인스턴스.
+    """
+    key = (model, float(temperature), purpose, tuple(sorted(kwargs.items())))
+    _count("model_lookups")
+    llm = _models.get(key)
+    if llm is not None:
+        return llm
+
+    from langchain_openai import ChatOpenAI
+
+    http_client = get_http_client()
+    http_async_client = get_async_http_client()
+    with _lock:
+        llm = _models.get(key)
+        if llm is None:
+            llm = ChatOpenAI(
+                model=model,
+                temperature=temperature,
+                http_client=http_client,
+                http_async_client=http_async_client,
+                **kwargs
+            )
+            _models[key] = llm
+            _stats["models_created"] += 1
+            print(f"🔌 LLM 클라이언트 생성: {model} (temperature={temperature}, purpose={purpose})")
+    return llm
+
+
+def get_openai_client(api_key: Optional[str] = None):
+    """공유 openai.OpenAI 클라이언트 (chat.completions 를 직접 호출하는 코드용)"""
+    global _openai_client
+    if _openai_client is None:
+        api_key = api_key or os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            return None
+        from openai import OpenAI
+        http_client = get_http_client()
+        with _lock:
+            if _openai_client is None:
+                _openai_client = OpenAI(api_key=api_key, http_client=http_client)
+    return _openai_client
+
+
+def _open_connections(client) -> Optional[int]:
+    # httpx 내부 풀 (버전에 따라 없을 수 있음)
+    try:
+        return len(client._transport._pool.connections)
+    except Exception:
+        return None
+
+
+def get_llm_stats() -> Dict[str, Any]:
+    """LLM 클라이언트 / 커넥션 풀 메트릭"""
+    with _lock:
+        stats = dict(_stats)
+        purposes = sorted({key[2] for key in _models})
+    requests = stats["requests"]
+    stats.update({
+        "models": len(_models),
+        "purposes": purposes,
+        "connection_reuse_rate": round(1 - stats["new_connections"] / requests, 3) if requests else 0.0,
+        "open_connections": _open_connections(_http_client) if _http_client else 0,
+        "pool_max_connections": LLM_POOL_MAX_CONNECTIONS,
+        "pool_max_keepalive": LLM_POOL_MAX_KEEPALIVE,
+        "keepalive_expiry": LLM_KEEPALIVE_EXPIRY,
+    })
+    return stats
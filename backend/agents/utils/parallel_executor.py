@@ -0,0 +1,123 @@
+"""
+병렬 툴 실행 AgentExecutor
+
+"부산 해운대 맛집이랑 카페랑 숙소 다 알려줘" 처럼 한 번에 여러 도메인을 묻는 턴에서
+LLM 이 한 스텝에 툴 호출 여러 개(parallel tool calls)를 내면,
+기본 AgentExecutor 는 이를 하나씩 순서대로 실행한다 (맛집 5초 + 카페 5초 + 숙소 5초).
+
+ParallelAgentExecutor 는 같은 스텝의 툴 호출을 스레드 풀에서 동시에 실행하고
+결과(AgentStep)는 LLM 이 호출한 순서 그대로 돌려준다 → 가장 느린 에이전트 시간만큼만 걸림.
+
+- 파싱 에러 처리 / AgentFinish / 콜백 흐름은 AgentExecutor 기본 구현을 그대로 사용
+- 턴 단위 동시 실행 상한: COORDINATOR_TOOL_CONCURRENCY (비동기 경로의 asyncio.gather 에도 같은 상한)
+- ContextThreadPoolExecutor 로 contextvars(장소 수집기, 콜백) 를 워커 스레드에 전달
+"""
+import asyncio
+import contextvars
+import os
+import time
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+
+from langchain.agents import AgentExecutor
+from langchain_core.agents import AgentAction, AgentFinish, AgentStep
+from langchain_core.callbacks import AsyncCallbackManagerForChainRun, CallbackManagerForChainRun
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+from langchain_core.tools import BaseTool
+
+
+COORDINATOR_TOOL_CONCURRENCY = int(os.getenv("COORDINATOR_TOOL_CONCURRENCY", "3"))
+
+# 비동기 경로: 스텝마다 새 세마포어 (asyncio.gather 로 만든 태스크가 컨텍스트를 물려받음)
+_async_tool_slots: contextvars.ContextVar[Optional[asyncio.Semaphore]] = contextvars.ContextVar(
+    "async_tool_slots", default=None
+)
+
+
+class _PendingAction:
+    """실행을 미뤄둔 툴 호출 (한 스텝의 호출을 모았다가 한꺼번에 실행)"""
+
+    def __init__(self, name_to_tool_map, color_mapping, agent_action, run_manager):
+        self.args = (name_to_tool_map, color_mapping, agent_action, run_manager)
+
+
+class ParallelAgentExecutor(AgentExecutor):
+    """한 스텝의 독립적인 툴 호출을 동시에 실행하는 AgentExecutor"""
+
+    max_parallel_tools: int = COORDINATOR_TOOL_CONCURRENCY
+
+    def _perform_agent_action(
+        self,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        agent_action: AgentAction,
+        run_manager: Optional[CallbackManagerForChainRun] = None,
+    ) -> AgentStep:
+        # 기본 _iter_next_step 이 액션마다 호출 → 바로 실행하지 않고 모아둠
+        return _PendingAction(name_to_tool_map, color_mapping, agent_action, run_manager)
+
+    def _iter_next_step(
+        self,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        inputs: Dict[str, str],
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        run_manager: Optional[CallbackManagerForChainRun] = None,
+    ) -> Iterator[Union[AgentFinish, AgentAction, AgentStep]]:
+        pending: List[_PendingAction] = []
+        for item in super()._iter_next_step(
+            name_to_tool_map, color_mapping, inputs, intermediate_steps, run_manager
+        ):
+            if isinstance(item, _PendingAction):
+                pending.append(item)
+            else:
+                yield item
+
+        yield from self._run_pending(pending)
+
+    def _run_pending(self, pending: List[_PendingAction]) -> List[AgentStep]:
+        """모아둔 툴 호출 실행 (결과는 호출 순서대로)"""
+        if not pending:
+            return []
+        if len(pending) == 1 or self.max_parallel_tools <= 1:
+            return [AgentExecutor._perform_agent_action(self, *p.args) for p in pending]
+
+        started_at = time.monotonic()
+        workers = min(self.max_parallel_tools, len(pending))
+        with ContextThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(AgentExecutor._perform_agent_action, self, *p.args)
+                for p in pending
+            ]
+            steps = [future.result() for future in futures]
+
+        tool_names = ", ".join(p.args[2].tool for p in pending)
+        print(f"⚡ 툴 {len(pending)}개 병렬 실행 ({tool_names}) → {(time.monotonic() - started_at) * 1000:.0f}ms")
+        return steps
+
+    async def _aiter_next_step(
+        self,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        inputs: Dict[str, str],
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
+    ) -> AsyncIterator[Union[AgentFinish, AgentAction, AgentStep]]:
+        # 기본 구현은 한 스텝의 툴 호출을 asyncio.gather 로 전부 동시에 실행 → 동기 경로와 같은 상한 적용
+        _async_tool_slots.set(asyncio.Semaphore(max(1, self.max_parallel_tools)))
+        async for item in super()._aiter_next_step(
+            name_to_tool_map, color_mapping, inputs, intermediate_steps, run_manager
+        ):
+            yield item
+
+    async def _aperform_agent_action(
+        self,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        agent_action: AgentAction,
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
+    ) -> AgentStep:
+        slots = _async_tool_slots.get()
+        if slots is None:
+            return await super()._aperform_agent_action(name_to_tool_map, color_mapping, agent_action, run_manager)
+        async with slots:
+            return await super()._aperform_agent_action(name_to_tool_map, color_mapping, agent_action, run_manager)
@@ -0,0 +1,30 @@
+"""
+툴 결과 그대로 전달(passthrough) 모드
+
+search_restaurants_tool / recommend_top_5_desserts_tool / 도메인 에이전트 래퍼(call_*_agent)는
+이미 완성된 마크다운을 반환하는데, 예전에는 그 결과를
+  1) 도메인 ReAct 에이전트 LLM 이 한 번 더 읽고 그대로 다시 쓰고
+  2) Coordinator LLM 이 또 한 번 읽고 다시 쓰는
+구조라서 추천 턴마다 수백 토큰짜리 생성이 1~2번 낭비됐다.
+
+passthrough 모드에서는 이런 툴에 return_direct 를 걸어서 툴 결과를 호출자에게 바로 돌려준다.
+- 도메인 그래프(create_react_agent): return_direct 툴 실행 후 바로 종료
+- Coordinator(AgentExecutor): 한 스텝에 return_direct 툴 하나만 호출했으면 결과를 최종 응답으로 사용
+  (여러 툴을 동시에 호출한 턴은 기존처럼 Coordinator 가 합쳐서 응답)
+
+TOOL_PASSTHROUGH=false 로 끄면 예전 동작.
+"""
+import os
+
+
+TOOL_PASSTHROUGH = os.getenv("TOOL_PASSTHROUGH", "true").lower() in ("1", "true", "yes")
+
+# Coordinator 를 거치지 않으므로 다음 행동 안내는 여기서 붙인다
+SELECTION_PROMPT = "\n\n👉 마음에 드는 곳이 있으면 번호나 이름으로 알려달라냥! 다른 스타일도 찾아줄 수 있다냥 🐾"
+
+
+def with_selection_prompt(text: str) -> str:
+    """passthrough 모드일 때 추천 결과 뒤에 선택 안내 문구 추가"""
+    if not TOOL_PASSTHROUGH or not text or "에러냥" in text or "찾지 못했" in text:
+        return text
+    return text + SELECTION_PROMPT
@@ -0,0 +1,130 @@
+"""
+턴 단위 장소 결과 수집기
+
+검색 함수(search_restaurants, search_landmarks, search_desserts_integrated, search_accommodations)가
+반환하는 AgentResponse.data(PlaceData)를 요청 범위(contextvar)의 수집기에 기록해두면,
+라우터가 LLM 응답 마크다운을 정규식으로 다시 파싱하고 재지오코딩할 필요 없이
+정확한 좌표/주소로 장소 카드를 만들 수 있다.
+
+contextvar 를 쓰기 때문에 LangChain / LangGraph 가 툴·노드를 다른 스레드에서 실행해도
+(ContextThreadPoolExecutor 가 컨텍스트를 복사) 같은 수집기에 기록된다.
+"""
+import re
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+
+_current_collector: ContextVar[Optional["PlaceCollector"]] = ContextVar("place_collector", default=None)
+
+
+def normalize_name(text: str) -> str:
+    """이름 비교용 정규화 (공백/특수문자 제거, 소문자)"""
+    return re.sub(r"[\s\-_·.,'\"()\[\]]+", "", (text or "")).lower()
+
+
+class PlaceCollector:
+    """한 턴 동안 툴이 찾은 장소(PlaceData dict)를 place_id 기준으로 모아두는 수집기"""
+
+    def __init__(self):
+        self._places: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, places: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            for place in places:
+                key = place.get("place_id") or place.get("name")
+                if key and key not in self._places:
+                    self._places[key] = place
+
+    @property
+    def places(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._places.values())
+
+    def to_place_cards(self, response_text: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """최종 응답에 실제로 등장한 장소만 응답 순서대로 카드 데이터로 변환
+
+        툴이 15개를 찾고 LLM이 3개만 골라 보여주는 경우도 있으므로
+        응답 텍스트에 이름이 나온 장소만 카드로 만든다.
+        """
+        normalized_response = normalize_name(response_text)
+        matched = []
+        for place in self.places:
+            name_key = normalize_name(place.get("name", ""))
+            if len(name_key) < 2:
+                continue
+            position = normalized_response.find(name_key)
+            if position >= 0:
+                matched.append((position, place))
+
+        matched.sort(key=lambda item: item[0])
+
+        cards = []
+        for _, place in matched[:limit]:
+            cards.append({
+                "place_id": place.get("place_id"),
+                "name": place.get("name"),
+                "category": place.get("category"),
+                "address": place.get("address") or "주소 정보 없음",
+                "lat": place.get("latitude", 0),
+                "lng": place.get("longitude", 0),
+                "rating": place.get("rating", 0),
+                "tags": place.get("tags") or [],
+                "google_maps_url": place.get("google_maps_url")
+                or f"https://www.google.com/maps/search/?api=1&query={place.get('name', '').replace(' ', '+')}",
+            })
+        return cards
+
+
+@contextmanager
+def collect_places_for_turn(reuse: bool = False) -> Iterator[PlaceCollector]:
+    """현재 턴 범위에서 장소 수집 시작
+
+    reuse=True 면 이미 수집 중일 때 바깥 수집기를 그대로 쓴다 (라우터 카드 + 세션 추천 목록 저장을 같이 할 때)
+
+    사용 예:
+        with collect_places_for_turn() as collector:
+            response = get_coordinator_response(...)
+        cards = collector.to_place_cards(response)
+    """
+    active = _current_collector.get()
+    if reuse and active is not None:
+        yield active
+        return
+
+    collector = PlaceCollector()
+    token = _current_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _current_collector.reset(token)
+
+
+def current_collector() -> Optional[PlaceCollector]:
+    """현재 턴의 수집기 (수집 중이 아니면 None)"""
+    return _current_collector.get()
+
+
+def record_places(result: Any) -> Any:
+    """검색 결과(AgentResponse 또는 model_dump dict)를 현재 턴 수집기에 기록
+
+    수집 중이 아니면 아무것도 하지 않는다. 호출부에서 그대로 return 할 수 있도록 result 를 반환.
+    """
+    collector = _current_collector.get()
+    if collector is None or result is None:
+        return result
+
+    try:
+        if isinstance(result, dict):
+            success, data = result.get("success"), result.get("data")
+        else:
+            success, data = getattr(result, "success", False), getattr(result, "data", None)
+
+        if success and isinstance(data, list):
+            collector.add([p for p in data if isinstance(p, dict)])
+    except Exception as e:
+        print(f"⚠️ 장소 결과 수집 실패: {e}")
+
+    return result
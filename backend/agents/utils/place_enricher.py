@@ -0,0 +1,136 @@
+"""
+장소 카드 좌표 보강(enrichment) 단계
+
+툴 결과(PlaceData)가 없어서 LLM 응답 텍스트의 장소명만으로 카드를 만들어야 할 때 사용.
+
+- 프로세스 전역 googlemaps 클라이언트 1개 재사용 (요청마다 새로 만들지 않음)
+- 장소별 지오코딩을 스레드 풀로 동시에 실행, 요청 단위 마감 시간(deadline) 적용
+- 정규화된 (장소명 + 주소) → 좌표 TTL 캐시 → 해운대/광안리 같은 단골 장소는 API 호출 0회
+"""
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional
+
+from agents.utils.ttl_cache import TTLCache
+
+
+NO_ADDRESS = "주소 정보 없음"
+_MISS = object()
+
+ENRICH_DEADLINE = float(os.getenv("PLACE_ENRICH_DEADLINE", "3.0"))  # 요청 단위 마감 시간(초)
+ENRICH_CACHE_TTL = int(os.getenv("PLACE_ENRICH_CACHE_TTL", str(7 * 24 * 3600)))  # 좌표는 거의 안 바뀜
+ENRICH_NEGATIVE_TTL = 600  # "못 찾음" 결과는 짧게 보관
+ENRICH_CACHE_SIZE = int(os.getenv("PLACE_ENRICH_CACHE_SIZE", "5000"))
+
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="place-enrich")
+_coord_cache = TTLCache(maxsize=ENRICH_CACHE_SIZE, ttl=ENRICH_CACHE_TTL, name="place_enrich")
+_gmaps = None
+
+
+def _get_gmaps():
+    """프로세스 전역 googlemaps 클라이언트 (지연 생성)"""
+    global _gmaps
+    if _gmaps is None:
+        api_key = os.getenv('GOOGLE_MAPS_API_KEY') or os.getenv('GOOGLE_PLACES_API_KEY')
+        if not api_key:
+            return None
+        import googlemaps
+        from agents.utils.places_cache import CachedPlacesClient
+        _gmaps = CachedPlacesClient(googlemaps.Client(key=api_key))
+    return _gmaps
+
+
+def _cache_key(name: str, address: str) -> str:
+    """공백/대소문자 차이를 무시한 캐시 키"""
+    normalize = lambda text: re.sub(r"\s+", " ", (text or "").strip()).lower()
+    return f"{normalize(name)}|{normalize(address) if address != NO_ADDRESS else ''}"
+
+
+def _geocode(name: str, address: str) -> Optional[Dict[str, Any]]:
+    """장소명 + 주소 지오코딩 (결과는 캐시에 기록, 못 찾으면 None 을 짧게 캐시)"""
+    key = _cache_key(name, address)
+    gmaps = _get_gmaps()
+    if not gmaps:
+        return None
+
+    try:
+        search_query = f"{name} {address}" if address != NO_ADDRESS else name
+        geocode_result = gmaps.geocode(search_query, language='ko')
+    except Exception as e:
+        print(f"❌ Geocoding 에러: {name} - {e}")
+        return None
+
+    if geocode_result:
+        location = geocode_result[0]['geometry']['location']
+        result = {
+            "lat": location['lat'],
+            "lng": location['lng'],
+            "formatted_address": geocode_result[0].get('formatted_address', NO_ADDRESS),
+        }
+        _coord_cache.set(key, result)
+        print(f"✅ 좌표 찾음: {name} → ({result['lat']}, {result['lng']})")
+        return result
+
+    _coord_cache.set(key, None, ttl=ENRICH_NEGATIVE_TTL)
+    print(f"⚠️ 좌표 못 찾음: {name}")
+    return None
+
+
+def enrich_places(names: List[str], addresses: List[str], deadline: float = ENRICH_DEADLINE) -> List[Dict[str, Any]]:
+    """장소명 리스트를 장소 카드 데이터로 변환
+
+    Args:
+        names: 응답에서 추출한 장소명 (순서 유지)
+        addresses: 응답에서 추출한 주소 (names 와 같은 순서, 부족하면 "주소 정보 없음")
+        deadline: 캐시 미스 지오코딩을 기다리는 최대 시간(초). 넘기면 좌표 (0, 0)으로 카드 생성하고,
+                  늦게 끝난 조회 결과는 캐시에 남아 다음 요청에서 사용된다.
+
+    Returns:
+        [{"name", "address", "lat", "lng", "tags", "google_maps_url"}]
+    """
+    started_at = time.monotonic()
+    resolved: Dict[int, Optional[Dict[str, Any]]] = {}
+    pending = {}
+
+    for idx, name in enumerate(names):
+        address = addresses[idx].strip() if idx < len(addresses) else NO_ADDRESS
+        cached = _coord_cache.get(_cache_key(name, address), _MISS)
+        if cached is not _MISS:
+            resolved[idx] = cached
+        else:
+            pending[_executor.submit(_geocode, name, address)] = idx
+
+    if pending:
+        done, not_done = wait(pending.keys(), timeout=deadline)
+        for future in done:
+            resolved[pending[future]] = future.result()
+        if not_done:
+            print(f"⏱️ 좌표 보강 마감 초과: {len(not_done)}개는 좌표 없이 카드 생성")
+
+    places_data = []
+    for idx, name in enumerate(names):
+        address = addresses[idx].strip() if idx < len(addresses) else NO_ADDRESS
+        coords = resolved.get(idx)
+        lat, lng = (coords["lat"], coords["lng"]) if coords else (0, 0)
+        if coords and address == NO_ADDRESS:
+            # 주소가 없었으면 Geocoding 결과에서 가져오기
+            address = coords["formatted_address"]
+
+        places_data.append({
+            "name": name,
+            "address": address,
+            "lat": lat,
+            "lng": lng,
+            "tags": [],
+            "google_maps_url": f"https://www.google.com/maps/search/?api=1&query={name.replace(' ', '+')}"
+        })
+
+    print(f"📍 좌표 보강 완료: {len(names)}개 (API {len(pending)}회, {(time.monotonic() - started_at) * 1000:.0f}ms)")
+    return places_data
+
+
+def get_enricher_stats() -> Dict[str, Any]:
+    """좌표 보강 캐시 메트릭"""
+    return _coord_cache.get_stats()
@@ -0,0 +1,36 @@
+"""
+장소 리스트 → 마크다운 (LLM 없이)
+
+직접 호출 경로(run_direct)에서 검색 결과(PlaceData dict 리스트)를
+search_restaurants_tool 과 같은 카드 형식으로 바로 만든다.
+"""
+from typing import Dict, List, Optional
+
+
+def format_place_list(title: str, places: List[Dict], limit: int = 5,
+                      closing: Optional[str] = None) -> str:
+    """PlaceData dict 리스트를 번호 붙은 마크다운 카드로 변환"""
+    output = [f"{title}\n"]
+
+    for i, place in enumerate(places[:limit], 1):
+        name_line = f"**{i}. {place['name']}**"
+        if place.get("category") and place["category"] not in ("cafe", "hotel"):
+            name_line += f" · {place['category']}"
+        output.append(name_line)
+        output.append(f"⭐ **{place.get('rating', 0)}점** · 리뷰 {place.get('review_count', 0):,}개")
+
+        if place.get("open_now") is not None:
+            output.append("🟢 영업중" if place["open_now"] else "🔴 영업종료")
+        if place.get("address"):
+            output.append(f"📍 {place['address']}")
+        if place.get("phone"):
+            output.append(f"📞 {place['phone']}")
+        if place.get("google_maps_url"):
+            output.append(f"[🗺️ 지도보기]({place['google_maps_url']})\n")
+        else:
+            output.append("")
+
+    if closing:
+        output.append(closing)
+
+    return "\n".join(output)
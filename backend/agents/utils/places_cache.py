@@ -0,0 +1,341 @@
+"""
+Google Places / Geocoding 응답 캐시 (모든 에이전트 공용)
+
+예전에는 restaurant_agent 에만 크기 제한 없는 dict 캐시가 있었고,
+landmark / dessert / accommodation / shopping / emergency / region 은 같은 장소를 매번 API 로 다시 조회했다.
+각 모듈의 googlemaps.Client 를 CachedPlacesClient 로 감싸면 place / places_nearby / places / geocode 응답이
+(엔드포인트, place_id 또는 검색 인자, fields, language) 키로 캐시된다. 그 외 메서드(directions 등)는 그대로 전달.
+
+- 1차: 프로세스 메모리 LRU (TTLCache, 항목별 TTL)
+- 2차: SQLite 파일 (재시작 / 같은 서버의 다른 워커와 공유), PLACES_CACHE_PATH="" 로 비활성화
+- TTL 은 요청한 필드 그룹 중 가장 짧은 것: 영업시간(자주 바뀜) < 평점/리뷰 < 연락처/가격대 < 이름/좌표/주소(거의 안 바뀜)
+- 빈 결과 / 에러 / page_token 페이지는 캐시하지 않음
+- 엔드포인트별 적중률 메트릭 (/metrics)
+- places_nearby 는 정확한 중심 좌표 대신 (type, keyword, 중심의 geohash 타일, 반경 단계) 로 캐시
+  → "해운대" / "해운대해수욕장" 처럼 중심이 같은 타일에 들어오는 검색은 저장된 결과를 정확한 거리로 다시 걸러서 반환
+
+PLACES_CACHE_ENABLED=false 로 전체 비활성화.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from agents.utils.data_dir import data_path
+from agents.utils.geo_tiles import geohash_encode, haversine_m, parse_location, radius_bucket, tile_precision
+from agents.utils.ttl_cache import TTLCache
+
+
+PLACES_CACHE_ENABLED = os.getenv("PLACES_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+PLACES_CACHE_PATH = os.getenv("PLACES_CACHE_PATH") or data_path("places_cache.db")
+PLACES_CACHE_MEMORY_SIZE = int(os.getenv("PLACES_CACHE_MEMORY_SIZE", "5000"))
+PLACES_CACHE_DISK_MAX_ROWS = int(os.getenv("PLACES_CACHE_DISK_MAX_ROWS", "100000"))
+
+# 필드 그룹별 TTL(초)
+TTL_STABLE = int(os.getenv("PLACES_TTL_STABLE", str(30 * 24 * 3600)))    # 이름, 좌표, 주소, 타입
+TTL_CONTACT = int(os.getenv("PLACES_TTL_CONTACT", str(7 * 24 * 3600)))   # 전화, 웹사이트, 가격대, 사진
+TTL_REVIEWS = int(os.getenv("PLACES_TTL_REVIEWS", str(24 * 3600)))       # 평점, 리뷰
+TTL_VOLATILE = int(os.getenv("PLACES_TTL_VOLATILE", str(3600)))          # 영업시간, 영업 상태
+TTL_SEARCH = int(os.getenv("PLACES_TTL_SEARCH", str(3600)))              # nearby / 텍스트 검색 (open_now 포함)
+
+FIELD_TTLS = {
+    "name": TTL_STABLE, "geometry": TTL_STABLE, "formatted_address": TTL_STABLE, "vicinity": TTL_STABLE,
+    "place_id": TTL_STABLE, "type": TTL_STABLE, "types": TTL_STABLE, "url": TTL_STABLE,
+    "address_component": TTL_STABLE, "plus_code": TTL_STABLE, "wheelchair_accessible_entrance": TTL_STABLE,
+    "formatted_phone_number": TTL_CONTACT, "international_phone_number": TTL_CONTACT, "website": TTL_CONTACT,
+    "price_level": TTL_CONTACT, "photo": TTL_CONTACT, "editorial_summary": TTL_CONTACT,
+    "rating": TTL_REVIEWS, "user_ratings_total": TTL_REVIEWS, "reviews": TTL_REVIEWS,
+    "opening_hours": TTL_VOLATILE, "current_opening_hours": TTL_VOLATILE, "business_status": TTL_VOLATILE,
+}
+
+# fields 없이 전체 상세 조회하면 영업시간도 포함되므로 가장 짧은 TTL
+_FULL_DETAILS_TTL = TTL_VOLATILE
+
+
+def fields_ttl(fields: Optional[Iterable[str]]) -> int:
+    """요청 필드 중 가장 자주 바뀌는 그룹의 TTL (모르는 필드는 평점/리뷰 수준)"""
+    if not fields:
+        return _FULL_DETAILS_TTL
+    return min(FIELD_TTLS.get(field, TTL_REVIEWS) for field in fields)
+
+
+def request_key(endpoint: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+    """(엔드포인트, 위치 인자, 키워드 인자) → 캐시 키 (fields 순서 무관)"""
+    normalized = dict(kwargs)
+    if normalized.get("fields"):
+        normalized["fields"] = sorted(normalized["fields"])
+    if isinstance(normalized.get("type"), (list, tuple)):
+        normalized["type"] = sorted(normalized["type"])
+    raw = json.dumps([endpoint, list(args), normalized], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class _SQLiteTier:
+    """디스크 캐시 (스레드별 커넥션, 항목별 만료 시각, 쓰기 100번마다 만료/초과분 정리)"""
+
+    def __init__(self, path: str, max_rows: int):
+        self.path = path
+        self.max_rows = max_rows
+        self._local = threading.local()
+        self._writes = 0
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS places_cache ("
+                " key TEXT PRIMARY KEY,"
+                " endpoint TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_places_cache_expires ON places_cache(expires_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_places_cache_created ON places_cache(created_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[tuple]:
+        """(값, 남은 TTL 초) 또는 None"""
+        now = time.time()
+        row = self._connect().execute(
+            "SELECT value, expires_at FROM places_cache WHERE key = ? AND expires_at > ?", (key, now)
+        ).fetchone()
+        return (row[0], row[1] - now) if row else None
+
+    def set(self, key: str, endpoint: str, value: str, ttl: float) -> None:
+        conn = self._connect()
+        now = time.time()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO places_cache (key, endpoint, value, created_at, expires_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, endpoint, value, now, now + ttl)
+            )
+        self._writes += 1
+        if self._writes % 100 == 0:
+            self.prune(now)
+
+    def prune(self, now: Optional[float] = None) -> None:
+        """만료된 항목 + 최대 행 수를 넘는 오래된 항목 삭제"""
+        conn = self._connect()
+        now = now or time.time()
+        with conn:
+            conn.execute("DELETE FROM places_cache WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "DELETE FROM places_cache WHERE key IN ("
+                " SELECT key FROM places_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_rows,)
+            )
+
+    def count(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM places_cache").fetchone()[0]
+
+
+class PlacesResponseCache:
+    """메모리 LRU + SQLite 2단계 Places 응답 캐시
+
+    값은 JSON 문자열로 보관하고 꺼낼 때마다 새로 파싱한다
+    (호출부가 결과 dict 에 점수 등을 써넣어도 캐시가 오염되지 않도록).
+    """
+
+    def __init__(self, path: Optional[str] = PLACES_CACHE_PATH, memory_size: int = PLACES_CACHE_MEMORY_SIZE,
+                 disk_max_rows: int = PLACES_CACHE_DISK_MAX_ROWS):
+        self.memory = TTLCache(maxsize=memory_size, ttl=TTL_STABLE, name="places")
+        self.disk: Optional[_SQLiteTier] = None
+        if path:
+            try:
+                self.disk = _SQLiteTier(path, disk_max_rows)
+            except Exception as e:
+                print(f"⚠️ Places 디스크 캐시 비활성화 ({path}): {e}")
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, int]] = {}
+
+    def _record(self, endpoint: str, field: str) -> None:
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, {"memory_hits": 0, "disk_hits": 0, "misses": 0})
+            stats[field] += 1
+
+    def get(self, key: str, endpoint: str, record: bool = True) -> Optional[Any]:
+        value = self.memory.get(key)
+        if value is not None:
+            if record:
+                self._record(endpoint, "memory_hits")
+            return json.loads(value)
+        if self.disk is not None:
+            try:
+                found = self.disk.get(key)
+            except Exception as e:
+                print(f"⚠️ Places 디스크 캐시 조회 실패: {e}")
+                found = None
+            if found is not None:
+                value, remaining = found
+                self.memory.set(key, value, ttl=remaining)  # 다음번엔 메모리에서
+                if record:
+                    self._record(endpoint, "disk_hits")
+                return json.loads(value)
+        if record:
+            self._record(endpoint, "misses")
+        return None
+
+    def set(self, key: str, endpoint: str, value: Any, ttl: float) -> None:
+        raw = json.dumps(value, ensure_ascii=False, default=str)
+        self.memory.set(key, raw, ttl=ttl)
+        if self.disk is not None:
+            try:
+                self.disk.set(key, endpoint, raw, ttl)
+            except Exception as e:
+                print(f"⚠️ Places 디스크 캐시 저장 실패: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            endpoints = {endpoint: dict(stats) for endpoint, stats in self._endpoints.items()}
+        for stats in endpoints.values():
+            lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+            stats["hit_rate"] = round((lookups - stats["misses"]) / lookups, 3) if lookups else 0.0
+        disk_rows = None
+        if self.disk is not None:
+            try:
+                disk_rows = self.disk.count()
+            except Exception:
+                pass
+        return {
+            "enabled": PLACES_CACHE_ENABLED,
+            "memory": self.memory.get_stats(),
+            "disk_rows": disk_rows,
+            "endpoints": endpoints,
+        }
+
+
+_cache: Optional[PlacesResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_places_cache() -> PlacesResponseCache:
+    """프로세스 전역 캐시 (지연 생성)"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = PlacesResponseCache()
+    return _cache
+
+
+def _is_cacheable(endpoint: str, response: Any) -> bool:
+    """빈 결과 / 에러 응답은 캐시하지 않음"""
+    if endpoint == "geocode":
+        return bool(response)
+    if not isinstance(response, dict):
+        return False
+    if endpoint == "place":
+        return bool(response.get("result"))
+    return response.get("status") == "OK" and bool(response.get("results"))
+
+
+class CachedPlacesClient:
+    """googlemaps.Client 래퍼: place / places_nearby / places / geocode 응답 캐시
+
+    사용 예:
+        gmaps = CachedPlacesClient(googlemaps.Client(key=GOOGLE_API_KEY)) if GOOGLE_API_KEY else None
+        gmaps.place(place_id, fields=[...], language="ko")   # 반환 형식은 googlemaps 와 동일
+    """
+
+    def __init__(self, client):
+        self._client = client
+
+    def __getattr__(self, name: str) -> Any:
+        # directions 등 캐시하지 않는 메서드는 원래 클라이언트로
+        return getattr(self._client, name)
+
+    def _ttl(self, endpoint: str, kwargs: Dict[str, Any]) -> float:
+        if endpoint == "place":
+            return fields_ttl(kwargs.get("fields"))
+        if endpoint == "geocode":
+            return TTL_STABLE
+        return TTL_SEARCH
+
+    def _call(self, endpoint: str, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        fn = getattr(self._client, endpoint)
+        if not PLACES_CACHE_ENABLED or kwargs.get("page_token"):
+            return fn(*args, **kwargs)
+
+        cache = get_places_cache()
+        key = request_key(endpoint, args, kwargs)
+        cached = cache.get(key, endpoint)
+        if cached is not None:
+            return cached
+
+        response = fn(*args, **kwargs)
+        if _is_cacheable(endpoint, response):
+            cache.set(key, endpoint, response, self._ttl(endpoint, kwargs))
+        return response
+
+    def peek(self, endpoint: str, *args, **kwargs) -> Optional[Any]:
+        """API 호출 없이 캐시에 있는 응답만 (없으면 None, 메트릭에는 안 셈)"""
+        if not PLACES_CACHE_ENABLED:
+            return None
+        return get_places_cache().get(request_key(endpoint, args, kwargs), endpoint, record=False)
+
+    def place(self, *args, **kwargs) -> Dict[str, Any]:
+        return self._call("place", args, kwargs)
+
+    def places_nearby(self, *args, **kwargs) -> Dict[str, Any]:
+        center = parse_location(kwargs.get("location"))
+        radius = kwargs.get("radius")
+        if (not PLACES_CACHE_ENABLED or args or center is None or not radius
+                or kwargs.get("page_token") or kwargs.get("rank_by")):
+            return self._call("places_nearby", args, kwargs)
+        return self._nearby_by_tile(center, float(radius), kwargs)
+
+    def _nearby_by_tile(self, center: tuple, radius: float, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """타일 단위 nearby 캐시
+
+        미스: 반경 단계(≥ 요청 반경)로 한 번 검색해서 (중심, 응답) 을 타일 키에 저장.
+        적중: 저장된 결과 중 요청 중심에서 요청 반경 안에 있는 것만 (순서 유지).
+        타일 크기는 반경에 맞춰 고르므로(geo_tiles.tile_precision) 중심 차이는 반경의 일부 이내.
+        """
+        bucket = radius_bucket(radius)
+        tile = geohash_encode(center[0], center[1], tile_precision(bucket, center[0]))
+        tile_params = {k: v for k, v in kwargs.items() if k not in ("location", "radius")}
+        key = request_key("places_nearby_tile", (tile, bucket), tile_params)
+
+        cache = get_places_cache()
+        cached = cache.get(key, "places_nearby")
+        if cached is None:
+            response = self._client.places_nearby(**{**kwargs, "location": center, "radius": bucket})
+            if not _is_cacheable("places_nearby", response):
+                return response
+            cached = {"center": list(center), "response": response}
+            cache.set(key, "places_nearby", cached, TTL_SEARCH)
+
+        response = cached["response"]
+        if tuple(cached["center"]) == center and bucket == radius:
+            return response
+
+        def within(place: Dict[str, Any]) -> bool:
+            location = (place.get("geometry") or {}).get("location") or {}
+            if "lat" not in location or "lng" not in location:
+                return False
+            return haversine_m(center[0], center[1], location["lat"], location["lng"]) <= radius
+
+        response["results"] = [place for place in response.get("results", []) if within(place)]
+        response.pop("next_page_token", None)  # 다른 중심/반경으로 만든 토큰
+        if not response["results"]:
+            response["status"] = "ZERO_RESULTS"
+        return response
+
+    def places(self, *args, **kwargs) -> Dict[str, Any]:
+        return self._call("places", args, kwargs)
+
+    def geocode(self, *args, **kwargs) -> list:
+        return self._call("geocode", args, kwargs)
+
+
+def get_places_cache_stats() -> Dict[str, Any]:
+    return get_places_cache().get_stats()
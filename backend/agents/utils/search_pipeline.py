@@ -0,0 +1,203 @@
+"""
+장소 검색 파이프라인 (단계별 동시 실행 + 단계 시간 기록)
+
+search_restaurants / search_desserts_integrated / search_landmarks 는 예전에
+Serper 1차 → Serper 2차 → geocode → places_nearby → 상세 정보를 전부 순서대로 호출했다.
+Serper 웹 검색은 Places 쿼리에 필요 없으므로 백그라운드에서 먼저 시작하고,
+호출 스레드는 geocode → nearby 체인을 그대로 진행한다.
+웹 검색 결과(가게 이름)는 후보를 고를 때만 쓰이므로 그 시점에 마감 시간까지만 기다린다.
+
+→ 검색 1회 지연 ≈ max(웹 검색, geocode + nearby) + 상세 정보 (예전: 전부 합)
+
+- SearchPipeline.stage(name): 호출 스레드에서 실행하는 단계 시간 기록
+- SearchPipeline.submit(name, fn): 스레드 풀에서 바로 시작하는 단계
+- SearchPipeline.fan_out(name, fn, items, timeout): 같은 단계를 여러 입력에 동시에 (마감 초과/실패는 None)
+- start_web_search / collect_web_names: Serper 1차(메뉴 특화) 시작, 부족할 때만 2차(일반 카테고리) / 수집
+- get_search_pipeline_stats(): 검색 종류별 단계 평균/최대 시간 (/metrics)
+"""
+import os
+import threading
+import time
+from concurrent.futures import Future, wait
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+
+from agents.utils.place_collector import normalize_name
+
+
+SEARCH_STAGE_WORKERS = int(os.getenv("SEARCH_STAGE_WORKERS", "16"))
+# 파이프라인 시작부터 웹 검색 결과를 기다리는 최대 시간(초). 넘기면 Places 결과만으로 진행
+SEARCH_WEB_DEADLINE = float(os.getenv("SEARCH_WEB_DEADLINE", "3.0"))
+
+_executor = ContextThreadPoolExecutor(max_workers=SEARCH_STAGE_WORKERS, thread_name_prefix="search-stage")
+
+_stats: Dict[str, Dict[str, Any]] = {}
+_stats_lock = threading.Lock()
+
+
+class SearchPipeline:
+    """검색 1회의 단계 실행 / 시간 기록"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.timings: Dict[str, float] = {}  # 단계 → ms
+        self._started_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started_at
+
+    def _record(self, stage: str, started_at: float) -> None:
+        with self._lock:
+            self.timings[stage] = round((time.monotonic() - started_at) * 1000, 1)
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        """호출 스레드에서 실행하는 단계"""
+        started_at = time.monotonic()
+        try:
+            yield
+        finally:
+            self._record(stage, started_at)
+
+    def _timed(self, stage: str, fn: Callable, *args, **kwargs) -> Any:
+        with self.stage(stage):
+            return fn(*args, **kwargs)
+
+    def submit(self, stage: str, fn: Callable, *args, **kwargs) -> Future:
+        """단계를 스레드 풀에서 바로 시작"""
+        return _executor.submit(self._timed, stage, fn, *args, **kwargs)
+
+    def result(self, future: Future, default: Any = None, timeout: Optional[float] = None) -> Any:
+        """단계 결과 (마감 초과 / 실패 시 default, 늦게 끝난 단계는 버림)"""
+        try:
+            return future.result(timeout=timeout)
+        except Exception as e:
+            print(f"⚠️ [{self.name}] 단계 결과 없음: {type(e).__name__} {e}")
+            return default
+
+    def fan_out(self, stage: str, fn: Callable, items: Iterable, timeout: Optional[float] = None) -> List[Any]:
+        """fn(item) 을 동시에 실행, 입력 순서대로 결과 (마감 초과 / 실패는 None)"""
+        with self.stage(stage):
+            futures = [_executor.submit(fn, item) for item in items]
+            if not futures:
+                return []
+            done, not_done = wait(futures, timeout=timeout)
+            if not_done:
+                print(f"⏱️ [{self.name}] {stage} 마감 초과: {len(not_done)}/{len(futures)}개")
+            results = []
+            for future in futures:
+                if future in done and future.exception() is None:
+                    results.append(future.result())
+                else:
+                    if future in done:
+                        print(f"⚠️ [{self.name}] {stage} 실패: {future.exception()}")
+                    results.append(None)
+            return results
+
+    def finish(self) -> Dict[str, float]:
+        """전체 시간 기록 + 로그 한 줄 + 누적 통계"""
+        total_ms = round(self.elapsed() * 1000, 1)
+        with self._lock:
+            timings = dict(self.timings)
+        stages = " · ".join(f"{stage} {ms:.0f}ms" for stage, ms in timings.items())
+        print(f"⏱️ [{self.name}] 검색 {total_ms:.0f}ms | {stages}")
+
+        with _stats_lock:
+            entry = _stats.setdefault(self.name, {"searches": 0, "total_ms": 0.0, "stages": {}})
+            entry["searches"] += 1
+            entry["total_ms"] += total_ms
+            for stage, ms in timings.items():
+                stage_entry = entry["stages"].setdefault(stage, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+                stage_entry["count"] += 1
+                stage_entry["total_ms"] += ms
+                stage_entry["max_ms"] = max(stage_entry["max_ms"], ms)
+
+        return {**timings, "total": total_ms}
+
+
+# ==================== 웹 검색 (Serper) 단계 ====================
+
+def _web_place_names(query: str, category: str) -> List[str]:
+    from agents.utils.serper_utils import search_with_serper, extract_place_names
+    results = search_with_serper(query, num_results=10)
+    return extract_place_names(results, category) if results else []
+
+
+def _web_place_names_with_fallback(pipeline: SearchPipeline, query: str, category: str,
+                                   general_query: Optional[str], general_category: str,
+                                   min_results: int) -> List[str]:
+    """1차 검색 → 가게 이름이 min_results 개 미만일 때만 2차 (Serper 호출은 건당 과금)"""
+    names = pipeline._timed("web_search", _web_place_names, query, category)
+    if general_query is None or len(names) >= min_results:
+        return names
+    for name in pipeline._timed("web_search_general", _web_place_names, general_query, general_category):
+        if name not in names:
+            names.append(name)
+    return names
+
+
+def start_web_search(pipeline: SearchPipeline, region: str, keyword: Optional[str],
+                     suffix: str = "", with_general: bool = True, min_results: int = 5) -> List[Future]:
+    """Serper 1차(메뉴 특화) 검색을 백그라운드에서 시작, 결과가 min_results 개 미만이면 이어서 2차(일반 카테고리)
+
+    예: "부산 토마토 파스타 맛집" → 부족하면 "부산 파스타 맛집". 키워드가 한 단어거나 with_general=False 면 1차만.
+    """
+    if not keyword:
+        return []
+
+    general_category = keyword.split()[-1] if " " in keyword else keyword
+    general_query = None
+    if with_general and general_category != keyword:
+        general_query = f"{region} {general_category} {suffix}".strip()
+    return [_executor.submit(
+        _web_place_names_with_fallback, pipeline, f"{region} {keyword} {suffix}".strip(), keyword,
+        general_query, general_category, min_results
+    )]
+
+
+def collect_web_names(pipeline: SearchPipeline, searches: List[Future],
+                      deadline: float = SEARCH_WEB_DEADLINE) -> List[str]:
+    """웹 검색 결과 가게 이름 (파이프라인 시작 기준 deadline 까지만 대기)"""
+    names: List[str] = []
+    for future in searches:
+        remaining = max(0.0, deadline - pipeline.elapsed())
+        for name in pipeline.result(future, default=[], timeout=remaining) or []:
+            if name not in names:
+                names.append(name)
+    return names
+
+
+def prefer_web_mentioned(candidates: List[Dict[str, Any]], web_names: List[str]) -> List[Dict[str, Any]]:
+    """웹 검색에 이름이 나온 후보를 앞으로 (나머지 순서는 유지)"""
+    keys = [normalize_name(name) for name in web_names]
+    keys = [key for key in keys if len(key) >= 2]
+    if not keys:
+        return candidates
+
+    def mentioned(place: Dict[str, Any]) -> bool:
+        place_key = normalize_name(place.get("name", ""))
+        return bool(place_key) and any(key in place_key or place_key in key for key in keys)
+
+    return [p for p in candidates if mentioned(p)] + [p for p in candidates if not mentioned(p)]
+
+
+def get_search_pipeline_stats() -> Dict[str, Any]:
+    """검색 종류별 평균 전체 시간 + 단계별 평균/최대 시간 (ms)"""
+    with _stats_lock:
+        return {
+            name: {
+                "searches": entry["searches"],
+                "avg_total_ms": round(entry["total_ms"] / entry["searches"], 1),
+                "stages": {
+                    stage: {
+                        "avg_ms": round(s["total_ms"] / s["count"], 1),
+                        "max_ms": s["max_ms"],
+                    }
+                    for stage, s in entry["stages"].items()
+                },
+            }
+            for name, entry in _stats.items()
+        }
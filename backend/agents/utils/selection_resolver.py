@@ -0,0 +1,220 @@
+"""
+추천 목록 선택 해석기 (LLM 없이)
+
+에이전트가 보여준 추천 목록(PlaceData 카드)을 세션(TravelFlowState.agent_results)에 place_id 와 함께 저장해두고,
+사용자가 "2번", "1,3", "첫 번째 거", "고반식당" 처럼 고르거나 "두 번째 식당 리뷰 보여줘" 처럼 되물으면
+저장된 목록에서 바로 장소를 찾는다. → Coordinator 가 검색 툴을 다시 부르지 않는다.
+
+- resolve_selection(text, recommendations, default_category): 서수/번호/이름 → 저장된 장소
+- run_place_action(category, action, place): 리뷰/메뉴/상세 툴을 place_id 로 바로 호출
+- 카테고리 이름은 tool_selector 의 그룹 이름과 같다 (restaurant / cafe / accommodation / landmark)
+"""
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+from agents.utils.place_collector import normalize_name
+
+
+# 카테고리별로 저장할 추천 목록 길이 (응답에 보인 순서대로)
+RECOMMENDATION_LIMIT = int(os.getenv("RECOMMENDATION_LIMIT", "10"))
+
+# PlaceData.category → 추천 목록 카테고리 (그 외 관광지 세부 분류는 전부 landmark)
+_PLACE_CATEGORY = {
+    "restaurant": "restaurant",
+    "cafe": "cafe",
+    "hotel": "accommodation",
+}
+
+CATEGORY_KEYWORDS = {
+    "restaurant": ["식당", "맛집", "음식점", "레스토랑", "가게"],
+    "cafe": ["카페", "디저트", "베이커리"],
+    "accommodation": ["숙소", "호텔", "펜션", "리조트", "게스트하우스", "한옥스테이", "풀빌라"],
+    "landmark": ["관광지", "명소", "랜드마크", "박물관", "미술관", "공원"],
+}
+
+# 후속 요청 종류 (위에서부터 먼저 매칭)
+_ACTIONS = [
+    ("reviews", re.compile(r"리뷰|후기|평가")),
+    ("menu", re.compile(r"메뉴|뭐\s*팔|시그니처")),
+    ("details", re.compile(r"상세|자세히|정보|영업|주차|예약|가격|입장료")),
+]
+
+_ORDINAL_WORDS = {"첫": 1, "한": 1, "두": 2, "둘": 2, "세": 3, "셋": 3, "네": 4, "넷": 4, "다섯": 5,
+                  "여섯": 6, "일곱": 7, "여덟": 8, "아홉": 9, "열": 10}
+# 앞 글자가 한글이면 다른 단어의 일부 ("열두 번째" 의 "두 번째"), 열X 는 10 + X
+_ORDINAL_WORD_RE = re.compile(r"(?<![가-힣])(열\s*)?(다섯|여섯|일곱|여덟|아홉|첫|한|두|둘|세|셋|네|넷|열)\s*(?:번\s*)?째")
+_ORDINAL_NUMBER_RE = re.compile(r"(?<!\d)(\d{1,2})\s*번(?!\s*길)")
+_LAST_RE = re.compile(r"마지막\s*(?:거|것|꺼|곳|집|번)")
+# 고른 게 아니라 새로 찾아달라는 요청 ("2번 말고 다른 데")
+_NEW_SEARCH_RE = re.compile(r"말고|다른\s*(?:곳|데|거)|더\s*(?:보여|찾아|추천)|새로")
+# "2", "1,3", "1이랑 3" 처럼 번호만 있는 답
+_BARE_NUMBERS_RE = re.compile(
+    r"^\s*\d{1,2}(?:\s*(?:,|/|&|이랑|랑|하고|\s)\s*\d{1,2})*\s*"
+    r"(?:으로|로)?\s*(?:할게|할래|선택|골랐어)?\s*(?:요)?\s*[!.~]*\s*$"
+)
+
+
+def place_category(place: Dict[str, Any]) -> str:
+    """PlaceData dict → 추천 목록 카테고리"""
+    return _PLACE_CATEGORY.get(place.get("category") or "", "landmark")
+
+
+def group_by_category(places: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """장소 카드 리스트 → 카테고리별 리스트 (각 카테고리 안의 순서 유지 = 사용자가 본 번호 순서)"""
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for place in places:
+        grouped.setdefault(place_category(place), []).append(place)
+    return grouped
+
+
+def detect_category(text: str) -> Optional[str]:
+    return next((category for category, keywords in CATEGORY_KEYWORDS.items()
+                 if any(k in text for k in keywords)), None)
+
+
+def detect_action(text: str) -> Optional[str]:
+    return next((action for action, pattern in _ACTIONS if pattern.search(text)), None)
+
+
+def parse_ordinals(text: str, count: int) -> List[int]:
+    """서수/번호 → 0 기반 인덱스 (등장 순서, 중복 제거, 범위 밖은 버림)"""
+    found = []  # (위치, 인덱스)
+    for match in _ORDINAL_WORD_RE.finditer(text):
+        found.append((match.start(), (10 if match.group(1) else 0) + _ORDINAL_WORDS[match.group(2)] - 1))
+    for match in _ORDINAL_NUMBER_RE.finditer(text):
+        found.append((match.start(), int(match.group(1)) - 1))
+    for match in _LAST_RE.finditer(text):
+        found.append((match.start(), count - 1))
+    if not found and _BARE_NUMBERS_RE.match(text):
+        found = [(m.start(), int(m.group(0)) - 1) for m in re.finditer(r"\d{1,2}", text)]
+
+    indexes = []
+    for _, index in sorted(found):
+        if 0 <= index < count and index not in indexes:
+            indexes.append(index)
+    return indexes
+
+
+# 이름 단어 중 별칭으로 쓰지 않는 것 (카테고리 일반 명사)
+_GENERIC_NAME_WORDS = {normalize_name(k) for keywords in CATEGORY_KEYWORDS.values() for k in keywords}
+
+
+def _name_aliases(name: str, word_counts: Dict[str, int]) -> List[str]:
+    """장소 이름의 별칭: 목록에서 이 장소에만 있는 3글자 이상 단어
+
+    "고반식당 해운대점" → "고반식당", "카페 모모스" → "모모스".
+    지점명("해운대점"), 카테고리 명사, 다른 장소와 겹치는 단어("해운대")는 제외.
+    """
+    aliases = []
+    for word in name.split():
+        key = normalize_name(word)
+        if len(key) >= 3 and not key.endswith("점") and key not in _GENERIC_NAME_WORDS and word_counts.get(key) == 1:
+            aliases.append(key)
+    return aliases
+
+
+def match_names(text: str, places: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """메시지에 이름이 나온 장소 (전체 이름 또는 이름의 고유한 단어, _name_aliases 참고)"""
+    normalized = normalize_name(text)
+    word_counts: Dict[str, int] = {}
+    for place in places:
+        for key in {normalize_name(word) for word in (place.get("name") or "").split()}:
+            word_counts[key] = word_counts.get(key, 0) + 1
+
+    matched = []
+    for place in places:
+        name = place.get("name") or ""
+        keys = [normalize_name(name)] + _name_aliases(name, word_counts)
+        positions = [normalized.find(key) for key in keys if len(key) >= 2 and key in normalized]
+        if positions:
+            matched.append((min(positions), place))
+    matched.sort(key=lambda item: item[0])
+    return [place for _, place in matched]
+
+
+def resolve_selection(text: str, recommendations: Dict[str, List[Dict[str, Any]]],
+                      default_category: Optional[str] = None,
+                      context_text: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """저장된 추천 목록에서 사용자가 가리킨 장소 찾기
+
+    카테고리: 메시지에 나온 카테고리 → default_category(직전에 보여준 목록) 순.
+    이름은 카테고리 지정이 없으면 모든 목록에서 찾는다.
+    context_text(직전 챗봇 응답)를 주면, 카테고리 없이 번호만 말한 경우("2번")는
+    직전 응답에 그 목록이 보였을 때만 선택으로 본다 (지역/일정 선택지 번호와 헷갈리지 않도록).
+
+    Returns:
+        {"category", "places": [장소 dict...], "action": "reviews" | "menu" | "details" | None}
+        가리킨 장소가 없으면 None
+    """
+    if not text or not recommendations:
+        return None
+
+    action = detect_action(text)
+    if action is None and _NEW_SEARCH_RE.search(text):
+        return None
+    explicit_category = detect_category(text)
+    category = explicit_category or default_category
+    candidates = recommendations.get(category) or []
+
+    places = [candidates[i] for i in parse_ordinals(text, len(candidates))]
+    if places and not explicit_category and context_text is not None and not match_names(context_text, candidates):
+        return None
+    if not places:
+        search_order = [category]
+        if not explicit_category:
+            search_order += [c for c in recommendations if c != category]
+        for name_category in search_order:
+            places = match_names(text, recommendations.get(name_category) or [])
+            if places:
+                category = name_category
+                break
+
+    if not places:
+        return None
+    return {"category": category, "places": places, "action": action}
+
+
+# ==================== 저장된 place_id 로 바로 툴 호출 ====================
+
+def run_place_action(category: str, action: Optional[str], place: Dict[str, Any]) -> str:
+    """리뷰/메뉴/상세 툴을 저장된 place_id 로 바로 호출 (검색 툴 재호출 없음)"""
+    place_id = place.get("place_id")
+    name = place.get("name") or "그곳"
+    if not place_id:
+        return f"{name}의 장소 ID 가 없어서 자세히 볼 수 없어냥... 😿"
+
+    try:
+        if category == "restaurant":
+            from agents.tool.restaurant_tools import (
+                get_restaurant_reviews_tool, extract_menu_tool, get_restaurant_details_tool
+            )
+            tool = {"reviews": get_restaurant_reviews_tool, "menu": extract_menu_tool}.get(
+                action, get_restaurant_details_tool
+            )
+            return tool.invoke({"place_id": place_id})
+
+        if category == "cafe":
+            from agents.tool.dessert_tool import analyze_cafe_detail_tool
+            return analyze_cafe_detail_tool.invoke({"place_id": place_id})
+
+        if category == "accommodation":
+            from agents.tool.accommodation_tools import summarize_reviews
+            result = summarize_reviews.invoke({"place_id": place_id})
+            data = result.get("data") or []
+            if result.get("success") and data:
+                return f"**{data[0]['place_name']}** 리뷰 요약 📝\n\n{data[0]['ai_summary']}"
+            return result.get("message") or "리뷰를 요약하지 못했어냥... 😿"
+
+        from agents.tool.landmark_tool import get_landmark_detail_tool
+        from agents.utils.place_format import format_place_list
+        result = get_landmark_detail_tool.invoke({"place_id": place_id})
+        data = result.get("data") or []
+        if result.get("success") and data:
+            text = format_place_list(f"🏛️ {name} 상세 정보", data, limit=1)
+            if data[0].get("description"):
+                text += f"\n{data[0]['description']}"
+            return text
+        return result.get("message") or f"{name} 정보를 찾지 못했어냥... 😿"
+    except Exception as e:
+        return f"{name} 정보를 가져오는 중 문제가 생겼어냥... 😿 ({str(e)})"
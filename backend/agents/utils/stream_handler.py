@@ -0,0 +1,115 @@
+"""
+SSE 스트리밍용 LangChain 콜백 핸들러
+
+Coordinator AgentExecutor 와 그 안에서 호출되는 도메인 그래프(맛집/카페/숙소/관광지/지역)의
+이벤트를 {"event": ..., "data": {...}} 형태로 emit 콜백에 넘긴다.
+
+- token: Coordinator LLM 토큰 (도메인 에이전트 내부 LLM 토큰은 제외)
+- tool_start / tool_end: "맛집 에이전트 호출 중…" 같은 진행 상황
+
+핸들러는 Coordinator 워커 스레드에서 호출되므로 emit 은 스레드 안전해야 한다.
+(라우터에서는 loop.call_soon_threadsafe 로 asyncio.Queue 에 넣는다)
+"""
+import time
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+
+# 툴 이름 → 사용자에게 보여줄 진행 문구
+TOOL_LABELS = {
+    "call_restaurant_agent": "맛집 에이전트 호출 중…",
+    "call_dessert_agent": "카페 에이전트 호출 중…",
+    "call_accommodation_agent": "숙소 에이전트 호출 중…",
+    "call_landmark_agent": "관광지 에이전트 호출 중…",
+    "call_region_agent": "지역 에이전트 호출 중…",
+    "call_itinerary_generator": "일정표 만드는 중…",
+    "call_chat_agent": "대화 에이전트 호출 중…",
+    "search_restaurants_tool": "맛집 검색 중…",
+    "get_restaurant_reviews_tool": "리뷰 가져오는 중…",
+    "extract_menu_tool": "메뉴 확인 중…",
+    "search_cafe_list_tool": "카페 검색 중…",
+    "recommend_top_5_desserts_tool": "디저트 맛집 찾는 중…",
+    "search_accommodations": "숙소 검색 중…",
+    "compare_booking_prices": "숙소 가격 비교 중…",
+    "search_places_tool": "관광지 검색 중…",
+}
+
+
+class StreamingEventHandler(BaseCallbackHandler):
+    """Coordinator 실행 이벤트를 SSE 이벤트로 변환하는 콜백 핸들러"""
+
+    def __init__(self, emit: Callable[[Dict[str, Any]], None]):
+        self.emit = emit
+        self._parents: Dict[UUID, Optional[UUID]] = {}
+        self._tool_runs: Dict[UUID, Dict[str, Any]] = {}
+
+    # ==================== run 계층 추적 ====================
+
+    def _track(self, run_id: UUID, parent_run_id: Optional[UUID]) -> None:
+        self._parents[run_id] = parent_run_id
+
+    def _tool_depth(self, run_id: UUID) -> int:
+        """run_id 위쪽에 있는 툴 실행 개수 (0 = Coordinator 최상위)"""
+        depth = 0
+        current = self._parents.get(run_id)
+        while current is not None:
+            if current in self._tool_runs:
+                depth += 1
+            current = self._parents.get(current)
+        return depth
+
+    def on_chain_start(self, serialized, inputs, *, run_id: UUID,
+                       parent_run_id: Optional[UUID] = None, **kwargs: Any) -> None:
+        self._track(run_id, parent_run_id)
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID,
+                            parent_run_id: Optional[UUID] = None, **kwargs: Any) -> None:
+        self._track(run_id, parent_run_id)
+
+    def on_llm_start(self, serialized, prompts, *, run_id: UUID,
+                     parent_run_id: Optional[UUID] = None, **kwargs: Any) -> None:
+        self._track(run_id, parent_run_id)
+
+    # ==================== 이벤트 ====================
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        # 함수 호출 단계에서는 빈 토큰이 들어옴 / 도메인 에이전트 내부 토큰은 사용자 응답이 아님
+        if not token or self._tool_depth(run_id) > 0:
+            return
+        self.emit({"event": "token", "data": {"text": token}})
+
+    def on_tool_start(self, serialized, input_str: str, *, run_id: UUID,
+                      parent_run_id: Optional[UUID] = None, **kwargs: Any) -> None:
+        self._track(run_id, parent_run_id)
+        name = (serialized or {}).get("name") or kwargs.get("name") or "tool"
+        depth = self._tool_depth(run_id)
+        self._tool_runs[run_id] = {"name": name, "started_at": time.monotonic()}
+        self.emit({
+            "event": "tool_start",
+            "data": {
+                "tool": name,
+                "label": TOOL_LABELS.get(name, f"{name} 실행 중…"),
+                "depth": depth,
+            }
+        })
+
+    def _finish_tool(self, run_id: UUID, error: Optional[BaseException] = None) -> None:
+        info = self._tool_runs.get(run_id)
+        if not info:
+            return
+        data = {
+            "tool": info["name"],
+            "depth": self._tool_depth(run_id),
+            "elapsed_ms": round((time.monotonic() - info["started_at"]) * 1000),
+        }
+        if error is not None:
+            data["error"] = str(error)
+        self.emit({"event": "tool_end", "data": data})
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish_tool(run_id)
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish_tool(run_id, error)
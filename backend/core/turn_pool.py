@@ -0,0 +1,218 @@
+"""Coordinator 실행 풀
+
+Coordinator Agent 한 턴은 LLM 호출 + Google Maps 호출이 모두 동기(blocking) 코드라서
+FastAPI 이벤트 루프에서 그대로 실행하면 한 사용자의 턴이 끝날 때까지 서버 전체가 멈춘다.
+
+- 전용 ThreadPoolExecutor에서 턴을 실행 (이벤트 루프는 항상 비어 있음)
+- 동시 실행 개수 제한 (COORDINATOR_MAX_CONCURRENCY)
+- 대기열 길이 제한 (COORDINATOR_MAX_QUEUE) → 가득 차면 429
+- 대기 시간 제한 (COORDINATOR_QUEUE_TIMEOUT) → 초과하면 503 (같은 세션의 앞선 턴을 기다리는 시간도 동일)
+- 대기열 깊이 / 대기 시간 메트릭
+- arun(): 비동기 턴은 스레드 없이 이벤트 루프에서 await (동시 실행 한도 COORDINATOR_MAX_ASYNC_CONCURRENCY)
+- run_blocking(): 비동기 턴 안의 동기 구간(페르소나 DB, 요약 LLM, googlemaps)은 기본 executor 대신
+  워커 수가 COORDINATOR_MAX_CONCURRENCY 로 제한된 전용 executor 에서 실행
+"""
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict
+
+
+MAX_CONCURRENCY = int(os.getenv("COORDINATOR_MAX_CONCURRENCY", "4"))
+MAX_QUEUE = int(os.getenv("COORDINATOR_MAX_QUEUE", "16"))
+QUEUE_TIMEOUT = float(os.getenv("COORDINATOR_QUEUE_TIMEOUT", "30"))
+# 비동기 턴은 OpenAI / Google 응답을 기다리는 동안 스레드를 점유하지 않지만
+# 동기 구간은 MAX_CONCURRENCY 개 스레드를 나눠 쓰므로 워커 수에 비례한 만큼만 받음
+MAX_ASYNC_CONCURRENCY = int(os.getenv("COORDINATOR_MAX_ASYNC_CONCURRENCY", str(MAX_CONCURRENCY * 4)))
+
+
+class PoolBusyError(Exception):
+    """풀이 포화 상태라 요청을 받을 수 없을 때 발생
+
+    status_code: 429 (대기열 가득 참) 또는 503 (대기 시간 초과)
+    """
+
+    def __init__(self, message: str, status_code: int, retry_after: int = 5):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class CoordinatorPool:
+    """동시 실행 개수와 대기열이 제한된 Coordinator 실행 풀"""
+
+    def __init__(self, max_concurrency: int = MAX_CONCURRENCY, max_queue: int = MAX_QUEUE,
+                 queue_timeout: float = QUEUE_TIMEOUT, max_async_concurrency: int = MAX_ASYNC_CONCURRENCY):
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_async_concurrency = max(1, max_async_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = queue_timeout
+
+        # 슬롯 개수 = 워커 개수 → executor 내부 큐에는 작업이 쌓이지 않음
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="coordinator"
+        )
+        # 비동기 턴의 동기 구간용 (기본 executor 는 CPU 수에 비례해 커지므로 따로 제한)
+        self._blocking_executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="coordinator-async"
+        )
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._async_slots = asyncio.Semaphore(self.max_async_concurrency)
+        self._lock = threading.Lock()
+
+        # 메트릭
+        self._waiting = 0
+        self._running = 0
+        self._async_running = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected_full = 0
+        self._rejected_timeout = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._wait_count = 0
+
+    async def acquire(self, async_turn: bool = False) -> None:
+        """실행 슬롯 확보 (대기열이 가득 차거나 대기 시간이 초과되면 PoolBusyError)
+
+        async_turn: True 면 비동기 턴 슬롯 (arun)
+        """
+        slots = self._async_slots if async_turn else self._slots
+        capacity = self.max_async_concurrency if async_turn else self.max_concurrency
+        with self._lock:
+            running = self._async_running if async_turn else self._running
+            # 실행 중 + 대기 중 인원이 (동시 실행 한도 + 대기열 한도)를 넘으면 즉시 거절
+            if running + self._waiting >= capacity + self.max_queue:
+                self._rejected_full += 1
+                raise PoolBusyError("요청이 너무 많아요. 잠시 후 다시 시도해주세요.", status_code=429)
+            self._waiting += 1
+
+        enqueued_at = time.monotonic()
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._rejected_timeout += 1
+            raise PoolBusyError("서버가 바빠요. 잠시 후 다시 시도해주세요.", status_code=503)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+        waited = time.monotonic() - enqueued_at
+        with self._lock:
+            if async_turn:
+                self._async_running += 1
+            else:
+                self._running += 1
+            self._wait_count += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+
+    async def acquire_lock(self, lock: asyncio.Lock) -> None:
+        """세션 lock 확보 (슬롯 대기와 같은 대기 시간 제한, 초과하면 PoolBusyError 503)
+
+        asyncio.wait_for 로 lock.acquire() 를 감싸면 타임아웃과 lock 획득이 겹칠 때
+        lock 이 잡힌 채로 버려질 수 있어서, 획득 작업을 따로 두고 결과를 확인한다.
+        """
+        task = asyncio.ensure_future(lock.acquire())
+        try:
+            done, _ = await asyncio.wait({task}, timeout=self.queue_timeout)
+        except BaseException:
+            # 대기 중 클라이언트 연결 끊김 (CancelledError)
+            if task.done() and not task.cancelled():
+                lock.release()
+            else:
+                task.cancel()
+            raise
+
+        if not done:
+            task.cancel()  # 아직 대기 중인 acquire() 는 취소되면 lock 을 잡지 않음
+            with self._lock:
+                self._rejected_timeout += 1
+            raise PoolBusyError("같은 대화의 이전 요청이 아직 처리 중이에요. 잠시 후 다시 시도해주세요.",
+                                status_code=503)
+
+    def _release(self, future: Future) -> None:
+        """작업 종료 시 슬롯 반환 (워커 스레드가 실제로 끝난 뒤에 호출됨)"""
+        with self._lock:
+            self._running -= 1
+            if future.cancelled() or future.exception() is not None:
+                self._failed += 1
+            else:
+                self._completed += 1
+        self._slots.release()
+
+    def release_unused(self) -> None:
+        """acquire() 로 확보했지만 submit() 하기 전에 실패한 슬롯 반환"""
+        with self._lock:
+            self._running -= 1
+            self._failed += 1
+        self._slots.release()
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> "asyncio.Future":
+        """acquire() 로 확보한 슬롯에서 fn 실행
+
+        클라이언트가 끊겨서 await 하던 쪽이 취소되더라도 스레드가 끝날 때까지 슬롯을 유지한다.
+        """
+        loop = asyncio.get_running_loop()
+        future = self._executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(lambda f: loop.call_soon_threadsafe(self._release, f))
+        return asyncio.wrap_future(future, loop=loop)
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """슬롯 확보 → 워커 스레드에서 fn 실행 → 결과 반환"""
+        await self.acquire()
+        return await self.submit(fn, *args, **kwargs)
+
+    async def arun(self, coro_fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """슬롯 확보 → 이벤트 루프에서 coro_fn 실행 (워커 스레드 점유 없음)"""
+        await self.acquire(async_turn=True)
+        failed = True
+        try:
+            result = await coro_fn(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            with self._lock:
+                self._async_running -= 1
+                if failed:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+            self._async_slots.release()
+
+    async def run_blocking(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """비동기 턴 안의 동기 함수 실행 (asyncio.to_thread 처럼 contextvars 전달, 스레드 수는 제한)"""
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, fn, *args, **kwargs)
+        return await loop.run_in_executor(self._blocking_executor, call)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 상태 메트릭"""
+        with self._lock:
+            avg_wait = self._wait_total / self._wait_count if self._wait_count else 0.0
+            return {
+                "max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "max_async_concurrency": self.max_async_concurrency,
+                "async_running": self._async_running,
+                "queue_depth": self._waiting,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected_queue_full": self._rejected_full,
+                "rejected_timeout": self._rejected_timeout,
+                "avg_wait_ms": round(avg_wait * 1000, 1),
+                "max_wait_ms": round(self._wait_max * 1000, 1),
+            }
+
+
+# 전역 풀 인스턴스
+coordinator_pool = CoordinatorPool()
@@ -1,9 +1,21 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Header
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
+import asyncio
+import json
+import os
 import re
+import uuid
 
-from agents.coordinator import get_coordinator_response
+from agents.coordinator import get_coordinator_response, aget_coordinator_response, alock_session_turn
+from core.turn_pool import coordinator_pool, PoolBusyError
+from agents.session_backend import SessionConflictError
+
+# /chat 을 비동기 경로로 실행 (기본값 false: coordinator_pool 워커 스레드에서 동기 실행)
+# Google Maps / Serper 호출은 아직 동기 클라이언트라 비동기 경로에서도 coordinator_pool.run_blocking 의
+# 제한된 스레드를 거친다 → LLM 호출만 비동기가 되고 Google 쪽 처리량은 스레드 경로와 같음
+COORDINATOR_ASYNC = os.getenv("COORDINATOR_ASYNC", "false").lower() in ("1", "true", "yes")
 
 router = APIRouter(
     prefix="/api/langgraph",
@@ -15,6 +27,7 @@ router = APIRouter(
 class ChatRequest(BaseModel):
     message: str
     conversation_history: Optional[List[dict]] = []
+    session_id: Optional[str] = None  # 없으면 서버가 새로 발급 (응답의 session_id 를 다음 요청에 그대로 전달)
 
 
 class UIElement(BaseModel):
@@ -28,189 +41,267 @@ class ChatResponse(BaseModel):
     phase: str  # chat
     required_info_complete: bool
     ui_elements: Optional[List[UIElement]] = []  # UI 요소 리스트
+    session_id: Optional[str] = None  # 대화 세션 ID
 
 
-@router.post("/chat", response_model=ChatResponse)
-async def langgraph_chat(request: ChatRequest):
+class ChatSession(BaseModel):
+    """요청에서 확정한 세션 정보"""
+    session_key: str  # 세션 저장소 키 (사용자별 네임스페이스 포함)
+    session_id: str   # 클라이언트에 돌려줄 세션 ID
+    user_id: str
+
+
+def _resolve_session(requested_session_id: Optional[str], authorization: Optional[str]) -> ChatSession:
     """
-    LangGraph Coordinator Agent 챗봇 엔드포인트
-    - LLM이 자동으로 Agent 선택
-    - Memory 기반 대화
+    요청 body 의 session_id 와 JWT(routers/auth.py 발급)로 세션 결정
+    - 로그인 사용자: user:{sub}:{session_id} → 다른 사용자가 같은 session_id 를 보내도 섞이지 않음
+    - 비로그인: anon:{session_id}
+    - 토큰이 잘못됐거나 만료됐으면 로그만 남기고 비로그인으로 처리 (채팅은 로그인 없이도 가능)
+    - session_id 가 없으면 새로 발급
     """
-    try:
-        print(f"\n=== Coordinator Agent 실행 ===")
-        print(f"입력: {request.message}")
+    user_id = None
+    if authorization and authorization.lower().startswith("bearer "):
+        from jose import JWTError, jwt
+        from routers.auth import SECRET_KEY, ALGORITHM
         
-        # Coordinator Agent 호출
+        try:
+            payload = jwt.decode(authorization[7:].strip(), SECRET_KEY, algorithms=[ALGORITHM])
+            user_id = payload.get("sub")
+        except JWTError as e:
+            print(f"⚠️ 유효하지 않은 토큰 → 비로그인 세션으로 처리: {e}")
+    
+    session_id = (requested_session_id or "").strip()[:128] or uuid.uuid4().hex
+    if user_id:
+        return ChatSession(session_key=f"user:{user_id}:{session_id}", session_id=session_id, user_id=str(user_id))
+    return ChatSession(session_key=f"anon:{session_id}", session_id=session_id, user_id="default_user")
+
+
+def _run_chat_turn(message: str, chat_session: ChatSession, callbacks: Optional[list] = None) -> ChatResponse:
+    """
+    Coordinator 한 턴 실행 + UI 요소 생성 (동기)
+    - LLM / Google Maps 호출이 모두 blocking 이라 coordinator_pool 워커 스레드에서 실행
+    - callbacks: SSE 스트리밍용 콜백 핸들러
+    """
+    print(f"\n=== Coordinator Agent 실행 ===")
+    print(f"입력: {message}")
+    
+    # Coordinator Agent 호출 (툴이 찾은 PlaceData 는 collector 에 모임)
+    from agents.utils.place_collector import collect_places_for_turn
+    
+    with collect_places_for_turn() as collector:
         response = get_coordinator_response(
-            message=request.message,
-            session_id="default"
+            message=message,
+            session_id=chat_session.session_key,
+            user_id=chat_session.user_id,
+            callbacks=callbacks
         )
+    
+    return _build_chat_response(response, collector, chat_session)
+
+
+async def _arun_chat_turn(message: str, chat_session: ChatSession) -> ChatResponse:
+    """
+    _run_chat_turn 비동기 버전 (coordinator_pool.arun 에서 이벤트 루프로 실행)
+    - OpenAI / Google 응답을 기다리는 동안 스레드를 점유하지 않음
+    - 장소 카드 보강(지오코딩)은 동기라 coordinator_pool.run_blocking
+    """
+    print(f"\n=== Coordinator Agent 실행 (async) ===")
+    print(f"입력: {message}")
+    
+    from agents.utils.place_collector import collect_places_for_turn
+    
+    with collect_places_for_turn() as collector:
+        response = await aget_coordinator_response(
+            message=message,
+            session_id=chat_session.session_key,
+            user_id=chat_session.user_id
+        )
+    
+    return await coordinator_pool.run_blocking(_build_chat_response, response, collector, chat_session)
+
+
+def _build_chat_response(response: str, collector, chat_session: ChatSession) -> ChatResponse:
+    """Coordinator 응답 + 이번 턴 장소 결과 → ChatResponse (UI 요소 생성)"""
+    print(f"응답: {response[:100]}...")
+    
+    # UI 요소 리스트
+    ui_elements = []
+    
+    # 출발지 관련 질문이면 지하철역 검색 버튼 추가
+    # "어디서 출발" 또는 "출발할 거냥" 포함 시 버튼 추가
+    # 단, "몇 시에 출발"은 제외 (시간 질문)
+    if ("어디서 출발" in response or "출발할 거냥" in response) and "몇 시" not in response:
+        from agents.utils.button_formatter import create_button_ui
         
-        print(f"응답: {response[:100]}...")
+        subway_button = create_button_ui(
+            text="🚇 지하철역 검색",
+            action="subway_search"
+        )
+        ui_elements.append(subway_button)
+        print(f"🚇 지하철역 검색 버튼 추가됨")
+    
+    # 시간 관련 질문이면 시간 선택 버튼 추가 (우선 체크)
+    # 매우 엄격하게 매칭: 시간 관련 질문에만 반응
+    time_keywords = ["몇 시에 출발", "출발 시간은", "출발 시각", "몇 시에 떠", "몇 시에 가"]
+    # "몇 시" 단독으로는 사용 안 함 ("몇 시간" 같은 단어와 혼동 방지)
+    if any(keyword in response for keyword in time_keywords):
+        from agents.utils.button_formatter import create_button_ui
         
-        # UI 요소 리스트
-        ui_elements = []
+        button_ui = create_button_ui(
+            text="⏰ 시간 선택",
+            action="time_picker"
+        )
+        ui_elements.append(button_ui)
+        print(f"⏰ 시간 선택 버튼 추가됨")
+    # 날짜 관련 질문이면 달력 열기 버튼 추가 (시간 키워드가 없을 때만)
+    # "언제" 단독으로는 사용 안 함 ("언제 1일차" 같은 질문과 혼동 방지)
+    # 하지만 "언제 여행", "언제 가" 같은 패턴은 감지
+    # 맛집/음식 관련 질문에는 절대 나타나지 않도록 함
+    date_keywords = [
+        "언제 출발", "언제 떠", "언제 가냥", "언제 갈", "언제 여행", "언제 가",
+        "여행 날짜", "출발 날짜", "며칠부터", "몇월 몇일",
+        "날짜 정해", "날짜 선택", "일정 정해", "일정 잡"
+    ]
+    # 맛집/음식 관련 키워드가 있으면 달력 버튼 표시 안 함
+    food_keywords = ["맛집", "음식", "먹고", "식당", "레스토랑", "점심", "저녁", "아침"]
+    has_food_keyword = any(keyword in response for keyword in food_keywords)
+    
+    if any(keyword in response for keyword in date_keywords) and not has_food_keyword:
+        from agents.utils.button_formatter import create_button_ui
+        
+        button_ui = create_button_ui(
+            text="📅 날짜 선택",
+            action="calendar_open"
+        )
+        ui_elements.append(button_ui)
+        print(f"👆 달력 열기 버튼 추가됨")
+    
+    # 장소 카드 1순위: 이번 턴에 툴이 반환한 PlaceData (정확한 좌표/주소, 추가 API 호출 없음)
+    place_cards = collector.to_place_cards(response)
+    if place_cards:
+        from agents.utils.ui_formatter import create_place_list_ui
         
-        # 출발지 관련 질문이면 지하철역 검색 버튼 추가
-        # "어디서 출발" 또는 "출발할 거냥" 포함 시 버튼 추가
-        # 단, "몇 시에 출발"은 제외 (시간 질문)
-        if ("어디서 출발" in response or "출발할 거냥" in response) and "몇 시" not in response:
-            from agents.utils.button_formatter import create_button_ui
+        ui_elements.append(create_place_list_ui(
+            places=place_cards,
+            title="추천 장소",
+            selection_mode="single"
+        ))
+        print(f"📍 장소 카드 UI 추가됨 (툴 결과): {len(place_cards)}개")
+        for place in place_cards:
+            print(f"  - {place['name']}: {place['address']}")
+    
+    # 장소 카드 2순위: 툴 결과가 없을 때만 응답 텍스트에서 추출
+    # 패턴: "🍟 **장소명**" 또는 "**5. 장소명**" 형식
+    # 주의: "무슨 음식" 같은 질문에는 장소 카드를 생성하지 않음
+    place_pattern = r'(?:\d+\.\s*)?(?:🍟|⭐|📍|🏨|☕|🍰)?\s*\*\*([^*]+)\*\*'
+    places_found = re.findall(place_pattern, response)
+    
+    # 실제 장소 추천인지 확인 ("추천", "소개" 같은 단어가 있어야 함)
+    is_recommendation = any(keyword in response for keyword in ["추천", "소개", "먹어봐", "가봐", "방문해봐"])
+    
+    if not place_cards and places_found and len(places_found) > 0 and is_recommendation:
+        # 장소명 필터링: 평점(4.8점), 숫자만 있는 것, 너무 짧은 것 제외
+        valid_places = []
+        for place_name in places_found:  # 모든 매칭 결과를 필터링
+            clean_name = place_name.strip()
             
-            subway_button = create_button_ui(
-                text="🚇 지하철역 검색",
-                action="subway_search"
-            )
-            ui_elements.append(subway_button)
-            print(f"🚇 지하철역 검색 버튼 추가됨")
-        
-        # 시간 관련 질문이면 시간 선택 버튼 추가 (우선 체크)
-        # 매우 엄격하게 매칭: 시간 관련 질문에만 반응
-        time_keywords = ["몇 시에 출발", "출발 시간은", "출발 시각", "몇 시에 떠", "몇 시에 가"]
-        # "몇 시" 단독으로는 사용 안 함 ("몇 시간" 같은 단어와 혼동 방지)
-        if any(keyword in response for keyword in time_keywords):
-            from agents.utils.button_formatter import create_button_ui
+            # 필터링 조건
+            # 1. 평점 패턴 제외 (예: "4.8점", "5점")
+            if re.match(r'^\d+\.?\d*점?$', clean_name):
+                print(f"⚠️ 평점으로 판단하여 제외: {clean_name}")
+                continue
             
-            button_ui = create_button_ui(
-                text="⏰ 시간 선택",
-                action="time_picker"
-            )
-            ui_elements.append(button_ui)
-            print(f"⏰ 시간 선택 버튼 추가됨")
-        # 날짜 관련 질문이면 달력 열기 버튼 추가 (시간 키워드가 없을 때만)
-        # "언제" 단독으로는 사용 안 함 ("언제 1일차" 같은 질문과 혼동 방지)
-        # 하지만 "언제 여행", "언제 가" 같은 패턴은 감지
-        # 맛집/음식 관련 질문에는 절대 나타나지 않도록 함
-        date_keywords = [
-            "언제 출발", "언제 떠", "언제 가냥", "언제 갈", "언제 여행", "언제 가",
-            "여행 날짜", "출발 날짜", "며칠부터", "몇월 몇일",
-            "날짜 정해", "날짜 선택", "일정 정해", "일정 잡"
-        ]
-        # 맛집/음식 관련 키워드가 있으면 달력 버튼 표시 안 함
-        food_keywords = ["맛집", "음식", "먹고", "식당", "레스토랑", "점심", "저녁", "아침"]
-        has_food_keyword = any(keyword in response for keyword in food_keywords)
-        
-        if any(keyword in response for keyword in date_keywords) and not has_food_keyword:
-            from agents.utils.button_formatter import create_button_ui
+            # 2. 숫자로 시작하는 패턴 제외 (예: "1.", "2)")
+            if re.match(r'^\d+[\.\)]', clean_name):
+                print(f"⚠️ 번호 매기기로 판단하여 제외: {clean_name}")
+                continue
             
-            button_ui = create_button_ui(
-                text="📅 날짜 선택",
-                action="calendar_open"
-            )
-            ui_elements.append(button_ui)
-            print(f"👆 달력 열기 버튼 추가됨")
-        
-        # 장소 정보가 있으면 place_list UI 생성
-        # 패턴: "🍟 **장소명**" 또는 "**5. 장소명**" 형식
-        # 주의: "무슨 음식" 같은 질문에는 장소 카드를 생성하지 않음
-        place_pattern = r'(?:\d+\.\s*)?(?:🍟|⭐|📍|🏨|☕|🍰)?\s*\*\*([^*]+)\*\*'
-        places_found = re.findall(place_pattern, response)
-        
-        # 실제 장소 추천인지 확인 ("추천", "소개" 같은 단어가 있어야 함)
-        is_recommendation = any(keyword in response for keyword in ["추천", "소개", "먹어봐", "가봐", "방문해봐"])
-        
-        if places_found and len(places_found) > 0 and is_recommendation:
-            # 장소명 필터링: 평점(4.8점), 숫자만 있는 것, 너무 짧은 것 제외
-            valid_places = []
-            for place_name in places_found:  # 모든 매칭 결과를 필터링
-                clean_name = place_name.strip()
-                
-                # 필터링 조건
-                # 1. 평점 패턴 제외 (예: "4.8점", "5점")
-                if re.match(r'^\d+\.?\d*점?$', clean_name):
-                    print(f"⚠️ 평점으로 판단하여 제외: {clean_name}")
-                    continue
-                
-                # 2. 숫자로 시작하는 패턴 제외 (예: "1.", "2)")
-                if re.match(r'^\d+[\.\)]', clean_name):
-                    print(f"⚠️ 번호 매기기로 판단하여 제외: {clean_name}")
-                    continue
-                
-                # 3. 최소 2글자 이상의 한글 또는 영문이 포함되어야 함
-                if not re.search(r'[가-힣]{2,}|[a-zA-Z]{2,}', clean_name):
-                    print(f"⚠️ 유효한 장소명이 아님: {clean_name}")
-                    continue
-                
-                # 4. 길이 체크 (1글자는 제외)
-                if len(clean_name) <= 1:
-                    continue
-                
-                valid_places.append(clean_name)
+            # 3. 최소 2글자 이상의 한글 또는 영문이 포함되어야 함
+            if not re.search(r'[가-힣]{2,}|[a-zA-Z]{2,}', clean_name):
+                print(f"⚠️ 유효한 장소명이 아님: {clean_name}")
+                continue
+            
+            # 4. 길이 체크 (1글자는 제외)
+            if len(clean_name) <= 1:
+                continue
+            
+            valid_places.append(clean_name)
+        
+        # 필터링 후 최대 5개만 선택
+        valid_places = valid_places[:5]
+        
+        # 유효한 장소가 없으면 UI 생성 안 함
+        if not valid_places:
+            print("⚠️ 유효한 장소명이 없어 place_list UI 생성 안 함")
+        else:
+            # 장소 정보를 추출하여 UI 요소 생성
+            from agents.utils.ui_formatter import create_place_list_ui
+            from agents.utils.place_enricher import enrich_places
             
-            # 필터링 후 최대 5개만 선택
-            valid_places = valid_places[:5]
+            # 응답에서 주소 정보도 추출 시도
+            # 패턴: "주소: ...", "위치: ...", "주소지: ..." 등
+            address_pattern = r'(?:주소|위치|Address)\s*[:|은|가]?\s*([^\n]+)'
+            addresses = re.findall(address_pattern, response)
             
-            # 유효한 장소가 없으면 UI 생성 안 함
-            if not valid_places:
-                print("⚠️ 유효한 장소명이 없어 place_list UI 생성 안 함")
-            else:
-                # 장소 정보를 추출하여 UI 요소 생성
-                from agents.utils.ui_formatter import create_place_list_ui
-                import googlemaps
-                import os
-                
-                # Google Maps API 클라이언트 초기화
-                gmaps = googlemaps.Client(key=os.getenv('GOOGLE_MAPS_API_KEY'))
-                
-                # 응답에서 주소 정보도 추출 시도
-                # 패턴: "주소: ...", "위치: ...", "주소지: ..." 등
-                address_pattern = r'(?:주소|위치|Address)\s*[:|은|가]?\s*([^\n]+)'
-                addresses = re.findall(address_pattern, response)
-
-                
-                # 간단한 장소 데이터 생성
-                places_data = []
-                for idx, clean_name in enumerate(valid_places):
-                    # 해당 장소의 주소를 찾기 (응답에서 장소명 뒤에 주소가 있을 수 있음)
-                    place_address = addresses[idx].strip() if idx < len(addresses) else "주소 정보 없음"
-                    
-                    # Google Geocoding API로 좌표 가져오기
-                    lat, lng = 0, 0
-                    try:
-                        # 가게 이름 + 주소로 검색
-                        search_query = f"{clean_name} {place_address}" if place_address != "주소 정보 없음" else clean_name
-                        geocode_result = gmaps.geocode(search_query, language='ko')
-                        
-                        if geocode_result and len(geocode_result) > 0:
-                            location = geocode_result[0]['geometry']['location']
-                            lat = location['lat']
-                            lng = location['lng']
-                            # 주소가 없었으면 Geocoding 결과에서 가져오기
-                            if place_address == "주소 정보 없음":
-                                place_address = geocode_result[0].get('formatted_address', '주소 정보 없음')
-                            print(f"✅ 좌표 찾음: {clean_name} → ({lat}, {lng})")
-                        else:
-                            print(f"⚠️ 좌표 못 찾음: {clean_name}")
-                    except Exception as e:
-                        print(f"❌ Geocoding 에러: {clean_name} - {e}")
-                    
-                    places_data.append({
-                        "name": clean_name,
-                        "address": place_address,
-                        "lat": lat,
-                        "lng": lng,
-                        "tags": [],
-                        "google_maps_url": f"https://www.google.com/maps/search/?api=1&query={clean_name.replace(' ', '+')}"
-                    })
-                
-                if places_data:
-                    place_list_ui = create_place_list_ui(
-                        places=places_data,
-                        title="추천 장소",
-                        selection_mode="single"
-                    )
-                    ui_elements.append(place_list_ui)
-                    print(f"📍 장소 카드 UI 추가됨: {len(places_data)}개")
-                    for place in places_data:
-                        print(f"  - {place['name']}: {place['address']}")
-        
-        # 결과 구성
-        return ChatResponse(
-            response=response,
-            phase="chat",
-            required_info_complete=True,
-            ui_elements=ui_elements
+            # 좌표 보강: 캐시 우선, 캐시 미스만 동시 지오코딩 (마감 시간 내)
+            places_data = enrich_places(valid_places, addresses)
+            
+            if places_data:
+                place_list_ui = create_place_list_ui(
+                    places=places_data,
+                    title="추천 장소",
+                    selection_mode="single"
+                )
+                ui_elements.append(place_list_ui)
+                print(f"📍 장소 카드 UI 추가됨: {len(places_data)}개")
+                for place in places_data:
+                    print(f"  - {place['name']}: {place['address']}")
+    
+    # 결과 구성
+    return ChatResponse(
+        response=response,
+        phase="chat",
+        required_info_complete=True,
+        ui_elements=ui_elements,
+        session_id=chat_session.session_id
+    )
+
+
+def _pool_busy_error(e: PoolBusyError) -> HTTPException:
+    """풀 포화 / 세션 lock 대기 초과 → 429/503 + Retry-After"""
+    print(f"⚠️ Coordinator 풀 포화 ({e.status_code}): {coordinator_pool.get_stats()}")
+    return HTTPException(
+        status_code=e.status_code,
+        detail=str(e),
+        headers={"Retry-After": str(e.retry_after)}
+    )
+
+
+@router.post("/chat", response_model=ChatResponse)
+async def langgraph_chat(request: ChatRequest, authorization: Optional[str] = Header(None)):
+    """
+    LangGraph Coordinator Agent 챗봇 엔드포인트
+    - LLM이 자동으로 Agent 선택
+    - Memory 기반 대화
+    - 턴은 coordinator_pool 에서 실행 (이벤트 루프 블로킹 방지, 포화 시 429/503)
+    - COORDINATOR_ASYNC=true 면 비동기 경로 (LLM 호출은 await, Google / Serper 호출은 제한된 스레드)
+    - 세션: body 의 session_id + Authorization 헤더의 JWT
+    """
+    chat_session = _resolve_session(request.session_id, authorization)
+    
+    try:
+        if COORDINATOR_ASYNC:
+            return await coordinator_pool.arun(_arun_chat_turn, request.message, chat_session)
+        return await coordinator_pool.run(_run_chat_turn, request.message, chat_session)
+        
+    except PoolBusyError as e:
+        raise _pool_busy_error(e)
+        
+    except SessionConflictError as e:
+        print(f"⚠️ {e}")
+        raise HTTPException(
+            status_code=409,
+            detail="같은 대화에서 다른 요청이 먼저 처리되었어요. 다시 시도해주세요."
         )
         
     except Exception as e:
@@ -224,6 +315,91 @@ async def langgraph_chat(request: ChatRequest):
         )
 
 
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """SSE 프레임 포맷"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/chat/stream")
+async def langgraph_chat_stream(request: ChatRequest, authorization: Optional[str] = Header(None)):
+    """
+    LangGraph Coordinator Agent 스트리밍 엔드포인트 (Server-Sent Events)
+    
+    이벤트 순서:
+    - start: 턴 시작 (슬롯 확보 직후 바로 전송 → 첫 바이트까지의 시간 단축)
+    - token: Coordinator LLM 토큰
+    - tool_start / tool_end: 에이전트/툴 호출 진행 상황
+    - done: 최종 ChatResponse (response + ui_elements)
+    - error: 실행 실패
+    """
+    chat_session = _resolve_session(request.session_id, authorization)
+    
+    # 같은 세션의 비동기 턴(/chat)과 순서를 맞추기 위해 세션 lock 부터 (턴이 끝나면 해제)
+    # 풀 포화 / lock 대기 초과는 스트림을 열기 전에 판단해야 429/503 상태 코드를 줄 수 있음
+    try:
+        release_session = await alock_session_turn(chat_session.session_key, chat_session.user_id)
+    except PoolBusyError as e:
+        raise _pool_busy_error(e)
+    
+    try:
+        await coordinator_pool.acquire()
+    except PoolBusyError as e:
+        release_session()
+        raise _pool_busy_error(e)
+    except BaseException:
+        release_session()  # 대기 중 클라이언트 연결 끊김 (CancelledError)
+        raise
+    
+    # 슬롯 확보 후 submit 전에 실패하면 슬롯을 돌려줄 done 콜백이 없으므로 직접 반환
+    try:
+        from agents.utils.stream_handler import StreamingEventHandler
+        
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+        
+        def emit(event: Optional[Dict[str, Any]]) -> None:
+            loop.call_soon_threadsafe(events.put_nowait, event)
+        
+        def run_turn() -> ChatResponse:
+            try:
+                return _run_chat_turn(request.message, chat_session, callbacks=[StreamingEventHandler(emit)])
+            finally:
+                emit(None)  # 스트림 종료 신호
+                # 클라이언트가 끊겨도 스레드가 끝날 때까지 세션 lock 유지
+                loop.call_soon_threadsafe(release_session)
+        
+        future = coordinator_pool.submit(run_turn)
+    except Exception:
+        coordinator_pool.release_unused()
+        release_session()
+        raise
+    
+    async def event_stream():
+        yield _sse("start", {"message": request.message, "session_id": chat_session.session_id})
+        
+        while True:
+            event = await events.get()
+            if event is None:
+                break
+            yield _sse(event["event"], event["data"])
+        
+        try:
+            result = await future
+            yield _sse("done", result.model_dump())
+        except SessionConflictError as e:
+            print(f"⚠️ {e}")
+            yield _sse("error", {"status": 409, "detail": "같은 대화에서 다른 요청이 먼저 처리되었어요. 다시 시도해주세요."})
+        except Exception as e:
+            print(f"Coordinator 스트리밍 에러: {e}")
+            yield _sse("error", {"detail": f"Coordinator 실행 실패: {str(e)}"})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/health")
 async def langgraph_health():
     """
@@ -235,3 +411,50 @@ async def langgraph_health():
         "agents": ["restaurant", "dessert", "accommodation", "landmark", "region", "chat"],
         "architecture": "LangChain Coordinator + LangGraph Agents"
     }
+
+
+@router.get("/metrics")
+async def langgraph_metrics():
+    """
+    Coordinator 실행 풀 / 캐시 메트릭
+    """
+    from agents.utils.place_enricher import get_enricher_stats
+    from agents.utils.llm_registry import get_llm_stats
+    from agents.utils.llm_cache import get_llm_cache_stats
+    from agents.fast_path import get_fast_path_stats
+    from agents.utils.search_pipeline import get_search_pipeline_stats
+    from agents.utils.places_cache import get_places_cache_stats
+    from agents.utils.gazetteer import get_gazetteer_stats
+    from agents.session_store import session_store
+    
+    return {
+        "pool": coordinator_pool.get_stats(),
+        "sessions": session_store.get_stats(),
+        "place_enrich_cache": get_enricher_stats(),
+        "llm_clients": get_llm_stats(),
+        "llm_response_cache": get_llm_cache_stats(),
+        "fast_path": get_fast_path_stats(),
+        "search_pipeline": get_search_pipeline_stats(),
+        "places_cache": get_places_cache_stats(),
+        "gazetteer": get_gazetteer_stats()
+    }
+
+
+@router.get("/session/{session_id}/stats")
+async def langgraph_session_stats(session_id: str, authorization: Optional[str] = Header(None)):
+    """
+    세션별 대화 메모리 토큰 사용량 (요약 메모리로 절약한 토큰 확인용)
+    - 세션 백엔드(sqlite / redis)가 있으면 다른 워커에서 처리한 세션도 조회
+    """
+    from agents.session_store import session_store
+    
+    chat_session = _resolve_session(session_id, authorization)
+    session = await coordinator_pool.run_blocking(session_store.peek, chat_session.session_key)
+    if session is None:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
+    
+    return {
+        "session_id": chat_session.session_id,
+        "current_step": session.flow_state.current_step,
+        "memory": session.memory.get_stats()
+    }
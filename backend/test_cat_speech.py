@@ -0,0 +1,140 @@
+"""
+고양이 말투 변환기 테스트 스크립트
+
+1. 충실도(fidelity): 어미 변환 코퍼스 (입력 → 기대 결과) + 내용 보존 검사 (pytest 로도 실행)
+2. 지연 시간 벤치마크: 규칙 기반 to_cat_speech vs 예전 LLM 변환 (OPENAI_API_KEY 있을 때만)
+
+실행: python test_cat_speech.py [--llm]
+"""
+
+import os
+import re
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from agents.utils.cat_speech import to_cat_speech, llm_cat_speech, missing_slot_question
+
+
+# (입력, 기대 결과) - 이모지 자동 추가는 끄고 비교
+CORPUS = [
+    # 합쇼체
+    ("부산은 바다가 아름답습니다.", "부산은 바다가 아름답다냥."),
+    ("맛집 5곳을 추천합니다!", "맛집 5곳을 추천하다냥!"),
+    ("해운대는 부산의 대표 관광지입니다.", "해운대는 부산의 대표 관광지이다냥."),
+    ("어디로 가시겠습니까?", "어디로 가시겠냥?"),
+    ("지금 출발합니까?", "지금 출발하냥?"),
+    # 해요체
+    ("분위기가 정말 좋아요!", "분위기가 정말 좋아냥!"),
+    ("여기는 현지인 맛집이에요.", "여기는 현지인 맛집이다냥."),
+    ("오늘 가기 좋은 카페예요.", "오늘 가기 좋은 카페다냥."),
+    ("마음에 드는 곳을 골라주세요!", "마음에 드는 곳을 골라달라냥!"),
+    ("번호로 선택하세요.", "번호로 선택하라냥."),
+    ("어디로 가고 싶으세요?", "어디로 가고 싶으냥?"),
+    ("어디로 가고 싶으세요", "어디로 가고 싶으냥"),
+    ("지도에서 위치를 확인하세요.", "지도에서 위치를 확인하라냥."),
+    ("숙소는 천천히 골라보세요!", "숙소는 천천히 골라보라냥!"),
+    ("사진보다 실물이 더 멋지세요!", "사진보다 실물이 더 멋지다냥!"),
+    ("안녕하세요!", "안녕하냥!"),
+    ("안녕하세요? 여행 도우미예요.", "안녕하냥? 여행 도우미다냥."),
+    ("조심히 안녕히 가세요!", "조심히 안녕히 가라냥!"),
+    ("다음에 또 봐요, 안녕히 계세요.", "다음에 또 봐요, 안녕히 계시라냥."),
+    ("다른 곳도 볼까요?", "다른 곳도 볼까냥?"),
+    ("예약이 필요한가요?", "예약이 필요한가냥?"),
+    ("주차할 수 있나요?", "주차할 수 있냥?"),
+    ("여기 진짜 맛있죠?", "여기 진짜 맛있지냥?"),
+    # 해라체 / 반말
+    ("바다가 보이는 숙소다.", "바다가 보이는 숙소다."),
+    ("정말 맛있다!", "정말 맛있다냥!"),
+    ("이제 떠난다!", "이제 떠난다냥!"),
+    ("뭐 먹고 싶어?", "뭐 먹고 싶어냥?"),
+    ("예산은 얼마야?", "예산은 얼마냥?"),
+    ("몇 명이서 가니?", "몇 명이서 가냥?"),
+    ("번호 알려줘!", "번호 알려달라냥!"),
+    ("여기 최고야!", "여기 최고다냥!"),
+    # 이미 고양이 말투 / 바꾸면 안 되는 것
+    ("좋다냥!", "좋다냥!"),
+    ("부산 동해", "부산 동해"),
+    ("추천 관광지", "추천 관광지"),
+    ("- 주소: 부산광역시 해운대구 우동 540-6", "- 주소: 부산광역시 해운대구 우동 540-6"),
+    ("## 🍽️ 맛집 추천 결과입니다", "## 🍽️ 맛집 추천 결과입니다"),
+    # 이모지 / 여러 문장
+    ("좋은 선택입니다! 😊 다음은 카페를 골라주세요.", "좋은 선택이다냥! 😊 다음은 카페를 골라달라냥."),
+    ("**고반식당**은 곱창이 유명해요! 🔥", "**고반식당**은 곱창이 유명해냥! 🔥"),
+]
+
+
+def strip_endings(text: str) -> str:
+    """내용 보존 검사용: 문장 마지막 어절을 빼고 비교"""
+    sentences = re.split(r"(?<=[.!?])\s+", text)
+    return " ".join(s.rsplit(" ", 1)[0] if " " in s else "" for s in sentences)
+
+
+def test_fidelity():
+    """코퍼스 전체가 기대 결과와 같아야 하고, 마지막 어절 외의 내용은 그대로여야 함"""
+    for source, expected in CORPUS:
+        result = to_cat_speech(source, add_emoji=False)
+        assert result == expected, f"{source!r} → {result!r} (기대: {expected!r})"
+        assert strip_endings(result) == strip_endings(source), f"내용이 바뀜: {source!r} → {result!r}"
+
+
+def report_fidelity():
+    print("=" * 60)
+    print("🐱 고양이 말투 변환 충실도 테스트")
+    print("=" * 60)
+
+    passed, preserved = 0, 0
+    for source, expected in CORPUS:
+        result = to_cat_speech(source, add_emoji=False)
+        ok = result == expected
+        passed += ok
+        preserved += strip_endings(result) == strip_endings(source)
+        mark = "✅" if ok else "❌"
+        print(f"{mark} {source}\n   → {result}" + ("" if ok else f"\n   (기대: {expected})"))
+
+    total = len(CORPUS)
+    print(f"\n📊 어미 변환 일치: {passed}/{total} ({passed / total:.0%})")
+    print(f"📊 내용 보존 (마지막 어절 제외 동일): {preserved}/{total} ({preserved / total:.0%})")
+
+    print("\n[질문 템플릿]")
+    for name in ["목적지", "여행 날짜/기간", "예산", "출발 시간", "출발지"]:
+        print(f"- {name}: {missing_slot_question(name).splitlines()[0]}")
+
+
+def benchmark(use_llm: bool):
+    print("\n" + "=" * 60)
+    print("⏱️ 지연 시간 벤치마크")
+    print("=" * 60)
+
+    samples = [source for source, _ in CORPUS]
+    long_text = "\n".join(samples)
+
+    iterations = 200
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for sample in samples:
+            to_cat_speech(sample)
+        to_cat_speech(long_text)
+    local_ms = (time.perf_counter() - started) * 1000 / (iterations * (len(samples) + 1))
+    print(f"규칙 기반: 평균 {local_ms:.3f}ms / 호출")
+
+    if not use_llm:
+        print("LLM 비교는 --llm 옵션으로 실행 (OPENAI_API_KEY 필요)")
+        return
+    if not os.getenv("OPENAI_API_KEY"):
+        print("⚠️ OPENAI_API_KEY 없음 → LLM 비교 생략")
+        return
+
+    timings = []
+    for sample in samples[:5] + [long_text]:
+        started = time.perf_counter()
+        llm_cat_speech(sample)
+        timings.append((time.perf_counter() - started) * 1000)
+    llm_ms = sum(timings) / len(timings)
+    print(f"LLM (gpt-4o-mini): 평균 {llm_ms:.0f}ms / 호출")
+    print(f"→ 약 {llm_ms / max(local_ms, 1e-6):,.0f}배 빠름")
+
+
+if __name__ == "__main__":
+    report_fidelity()
+    benchmark("--llm" in sys.argv)
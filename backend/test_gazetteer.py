@@ -0,0 +1,126 @@
+"""
+지명 사전 테스트 스크립트 (agents/utils/gazetteer.py)
+
+1. 번들 사전: 이름 / 접미사 뗀 별칭 / 상위 지역을 붙인 키 / "근처" 같은 군더더기
+2. 모호한 이름("중구", "강서구", "고성"): 로컬에서 고르지 않고 API 로
+3. 오버레이: API 로 찾은 국내 좌표를 파일에 기록 → 새 인스턴스(재시작)에서도 API 없이 해결
+   해외 좌표 / 빈 결과는 기록하지 않음, 같은 지역명을 여러 스레드가 동시에 물어도 API 는 1번
+
+실행: python test_gazetteer.py (pytest 로도 실행 가능, API 키 필요 없음 - 가짜 googlemaps 클라이언트)
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from agents.utils.gazetteer import Gazetteer, normalize_region
+
+
+class FakeGmaps:
+    """geocode 호출을 기록하는 가짜 googlemaps 클라이언트"""
+
+    def __init__(self, results: dict, delay: float = 0.0):
+        self.results = results  # 지역명 → (위도, 경도, 주소), "근처" 같은 군더더기는 무시
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def geocode(self, address: str, **kwargs):
+        with self._lock:
+            self.calls.append(address)
+        time.sleep(self.delay)
+        found = next((value for name, value in self.results.items()
+                      if normalize_region(name) == normalize_region(address)), None)
+        if found is None:
+            return []
+        lat, lng, formatted = found
+        return [{"formatted_address": formatted, "geometry": {"location": {"lat": lat, "lng": lng}}}]
+
+
+# ==================== 번들 사전 ====================
+
+def test_bundled_lookup():
+    gazetteer = Gazetteer(overlay_path="")
+    assert gazetteer.lookup("해운대")["source"] == "gazetteer"
+    # 같은 곳을 가리키는 여러 표현
+    for text in ["부산 해운대", "부산해운대", "해운대 근처", "해운대, 대한민국"]:
+        assert gazetteer.lookup(text)["name"] == gazetteer.lookup("해운대")["name"], text
+    assert gazetteer.lookup("강남")["name"] == gazetteer.lookup("강남구")["name"]
+    assert gazetteer.lookup("연남")["name"] == gazetteer.lookup("연남동")["name"]
+    assert gazetteer.lookup("없는동네이름") is None
+
+
+# ==================== 모호한 이름 ====================
+
+def test_ambiguous_names_go_to_api():
+    gmaps = FakeGmaps({
+        "중구": (37.5641, 126.9979, "대한민국 서울특별시 중구"),
+        "강서구": (37.5509, 126.8495, "대한민국 서울특별시 강서구"),
+        "고성": (38.3806, 128.4678, "대한민국 강원특별자치도 고성군"),
+    })
+    gazetteer = Gazetteer(overlay_path="")
+    for name in ["중구", "강서구", "고성"]:
+        assert gazetteer.lookup(name) is None, name  # 여러 곳에 있는 이름 → 로컬에서 고르지 않음
+        result = gazetteer.resolve(gmaps, name)
+        assert result[0]["formatted_address"] == gmaps.results[name][2]
+    assert gmaps.calls == ["중구, 대한민국", "강서구, 대한민국", "고성, 대한민국"]
+
+    # 상위 지역을 붙이면 로컬에서 해결
+    assert gazetteer.lookup("부산 중구")["name"] == "부산광역시 중구"
+    assert gazetteer.lookup("서울 강서구")["name"] == "서울특별시 강서구"
+    assert gazetteer.lookup("강원 고성")["kind"] == "sigungu"
+
+
+# ==================== 오버레이 ====================
+
+def test_overlay_write_back():
+    with tempfile.TemporaryDirectory() as tmp:
+        overlay_path = os.path.join(tmp, "gazetteer_overlay.json")
+        gmaps = FakeGmaps({
+            "장생포": (35.5048, 129.3812, "대한민국 울산광역시 남구 장생포동"),
+            "오사카": (34.6937, 135.5023, "일본 오사카"),
+        })
+
+        gazetteer = Gazetteer(overlay_path=overlay_path)
+        assert gazetteer.resolve(gmaps, "장생포 근처")[0]["formatted_address"] == "대한민국 울산광역시 남구 장생포동"
+        assert gazetteer.resolve(gmaps, "장생포")[0]["source"] == "overlay"  # 같은 키 → API 재호출 없음
+        assert gmaps.calls == ["장생포 근처, 대한민국"]
+
+        # 해외 좌표 / 빈 결과는 기록하지 않음
+        assert gazetteer.resolve(gmaps, "오사카")
+        assert gazetteer.resolve(gmaps, "없는곳") == []
+        with open(overlay_path, encoding="utf-8") as f:
+            assert list(json.load(f)["entries"]) == ["장생포"]
+        assert gazetteer.get_stats()["writebacks"] == 1
+
+        # 새 인스턴스(재시작)도 파일에서 읽어서 API 없이 해결
+        restarted = Gazetteer(overlay_path=overlay_path)
+        found = restarted.lookup("장생포")
+        assert (found["source"], found["lat"], found["lng"]) == ("overlay", 35.5048, 129.3812)
+        assert restarted.resolve(FakeGmaps({}), "장생포")[0]["formatted_address"] == "대한민국 울산광역시 남구 장생포동"
+        assert restarted.lookup("오사카") is None
+
+
+def test_concurrent_lookups_call_api_once():
+    gmaps = FakeGmaps({"장생포": (35.5048, 129.3812, "대한민국 울산광역시 남구 장생포동")}, delay=0.05)
+    gazetteer = Gazetteer(overlay_path="")
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(gazetteer.resolve(gmaps, "장생포"))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(gmaps.calls) == 1
+    assert len(results) == 5 and all(result[0]["geometry"]["location"]["lat"] == 35.5048 for result in results)
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n📊 {len(tests)}개 테스트 통과")
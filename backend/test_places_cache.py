@@ -0,0 +1,163 @@
+"""
+nearby 검색 타일 캐시 테스트 스크립트 (agents/utils/geo_tiles.py, agents/utils/places_cache.py)
+
+1. geo_tiles: geohash, 반경에 맞춘 타일 크기, 반경 단계, 거리
+2. CachedPlacesClient._nearby_by_tile:
+   - 미스: 반경 단계로 한 번 검색, 같은 타일 / 같은 단계의 검색은 API 재호출 없음
+   - 적중: 요청 중심에서 요청 반경 안에 있는 장소만 (정확한 거리로 다시 거름, 순서 유지)
+   - 다른 인자(keyword) / 다른 반경 단계는 다른 키
+
+실행: python test_places_cache.py (pytest 로도 실행 가능, API 키 필요 없음 - 가짜 googlemaps 클라이언트)
+"""
+
+import math
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from agents.utils import places_cache
+from agents.utils.geo_tiles import geohash_encode, haversine_m, radius_bucket, tile_precision, tile_size_m
+from agents.utils.places_cache import CachedPlacesClient, PlacesResponseCache
+
+
+HAEUNDAE = (35.1587, 129.1604)
+METERS_PER_LAT_DEGREE = 111195  # haversine 기준 위도 1도
+
+
+def _north(point: tuple, meters: float) -> tuple:
+    return point[0] + meters / METERS_PER_LAT_DEGREE, point[1]
+
+
+def _place(place_id: str, location: tuple) -> dict:
+    return {"place_id": place_id, "geometry": {"location": {"lat": location[0], "lng": location[1]}}}
+
+
+class FakeGmaps:
+    """places_nearby 호출을 기록하는 가짜 googlemaps 클라이언트 (실제 API 처럼 반경 안의 장소만 반환)"""
+
+    def __init__(self, places: list):
+        self.places = places
+        self.calls = []
+
+    def places_nearby(self, **kwargs):
+        self.calls.append(kwargs)
+        lat, lng = kwargs["location"]
+        results = [
+            dict(p) for p in self.places
+            if haversine_m(lat, lng, p["geometry"]["location"]["lat"], p["geometry"]["location"]["lng"]) <= kwargs["radius"]
+        ]
+        return {"status": "OK" if results else "ZERO_RESULTS", "results": results, "next_page_token": "token"}
+
+
+def _with_cache(test):
+    """테스트마다 메모리 전용 캐시 (디스크 / 다른 테스트 결과와 섞이지 않도록)"""
+    def wrapper():
+        previous = places_cache._cache
+        places_cache._cache = PlacesResponseCache(path=None)
+        try:
+            test()
+        finally:
+            places_cache._cache = previous
+    wrapper.__name__ = test.__name__
+    return wrapper
+
+
+# ==================== geo_tiles ====================
+
+def test_geohash():
+    assert geohash_encode(57.64911, 10.40744, 11) == "u4pruydqqvj"  # 위키백과 예시
+    assert geohash_encode(*HAEUNDAE, 7).startswith(geohash_encode(*HAEUNDAE, 5))
+
+
+def test_tile_precision_fits_radius():
+    for radius in (500, 1500, 5000, 20000):
+        precision = tile_precision(radius, HAEUNDAE[0])
+        height, width = tile_size_m(precision, HAEUNDAE[0])
+        assert math.hypot(height, width) <= radius * 0.25, radius
+        # 한 단계 거친 타일은 반경에 비해 너무 큼 (가장 거친 precision 을 고름)
+        coarser = tile_size_m(precision - 1, HAEUNDAE[0])
+        assert math.hypot(*coarser) > radius * 0.25, radius
+    assert tile_precision(500, HAEUNDAE[0]) > tile_precision(20000, HAEUNDAE[0])
+
+
+def test_radius_bucket():
+    assert radius_bucket(1500) == 1500   # 코드에서 쓰는 값은 그대로
+    assert radius_bucket(1200) == 1500   # 그 외는 올림
+    assert radius_bucket(3001) == 5000
+    assert radius_bucket(60000) == 60000  # 단계보다 크면 그대로
+
+
+def test_haversine():
+    assert abs(haversine_m(*HAEUNDAE, *_north(HAEUNDAE, 1000)) - 1000) < 1
+    assert abs(haversine_m(37.5547, 126.9707, 35.1151, 129.0422) - 325000) < 5000  # 서울역 ~ 부산역
+
+
+# ==================== _nearby_by_tile ====================
+
+@_with_cache
+def test_nearby_miss_then_tile_hit():
+    gmaps = FakeGmaps([
+        _place("center", HAEUNDAE),
+        _place("800m", _north(HAEUNDAE, 800)),
+        _place("1400m", _north(HAEUNDAE, 1400)),
+    ])
+    client = CachedPlacesClient(gmaps)
+
+    # 요청 반경 1200 → 단계 1500 으로 검색, 1200 밖(1400m)은 걸러짐
+    response = client.places_nearby(location=HAEUNDAE, radius=1200, type="restaurant")
+    assert [p["place_id"] for p in response["results"]] == ["center", "800m"]
+    assert gmaps.calls[0]["radius"] == 1500
+    assert "next_page_token" not in response  # 다른 반경으로 만든 토큰은 버림
+
+    # 같은 타일 안에서 중심이 조금 옮겨간 검색 → API 재호출 없이 새 중심 기준 거리로 다시 거름
+    shifted = _north(HAEUNDAE, 30)
+    precision = tile_precision(1500, HAEUNDAE[0])
+    assert geohash_encode(*shifted, precision) == geohash_encode(*HAEUNDAE, precision)
+    response = client.places_nearby(location=shifted, radius=1400, type="restaurant")
+    assert len(gmaps.calls) == 1
+    assert [p["place_id"] for p in response["results"]] == ["center", "800m", "1400m"]  # 1370m, 순서 유지
+
+    response = client.places_nearby(location=shifted, radius=500, type="restaurant")
+    assert len(gmaps.calls) == 2  # 반경 단계가 다르면 다른 키
+    assert [p["place_id"] for p in response["results"]] == ["center"]
+
+
+@_with_cache
+def test_nearby_exact_request_returns_cached_response():
+    gmaps = FakeGmaps([_place("center", HAEUNDAE), _place("1400m", _north(HAEUNDAE, 1400))])
+    client = CachedPlacesClient(gmaps)
+
+    first = client.places_nearby(location=HAEUNDAE, radius=1500, keyword="국밥")
+    second = client.places_nearby(location=HAEUNDAE, radius=1500, keyword="국밥")
+    assert len(gmaps.calls) == 1
+    assert first == second and second["next_page_token"] == "token"  # 중심/반경이 같으면 그대로
+
+    client.places_nearby(location=HAEUNDAE, radius=1500, keyword="밀면")
+    assert len(gmaps.calls) == 2  # 검색 인자가 다르면 다른 키
+
+
+@_with_cache
+def test_nearby_refilter_does_not_touch_cache():
+    gmaps = FakeGmaps([_place("center", HAEUNDAE), _place("1400m", _north(HAEUNDAE, 1400))])
+    client = CachedPlacesClient(gmaps)
+
+    narrow = client.places_nearby(location=HAEUNDAE, radius=1200, type="cafe")
+    assert [p["place_id"] for p in narrow["results"]] == ["center"]
+    narrow["results"].clear()  # 호출부가 결과를 바꿔도 캐시는 그대로
+
+    wide = client.places_nearby(location=HAEUNDAE, radius=1500, type="cafe")
+    assert [p["place_id"] for p in wide["results"]] == ["center", "1400m"]
+    assert len(gmaps.calls) == 1  # 1200 / 1500 은 같은 단계
+
+    # 반경 안에 아무것도 없으면 ZERO_RESULTS (반경 10 → 단계 500 으로 새로 검색)
+    empty = client.places_nearby(location=_north(HAEUNDAE, 30), radius=10, type="cafe")
+    assert empty["status"] == "ZERO_RESULTS" and empty["results"] == []
+    assert len(gmaps.calls) == 2
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n📊 {len(tests)}개 테스트 통과")
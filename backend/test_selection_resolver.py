@@ -0,0 +1,139 @@
+"""
+추천 목록 선택 해석기 테스트 스크립트 (agents/utils/selection_resolver.py)
+
+1. 서수 / 번호: "두 번째", "2번", "마지막 거", "열두 번째"(범위 밖 → "두 번째" 로 잘못 읽지 않음)
+2. 번호만 있는 답("2", "1,3"): 직전 응답에 목록이 보였을 때만 선택
+3. "말고" / "다른 데" → 새 검색 요청이라 선택 아님
+4. 이름: 전체 이름, 첫 단어, 마지막 단어("모모스" → "카페 모모스"), 겹치는 단어는 무시
+5. 후속 요청 종류: 리뷰 / 메뉴 / 상세
+
+실행: python test_selection_resolver.py (pytest 로도 실행 가능, API 키 필요 없음)
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from agents.utils.selection_resolver import match_names, parse_ordinals, resolve_selection
+
+
+RESTAURANTS = [
+    {"place_id": "r1", "name": "고반식당 해운대점", "category": "restaurant"},
+    {"place_id": "r2", "name": "해운대 암소갈비집", "category": "restaurant"},
+    {"place_id": "r3", "name": "해운대 기와집대구탕", "category": "restaurant"},
+]
+CAFES = [
+    {"place_id": "c1", "name": "카페 모모스", "category": "cafe"},
+    {"place_id": "c2", "name": "웨이브온 커피", "category": "cafe"},
+]
+RECOMMENDATIONS = {"restaurant": RESTAURANTS, "cafe": CAFES}
+
+# 직전 챗봇 응답 (식당 목록이 보인 경우 / 지역 선택지만 보인 경우)
+RESTAURANT_REPLY = "1. 고반식당 해운대점\n2. 해운대 암소갈비집\n3. 해운대 기와집대구탕\n어디가 좋냥?"
+REGION_REPLY = "1. 해운대\n2. 광안리\n3. 서면\n어느 동네로 갈까냥?"
+
+
+def _ids(result):
+    return [place["place_id"] for place in result["places"]] if result else None
+
+
+# ==================== 서수 / 번호 ====================
+
+def test_parse_ordinals():
+    assert parse_ordinals("두 번째 거", 3) == [1]
+    assert parse_ordinals("첫번째랑 세 번째", 3) == [0, 2]
+    assert parse_ordinals("둘째", 3) == [1]
+    assert parse_ordinals("3번 2번", 3) == [2, 1]           # 등장 순서
+    assert parse_ordinals("마지막 거", 3) == [2]
+    assert parse_ordinals("2번이랑 두 번째", 3) == [1]       # 중복 제거
+    assert parse_ordinals("5번", 3) == []                   # 범위 밖
+    assert parse_ordinals("해운대로 2번길 근처", 3) == []     # 도로명 주소
+
+
+def test_parse_ordinals_teen_words():
+    """"열두 번째" 안의 "두 번째" 를 2번으로 읽지 않음"""
+    assert parse_ordinals("열두 번째", 3) == []
+    assert parse_ordinals("열두 번째", 12) == [11]
+    assert parse_ordinals("열한 번째", 12) == [10]
+    assert parse_ordinals("열 번째", 12) == [9]
+    assert parse_ordinals("열두 번째", 3) == parse_ordinals("열두번째", 3) == []
+
+
+def test_bare_numbers():
+    assert parse_ordinals("2", 3) == [1]
+    assert parse_ordinals("1,3", 3) == [0, 2]
+    assert parse_ordinals("1이랑 3으로 할게요", 3) == [0, 2]
+    assert parse_ordinals("2명이요", 3) == []               # 번호만 있는 답이 아님
+
+
+def test_bare_numbers_need_context():
+    """카테고리 없이 번호만 말하면 직전 응답에 그 목록이 보였을 때만 선택"""
+    result = resolve_selection("2", RECOMMENDATIONS, default_category="restaurant", context_text=RESTAURANT_REPLY)
+    assert _ids(result) == ["r2"]
+    assert result["category"] == "restaurant"
+
+    # 직전 응답은 지역 선택지 → 식당 2번이 아님
+    assert resolve_selection("2", RECOMMENDATIONS, default_category="restaurant", context_text=REGION_REPLY) is None
+
+    # 카테고리를 말하면 직전 응답과 상관없이 선택
+    result = resolve_selection("카페 2번", RECOMMENDATIONS, default_category="restaurant", context_text=REGION_REPLY)
+    assert _ids(result) == ["c2"]
+
+
+# ==================== 새 검색 요청 ====================
+
+def test_new_search_is_not_selection():
+    for text in ["2번 말고 다른 데", "다른 곳 보여줘", "더 추천해줘", "새로 찾아줘"]:
+        assert resolve_selection(text, RECOMMENDATIONS, default_category="restaurant") is None, text
+
+    # 후속 요청이 있으면 "말고" 가 있어도 장소를 찾음
+    result = resolve_selection("1번 말고 2번 리뷰 보여줘", RECOMMENDATIONS, default_category="restaurant")
+    assert result["action"] == "reviews"
+
+
+# ==================== 이름 ====================
+
+def test_match_names():
+    assert [p["place_id"] for p in match_names("고반식당 해운대점으로 할게", RESTAURANTS)] == ["r1"]
+    assert [p["place_id"] for p in match_names("고반식당 갈래", RESTAURANTS)] == ["r1"]       # 첫 단어
+    assert [p["place_id"] for p in match_names("모모스 메뉴 알려줘", CAFES)] == ["c1"]        # 마지막 단어
+    assert [p["place_id"] for p in match_names("웨이브온이랑 모모스", CAFES)] == ["c2", "c1"]  # 등장 순서
+    assert [p["place_id"] for p in match_names("기와집대구탕", RESTAURANTS)] == ["r3"]
+
+
+def test_match_names_ignores_shared_words():
+    """여러 장소에 있는 단어(지역명), 지점명, 카테고리 명사는 별칭으로 쓰지 않음"""
+    assert match_names("해운대 좋아", RESTAURANTS) == []
+    assert match_names("해운대점 어때", RESTAURANTS) == []
+    assert match_names("커피 마시고 싶어", CAFES) == []
+
+
+def test_resolve_by_name_across_categories():
+    """카테고리를 말하지 않으면 직전 목록에 없을 때 다른 목록에서도 찾음"""
+    result = resolve_selection("모모스로 할게", RECOMMENDATIONS, default_category="restaurant")
+    assert result["category"] == "cafe"
+    assert _ids(result) == ["c1"]
+
+
+# ==================== 후속 요청 ====================
+
+def test_actions():
+    result = resolve_selection("두 번째 식당 리뷰 보여줘", RECOMMENDATIONS, default_category="cafe")
+    assert (result["category"], _ids(result), result["action"]) == ("restaurant", ["r2"], "reviews")
+
+    result = resolve_selection("모모스 메뉴 뭐야", RECOMMENDATIONS, default_category="restaurant")
+    assert (result["category"], _ids(result), result["action"]) == ("cafe", ["c1"], "menu")
+
+    result = resolve_selection("첫 번째 거 영업시간", RECOMMENDATIONS, default_category="restaurant")
+    assert (_ids(result), result["action"]) == (["r1"], "details")
+
+    result = resolve_selection("3번으로 할게", RECOMMENDATIONS, default_category="restaurant")
+    assert (_ids(result), result["action"]) == (["r3"], None)
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n📊 {len(tests)}개 테스트 통과")
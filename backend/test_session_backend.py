@@ -0,0 +1,345 @@
+"""
+세션 백엔드 테스트 스크립트 (agents/session_backend.py)
+
+1. RespClient: 로컬 Redis 대역 서버(FakeRedisServer)로 RESP 요청/응답, 재연결
+2. RedisSessionBackend: 버전 충돌 / WATCH 이후 다른 워커가 저장한 경우 (EXEC → nil)
+3. SQLiteSessionBackend: 조건부 UPDATE 버전 충돌 (워커 두 개 = 백엔드 인스턴스 두 개)
+4. 직렬화: date / set 복원, JSON 으로 못 바꾸는 값은 TypeError
+5. SessionStore.peek: 다른 워커가 처리한 세션을 백엔드에서 읽되 로컬 저장소에는 넣지 않음
+
+실행: python test_session_backend.py (pytest 로도 실행 가능, Redis 서버 필요 없음)
+"""
+
+import os
+import socket
+import sys
+import tempfile
+import threading
+from datetime import date
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from agents.session_backend import (
+    RedisSessionBackend, RespClient, SQLiteSessionBackend, SessionConflictError,
+    restore_session, serialize_session,
+)
+
+
+class FakeRedisServer:
+    """테스트용 Redis 대역 서버 (AUTH/SELECT/GET/MGET/SET/DEL/WATCH/UNWATCH/MULTI/EXEC 만)"""
+
+    def __init__(self):
+        self.data = {}
+        self.key_versions = {}  # 키별 수정 횟수 (WATCH 감지용)
+        self.commands = []
+        self._lock = threading.Lock()
+        self._conns = []
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen()
+        self.port = self._server.getsockname()[1]
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def url(self, db: int = 0, password: str = "") -> str:
+        auth = f":{password}@" if password else ""
+        return f"redis://{auth}127.0.0.1:{self.port}/{db}"
+
+    def drop_connections(self) -> None:
+        """서버 쪽에서 커넥션 끊기 (재연결 테스트용)"""
+        for conn in self._conns:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+                conn.close()
+            except OSError:
+                pass
+        self._conns.clear()
+
+    def close(self) -> None:
+        self.drop_connections()
+        self._server.close()
+
+    def _accept_loop(self) -> None:
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            self._conns.append(conn)
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn: socket.socket) -> None:
+        reader = conn.makefile("rb")
+        state = {"watched": {}, "queue": None}
+        try:
+            while True:
+                line = reader.readline()
+                if not line:
+                    return
+                count = int(line[1:])
+                args = []
+                for _ in range(count):
+                    length = int(reader.readline()[1:])
+                    args.append(reader.read(length + 2)[:-2])
+                conn.sendall(self._encode(self._handle(state, args)))
+        except (OSError, ValueError):
+            return
+
+    def _handle(self, state: dict, args: list):
+        name = args[0].decode().upper()
+        keys = [arg.decode("utf-8", "replace") for arg in args[1:]]
+        with self._lock:
+            self.commands.append(name)
+            if state["queue"] is not None and name != "EXEC":
+                state["queue"].append(args)
+                return "QUEUED"
+            if name in ("AUTH", "SELECT"):
+                return "OK"
+            if name == "WATCH":
+                state["watched"].update({key: self.key_versions.get(key, 0) for key in keys})
+                return "OK"
+            if name == "UNWATCH":
+                state["watched"].clear()
+                return "OK"
+            if name == "MULTI":
+                state["queue"] = []
+                return "OK"
+            if name == "EXEC":
+                queued, state["queue"] = state["queue"], None
+                watched, state["watched"] = state["watched"], {}
+                if any(self.key_versions.get(key, 0) != version for key, version in watched.items()):
+                    return None  # 트랜잭션 취소 (nil 배열)
+                return [self._apply(cmd[0].decode().upper(), cmd) for cmd in queued]
+            return self._apply(name, args)
+
+    def _apply(self, name: str, args: list):
+        if name == "GET":
+            return self.data.get(args[1].decode())
+        if name == "MGET":
+            return [self.data.get(arg.decode()) for arg in args[1:]]
+        if name == "SET":
+            key = args[1].decode()
+            self.data[key] = args[2]
+            self.key_versions[key] = self.key_versions.get(key, 0) + 1
+            return "OK"
+        if name == "DEL":
+            removed = 0
+            for arg in args[1:]:
+                key = arg.decode()
+                if self.data.pop(key, None) is not None:
+                    removed += 1
+                    self.key_versions[key] = self.key_versions.get(key, 0) + 1
+            return removed
+        return RuntimeError(f"ERR unknown command '{name}'")
+
+    def _encode(self, value) -> bytes:
+        if value is None:
+            return b"$-1\r\n"
+        if isinstance(value, RuntimeError):
+            return b"-%s\r\n" % str(value).encode()
+        if isinstance(value, str):
+            return b"+%s\r\n" % value.encode()
+        if isinstance(value, int):
+            return b":%d\r\n" % value
+        if isinstance(value, bytes):
+            return b"$%d\r\n%s\r\n" % (len(value), value)
+        return b"*%d\r\n" % len(value) + b"".join(self._encode(item) for item in value)
+
+
+def _assert_conflict(func, expected: int, actual: int) -> None:
+    try:
+        func()
+    except SessionConflictError as e:
+        assert (e.expected, e.actual) == (expected, actual), f"충돌 버전 불일치: {e}"
+    else:
+        raise AssertionError("SessionConflictError 가 나야 함")
+
+
+# ==================== RespClient ====================
+
+def test_resp_client_commands():
+    server = FakeRedisServer()
+    try:
+        client = RespClient(server.url(db=2, password="secret"))
+        blob = b"\x00binary\r\nwith crlf\xff"
+        assert client.execute("SET", "k", blob) == "OK"
+        assert client.execute("GET", "k") == blob
+        assert client.execute("MGET", "k", "missing") == [blob, None]
+        assert client.execute("DEL", "k", "missing") == 1
+        assert client.execute("GET", "k") is None
+        assert server.commands[:2] == ["AUTH", "SELECT"]  # 접속 직후 인증 + DB 선택
+
+        try:
+            client.execute("FLUSHALL")
+        except RuntimeError as e:
+            assert "unknown command" in str(e)
+        else:
+            raise AssertionError("에러 응답은 RuntimeError 여야 함")
+        client.close()
+    finally:
+        server.close()
+
+
+def test_resp_client_reconnects():
+    server = FakeRedisServer()
+    try:
+        client = RespClient(server.url())
+        client.execute("SET", "k", "1")
+        server.drop_connections()
+        assert client.execute("GET", "k") == b"1"  # 끊긴 커넥션 → 한 번 재연결
+
+        server.drop_connections()
+        try:
+            client.execute("GET", "k", retry=False)
+        except (ConnectionError, OSError):
+            pass
+        else:
+            raise AssertionError("retry=False 면 재연결하지 않아야 함")
+        client.close()
+    finally:
+        server.close()
+
+
+# ==================== RedisSessionBackend ====================
+
+def test_redis_backend_version_conflict():
+    server = FakeRedisServer()
+    try:
+        worker_a = RedisSessionBackend(server.url())
+        worker_b = RedisSessionBackend(server.url())
+        assert worker_a.save("s1", 0, b"turn-1") == 1
+        assert worker_b.load("s1") == (1, b"turn-1")
+        assert worker_b.save("s1", 1, b"turn-2") == 2
+
+        # worker_a 는 아직 버전 1 을 들고 있음
+        _assert_conflict(lambda: worker_a.save("s1", 1, b"stale"), expected=1, actual=2)
+        assert worker_a.load("s1") == (2, b"turn-2")
+        assert "UNWATCH" in server.commands
+
+        worker_a.delete("s1")
+        assert worker_a.get_version("s1") == 0
+    finally:
+        server.close()
+
+
+def test_redis_backend_watch_conflict():
+    """WATCH 와 EXEC 사이에 다른 워커가 버전을 바꾸면 EXEC 가 nil → SessionConflictError"""
+    server = FakeRedisServer()
+    try:
+        backend = RedisSessionBackend(server.url())
+        backend.save("s1", 0, b"turn-1")
+        other = RespClient(server.url())
+
+        original_execute = backend._client.execute
+
+        def racing_execute(*args, **kwargs):
+            if args[0] == "MULTI":
+                other.execute("SET", "localy:session:s1:v", "2")
+                other.execute("SET", "localy:session:s1:d", b"other-worker")
+            return original_execute(*args, **kwargs)
+
+        backend._client.execute = racing_execute
+        _assert_conflict(lambda: backend.save("s1", 1, b"lost-update"), expected=1, actual=2)
+        backend._client.execute = original_execute
+
+        assert backend.load("s1") == (2, b"other-worker")  # 늦은 쪽 데이터는 버려짐
+        assert backend.save("s1", 2, b"turn-3") == 3         # 같은 커넥션으로 다음 저장은 정상
+        other.close()
+    finally:
+        server.close()
+
+
+# ==================== SQLiteSessionBackend ====================
+
+def test_sqlite_backend_version_conflict():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sessions.db")
+        worker_a = SQLiteSessionBackend(path)
+        worker_b = SQLiteSessionBackend(path)
+
+        assert worker_a.save("s1", 0, b"turn-1") == 1
+        _assert_conflict(lambda: worker_b.save("s1", 0, b"dup-insert"), expected=0, actual=1)
+
+        assert worker_b.load("s1") == (1, b"turn-1")
+        assert worker_b.save("s1", 1, b"turn-2") == 2
+        _assert_conflict(lambda: worker_a.save("s1", 1, b"stale"), expected=1, actual=2)
+        assert worker_a.load("s1") == (2, b"turn-2")
+
+        # 다른 스레드(= 다른 커넥션)에서도 같은 조건부 UPDATE
+        errors = []
+        thread = threading.Thread(
+            target=lambda: _assert_conflict(lambda: worker_a.save("s1", 1, b"x"), 1, 2) or errors.append(None)
+        )
+        thread.start()
+        thread.join()
+        assert errors == [None]
+
+        worker_a.delete("s1")
+        assert worker_b.get_version("s1") == 0
+
+
+def test_store_peek_reads_other_worker_sessions():
+    from agents.session_store import SessionStore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sessions.db")
+        worker_a = SessionStore(backend=SQLiteSessionBackend(path))
+        worker_b = SessionStore(backend=SQLiteSessionBackend(path))
+
+        with worker_a.turn("s1", "u1") as session:
+            session.flow_state.current_step = 6
+            session.memory.chat_memory.add_user_message("부산 가고 싶어")
+            worker_a.persist(session)
+
+        peeked = worker_b.peek("s1")
+        assert peeked is not None and peeked.flow_state.current_step == 6
+        assert peeked.version == 1
+        assert worker_b.get("s1") is None        # 조회만 하고 로컬 저장소에는 추가하지 않음
+        assert worker_b.peek("missing") is None
+
+        # 로컬 세션이 최신이면 그대로, 뒤처졌으면 백엔드 버전
+        assert worker_a.peek("s1") is worker_a.get("s1")
+        local = worker_b.get_or_create("s1")
+        assert worker_b.peek("s1").flow_state.current_step == 6 and local.version == 0
+
+
+# ==================== 직렬화 ====================
+
+def test_serialize_roundtrip():
+    from agents.session_store import Session
+
+    session = Session("s1", user_id="u1")
+    session.flow_state.collected_info["destination"] = "부산"
+    session.flow_state.collected_info["start_date"] = date(2025, 12, 13)
+    session.flow_state.visited = {"place-1", "place-2"}
+    session.memory.chat_memory.add_user_message("부산 가고 싶어")
+    session.memory.chat_memory.add_ai_message("좋다냥!")
+
+    restored = Session("s1")
+    restore_session(restored, serialize_session(session))
+    assert restored.user_id == "u1"
+    assert restored.flow_state.collected_info["destination"] == "부산"
+    assert restored.flow_state.collected_info["start_date"] == date(2025, 12, 13)
+    assert restored.flow_state.visited == {"place-1", "place-2"}
+    assert [(m.type, m.content) for m in restored.memory.chat_memory.messages] == [
+        ("human", "부산 가고 싶어"), ("ai", "좋다냥!")
+    ]
+
+
+def test_serialize_rejects_unknown_values():
+    from agents.session_store import Session
+
+    session = Session("s1")
+    session.flow_state.agent_results["restaurant_recommendations"] = object()
+    try:
+        serialize_session(session)
+    except TypeError as e:
+        assert "object" in str(e)
+    else:
+        raise AssertionError("JSON 으로 못 바꾸는 값은 문자열로 바꾸지 말고 TypeError 여야 함")
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n📊 {len(tests)}개 테스트 통과")
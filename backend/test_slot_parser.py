@@ -0,0 +1,157 @@
+"""
+슬롯 파서 / 빠른 경로 테스트 스크립트 (agents/slot_parser.py, agents/fast_path.py)
+
+1. 날짜 범위: "12월 13일부터 15일까지", 월이 바뀌는 범위, 월 없는 "25~27일", 박/일
+2. 연도 넘김: 지난 날짜는 내년, 연도를 직접 적은 지난 날짜는 신뢰도 낮음
+3. 시간: 밤/새벽 12시 = 자정, 낮 12시 = 정오, "12시" 만 있으면 애매함
+4. 예산: 1인당 / 인당, 범위는 큰 쪽
+5. 빠른 경로: 확실한 답만 처리, 질문 / 미정 / 변경 / 도메인 요청이 섞이면 Coordinator 로
+
+실행: python test_slot_parser.py (pytest 로도 실행 가능, API 키 필요 없음)
+"""
+
+import os
+import sys
+from datetime import date
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from agents.flow_state import TravelFlowState
+from agents.slot_parser import apply_slots_to_flow_state, needs_llm_fallback, parse_slots
+from agents.fast_path import try_fast_path
+
+
+TODAY = date(2025, 12, 20)  # 토요일
+
+
+def _values(text: str, today: date = TODAY) -> dict:
+    return {key: slot.value for key, slot in parse_slots(text, today).items()}
+
+
+# ==================== 날짜 범위 ====================
+
+def test_date_ranges():
+    slots = _values("12월 22일부터 24일까지")
+    assert (slots["start_date"], slots["end_date"]) == (date(2025, 12, 22), date(2025, 12, 24))
+    assert (slots["nights"], slots["days"]) == (2, 3)
+
+    slots = _values("12/22 ~ 12/23")
+    assert (slots["start_date"], slots["end_date"], slots["days"]) == (date(2025, 12, 22), date(2025, 12, 23), 2)
+
+    # 월 없는 범위 → 이번 달
+    slots = _values("25~27일")
+    assert (slots["start_date"], slots["end_date"]) == (date(2025, 12, 25), date(2025, 12, 27))
+
+    # 시작 날짜 + 박/일
+    slots = _values("12월 28일 2박 3일")
+    assert (slots["start_date"], slots["end_date"], slots["nights"]) == (date(2025, 12, 28), date(2025, 12, 30), 2)
+
+    # "3일 동안" 은 날짜가 아니라 기간
+    slots = _values("3일 동안")
+    assert "start_date" not in slots and (slots["nights"], slots["days"]) == (2, 3)
+
+
+def test_year_rollover():
+    # 연말에 걸친 범위: 끝 날짜는 시작 날짜 기준으로 다음 해
+    slots = _values("12월 30일부터 1월 2일까지")
+    assert (slots["start_date"], slots["end_date"]) == (date(2025, 12, 30), date(2026, 1, 2))
+    assert slots["days"] == 4
+
+    # 이미 지난 날짜 → 내년
+    slots = _values("12월 13일부터 15일까지")
+    assert (slots["start_date"], slots["end_date"]) == (date(2026, 12, 13), date(2026, 12, 15))
+    slots = _values("1월 3일~5일")
+    assert slots["start_date"] == date(2026, 1, 3)
+
+    # 월 없는 범위의 날짜가 이번 달에서 지났으면 다음 달 (12월 → 다음 해 1월)
+    slots = _values("5~7일")
+    assert (slots["start_date"], slots["end_date"]) == (date(2026, 1, 5), date(2026, 1, 7))
+
+    # 연도를 직접 적었는데 지난 날짜 → 오타일 수 있어서 LLM 으로
+    text = "2025/12/13 ~ 12/15"
+    slots = parse_slots(text, TODAY)
+    assert slots["start_date"].value == date(2025, 12, 13) and slots["start_date"].confidence < 0.8
+    assert needs_llm_fallback(text, slots)
+
+
+# ==================== 시간 ====================
+
+def test_midnight_and_noon():
+    assert parse_slots("밤 12시에 출발", TODAY)["departure_time"].value == "00:00"
+    assert parse_slots("새벽 12시 30분", TODAY)["departure_time"].value == "00:30"
+    assert parse_slots("낮 12시", TODAY)["departure_time"].value == "12:00"
+    assert parse_slots("정오", TODAY)["departure_time"].value == "12:00"
+
+    # "12시" 만으로는 낮인지 밤인지 모름 → LLM 으로
+    slots = parse_slots("12시", TODAY)
+    assert slots["departure_time"].value == "12:00" and needs_llm_fallback("12시", slots)
+
+    assert parse_slots("저녁 7시 반", TODAY)["departure_time"].value == "19:30"
+    # 날짜의 숫자는 시간으로 잡지 않음
+    assert "departure_time" not in parse_slots("12월 22일부터 24일까지", TODAY)
+
+
+# ==================== 예산 ====================
+
+def test_per_person_budget():
+    for text in ["1인당 30만원", "인당 30만원 정도", "한 명당 30만원"]:
+        budget = parse_slots(text, TODAY)["budget"]
+        assert budget.value == 300000 and budget.text.startswith("1인당"), text
+        assert not needs_llm_fallback(text, parse_slots(text, TODAY)), text
+
+    flow_state = TravelFlowState()
+    assert apply_slots_to_flow_state(flow_state, parse_slots("1인당 30만원", TODAY), "1인당 30만원") == ["budget"]
+    assert flow_state.collected_info["budget"] == "1인당 30만원"
+
+    # 1인당 이 없으면 총액, 범위는 큰 쪽
+    assert parse_slots("예산 30~50만원", TODAY)["budget"].value == 500000
+    assert not parse_slots("50만원", TODAY)["budget"].text.startswith("1인당")
+    # "2인실" / "1인당" 의 숫자는 인원이 아님
+    assert "people_count" not in parse_slots("1인당 30만원", TODAY)
+
+
+# ==================== 빠른 경로 ====================
+
+BUDGET_QUESTION = "좋다냥! 예산은 얼마나 있냥? 💰"
+
+
+def test_fast_path_fills_clear_answers():
+    flow_state = TravelFlowState()
+    result = try_fast_path(flow_state, "1인당 30만원", BUDGET_QUESTION)
+    assert result["slot"] == "budget"
+    assert flow_state.collected_info["budget"] == "1인당 30만원"
+    assert flow_state.current_step == TravelFlowState.STEP_PEOPLE
+
+    flow_state = TravelFlowState()
+    result = try_fast_path(flow_state, "서울역에서 출발할게", "어디서 출발할 거냥? 📍")
+    assert result["slot"] == "departure_location" and flow_state.departure_location == "서울역"
+
+
+def test_fast_path_escape_words():
+    """질문 / 미정 / 변경 / 도메인 요청이 섞이면 FlowState 를 건드리지 않고 Coordinator 로"""
+    for text in [
+        "50만원? 너무 많나",          # 물음표
+        "얼마가 적당해? 추천해줘",
+        "아직 몰라",
+        "미정이야",
+        "예산은 상관없어",
+        "50만원 말고 30만원",
+        "예산 변경할래",
+        "50만원 정도, 맛집도 알려줘",  # 도메인 요청
+        "50만원이고 숙소는 호텔",
+    ]:
+        flow_state = TravelFlowState()
+        assert try_fast_path(flow_state, text, BUDGET_QUESTION) is None, text
+        assert flow_state.collected_info["budget"] is None, text
+
+    # 장소처럼 보이지 않는 짧은 말은 출발지로 저장하지 않음
+    flow_state = TravelFlowState()
+    assert try_fast_path(flow_state, "배고파", "어디서 출발할 거냥? 📍") is None
+    assert flow_state.departure_location is None
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n📊 {len(tests)}개 테스트 통과")